@@ -0,0 +1,8 @@
+"""
+Benchmark suite for the binder model, persistence and rendering hot paths.
+
+    python -m benchmarks run                      # core benchmarks, 1k / 10k / 100k cards
+    python -m benchmarks run --render             # + TCGApp rendering under Xvfb
+    python -m benchmarks run --network            # + set loads / images via the local TCGDex stand-in
+    python -m benchmarks compare OLD.json NEW.json
+"""
@@ -0,0 +1,45 @@
+import sys, argparse
+
+from . import harness
+
+def main(argv=None):
+    p = argparse.ArgumentParser(prog="benchmarks", description="PokeBinder benchmark suite.")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    sp = sub.add_parser("run", help="Run the benchmarks and save the results")
+    sp.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated card counts (default: %(default)s)")
+    sp.add_argument("--binders", type=int, default=25, help="Binders per synthetic user (default: %(default)s)")
+    sp.add_argument("--repeat", type=int, default=5, help="Timed rounds per case (default: %(default)s)")
+    sp.add_argument("--render", action="store_true", help="Also run the TCGApp render benchmarks (needs Tk; starts Xvfb if there is no display)")
+    sp.add_argument("--render-only", action="store_true", help="Skip the core benchmarks")
+    sp.add_argument("--network", action="store_true", help="Also time set loads / search / images against the local TCGDex stand-in")
+    sp.add_argument("--label", help="Name for the results file (default: git revision)")
+    sp.add_argument("--out", help="Results path (default: benchmarks/results/<label>-<time>.json)")
+
+    sp = sub.add_parser("compare", help="Compare two results files")
+    sp.add_argument("old"); sp.add_argument("new")
+    sp.add_argument("--threshold", type=float, default=harness.REGRESSION_THRESHOLD, help="Relative slowdown flagged as a regression (default: %(default)s)")
+    sp.add_argument("--fail", action="store_true", help="Exit with status 1 if anything regressed")
+
+    args = p.parse_args(argv)
+    if args.command == "compare":
+        regressions = harness.compare(args.old, args.new, args.threshold)
+        return 1 if regressions and args.fail else 0
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    suite = harness.Suite(args.repeat)
+    if not args.render_only:
+        from . import core
+        core.run(suite, sizes, args.binders)
+    if args.render or args.render_only:
+        from . import render
+        try: render.run(suite, sizes, args.binders)
+        except RuntimeError as e: print(f"[render] skipped: {e}", file=sys.stderr)
+    if args.network:
+        from . import network
+        network.run(suite)
+    print(f"Results saved to {harness.save_results(suite.results, args.label, args.out)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Model / persistence hot paths, timed headlessly through the pokebinder core:
+
+    load_all_data / save_all_data   -> storage.load_data / save_data (whole profile)
+    apply_binder_filter             -> filter_cards + filtered Binder view (Main Binder)
+    sort_binder_by_number / _name   -> sorted set_cards (Main Binder, save excluded)
+    update_progress                 -> Collection.owned_in_set
+    locator_rebuild / locate        -> CardLocator over every binder
+    locator_update/move             -> re-index the two slots of one move (what a commit does)
+    report                          -> Collection.report
+"""
+import os, tempfile
+
+from pokebinder import storage
+from pokebinder.collection import Collection
+from pokebinder.model import Binder, filter_cards, name_sort_key, number_sort_key
+
+from . import synth
+
+MAIN = "Main Binder"
+
+def run(suite, sizes, n_binders=25):
+    with tempfile.TemporaryDirectory(prefix="pokebinder-bench-") as tmp:
+        for n in sizes:
+            print(f"[core] {n:,} cards over {n_binders} binders", flush=True)
+            data, sets = synth.make_data(n, n_binders)
+            path = os.path.join(tmp, f"bench_{n}.json")
+            coll = Collection(path, data); coll.ensure_user(); coll.login(coll.user)
+            main = coll.binder(MAIN)
+            m = len(main)
+
+            suite.measure("save_all_data", n, lambda: storage.save_data(data, path))
+            suite.measure("load_all_data", n, lambda: storage.load_data(path))
+
+            suite.measure("apply_binder_filter/name", m, lambda: Binder(enumerate(filter_cards(main, "char"))))
+            suite.measure("apply_binder_filter/number", m, lambda: Binder(enumerate(filter_cards(main, "#25"))))
+
+            # Sorting an already sorted binder is much cheaper, so every round starts from the synthetic order
+            fresh = lambda: Binder(main.slots, main.per_page)
+            suite.measure("sort_binder_by_number", m, lambda b: b.set_cards(sorted(b, key=number_sort_key)), setup=fresh)
+            suite.measure("sort_binder", m, lambda b: b.set_cards(sorted(b, key=name_sort_key)), setup=fresh)
+
+            set_name = sets[0][1]
+            suite.measure("update_progress", m, lambda: coll.owned_in_set(MAIN, set_name))
+
+            suite.measure("locator_rebuild", n, lambda: coll.locator.rebuild(coll.user_data["binders"]))
+            def move():
+                main.swap(0, main.extent); coll.locator.update_slots(MAIN, main, main.take_changes())
+            suite.measure("locator_update/move", n, move, items=1)
+            suite.measure("locate", n, lambda: coll.locator.lookup("pikachu ex"), items=1)
+            suite.measure("report", n, coll.report)
@@ -0,0 +1,98 @@
+"""
+Timing / memory measurement and result files.
+
+Each case is timed `repeat` times without tracing, then run once more under
+tracemalloc for its peak allocation, so tracing overhead never leaks into
+the timings.
+"""
+import os, sys, json, time, platform, statistics, subprocess, tracemalloc
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+REGRESSION_THRESHOLD = 0.10 # Flag cases that got >10% slower
+
+class Suite:
+    def __init__(self, repeat=5):
+        self.repeat = repeat
+        self.results = []
+
+    def measure(self, name, size, fn, setup=None, items=None):
+        """
+        Times fn() (after setup() each round, untimed) and records median/min
+        seconds, items per second and peak traced KiB.
+        """
+        times = []
+        for _ in range(self.repeat):
+            arg = setup() if setup else None
+            t0 = time.perf_counter()
+            fn(arg) if setup else fn()
+            times.append(time.perf_counter() - t0)
+
+        arg = setup() if setup else None
+        tracemalloc.start()
+        try: fn(arg) if setup else fn()
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        median = statistics.median(times)
+        row = {
+            "case": name, "size": size,
+            "median_s": median, "min_s": min(times),
+            "per_s": (items or size) / median if median else None,
+            "peak_kib": peak / 1024,
+        }
+        self.results.append(row)
+        print(f"  {name:<28} n={size:<7} {median * 1000:10.2f} ms  {row['per_s'] or 0:14,.0f}/s  {row['peak_kib']:10,.0f} KiB", flush=True)
+        return row
+
+    def record(self, name, size, seconds, **extra):
+        """Adds an externally timed measurement (e.g. render settle time)."""
+        row = {"case": name, "size": size, "median_s": seconds, "min_s": seconds, "per_s": None, "peak_kib": None, **extra}
+        self.results.append(row)
+        print(f"  {name:<28} n={size:<7} {seconds * 1000:10.2f} ms", flush=True)
+        return row
+
+def git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+                             cwd=os.path.dirname(RESULTS_DIR))
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+def save_results(results, label=None, path=None):
+    label = label or git_revision() or "local"
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{label}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    doc = {
+        "label": label,
+        "revision": git_revision(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w") as f: json.dump(doc, f, indent=2)
+    return path
+
+def load_results(path):
+    with open(path) as f: return json.load(f)
+
+def compare(old_path, new_path, threshold=REGRESSION_THRESHOLD):
+    """Prints per-case median ratios new/old. Returns the number of regressions."""
+    old, new = load_results(old_path), load_results(new_path)
+    before = {(r["case"], r["size"]): r for r in old["results"]}
+    print(f"{old['label']} -> {new['label']}")
+    regressions = 0
+    for r in new["results"]:
+        o = before.get((r["case"], r["size"]))
+        if not o or not o["median_s"]:
+            print(f"  {r['case']:<28} n={r['size']:<7} (new)")
+            continue
+        ratio = r["median_s"] / o["median_s"]
+        flag = ""
+        if ratio > 1 + threshold: flag = "  REGRESSION"; regressions += 1
+        elif ratio < 1 - threshold: flag = "  faster"
+        print(f"  {r['case']:<28} n={r['size']:<7} {o['median_s'] * 1000:10.2f} -> {r['median_s'] * 1000:10.2f} ms  x{ratio:5.2f}{flag}")
+    return regressions
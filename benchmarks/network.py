@@ -0,0 +1,80 @@
+"""
+Set loads, card search and the image pipeline against the local TCGDex
+stand-in (pokebinder.standin) under a few network profiles. Serves a
+synthetic recording, so it runs on machines without internet access.
+
+    set_load        list_sets + find_set + load_set
+    card_search     search_cards (set-name cache reset each round)
+    search_first    stream_search_cards until the first page of results is in
+    multi_set_load  load_sets of every synthetic set at once
+    image_page      one 3x3 page of images: download + decode + resize, a thread per slot like render_side
+"""
+import io, tempfile, threading
+
+from pokebinder import catalog, standin
+
+PROFILES = {
+    "local": {},
+    "wan": {"latency": 0.06, "jitter": 0.04},
+    "slow": {"latency": 0.03, "slow_rate": 1.0, "slow_bps": 256 * 1024},
+    "flaky": {"latency": 0.03, "error_rate": 0.1},
+}
+PAGE = 9
+
+def image_pipeline(card):
+    from PIL import Image
+    try:
+        content = catalog.fetch_image(card['image'])
+        Image.open(io.BytesIO(content)).resize((220, 308), Image.Resampling.LANCZOS)
+        return True
+    except Exception: return False
+
+def load_page(cards):
+    results = [False] * len(cards)
+    def work(i, card): results[i] = image_pipeline(card)
+    threads = [threading.Thread(target=work, args=(i, c)) for i, c in enumerate(cards)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    return results
+
+def run(suite, profiles=None):
+    saved = catalog.API_BASE, catalog.ASSETS_BASE
+    with tempfile.TemporaryDirectory(prefix="pokebinder-standin-") as root:
+        sets = standin.synth(root, n_sets=4, cards_per_set=180)
+        target = sets[-1]['name']
+        for name in profiles or PROFILES:
+            print(f"[network] profile {name}", flush=True)
+            with standin.StandIn(root, seed=0, **PROFILES[name]) as server:
+                catalog.set_base_urls(server.api_base, server.assets_base)
+                _, cards = catalog.load_set(sets[-1]['id'], target)
+                failures = []
+
+                def set_load():
+                    try: catalog.load_set(catalog.find_set(target, catalog.list_sets())['id'], target)
+                    except Exception: failures.append("set_load")
+
+                def card_search():
+                    catalog._set_names = None
+                    try: catalog.search_cards("Pikachu")
+                    except Exception: failures.append("card_search")
+
+                names = {s['id']: s['name'] for s in sets}
+                def search_first():
+                    stream = catalog.stream_search_cards("Pikachu", names)
+                    try:
+                        for _ in zip(range(PAGE), stream): pass
+                    except Exception: failures.append("search_first")
+                    finally: stream.close()
+
+                pages = iter(range(0, len(cards), PAGE))
+                def image_page():
+                    start = next(pages, 0)
+                    failures.extend("image" for ok in load_page(cards[start:start + PAGE]) if not ok)
+
+                suite.measure(f"set_load/{name}", len(cards), set_load, items=1)
+                suite.measure(f"card_search/{name}", 1, card_search)
+                suite.measure(f"search_first/{name}", PAGE, search_first)
+                suite.measure(f"multi_set_load/{name}", len(sets), lambda: catalog.load_sets(sets), items=len(sets))
+                row = suite.measure(f"image_page/{name}", PAGE, image_page)
+                row["failures"] = len(failures); row["requests"] = server.stats["requests"]
+    catalog.set_base_urls(*saved)
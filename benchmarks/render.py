@@ -0,0 +1,169 @@
+"""
+Render benchmarks: the real TCGApp under a virtual X display.
+
+Runs in a scratch directory holding a synthetic tcg_data.json and a
+card_cache pre-filled with generated JPEGs for every card on the pages that
+get rendered, so get_cached_image never goes to the network (the synthetic
+image URLs point at a closed local port anyway).
+
+Measured per size:
+    startup/first_paint     python tcgapp.py --measure-startup, cold process
+    startup/interactive     ... until the UI is built and rendered
+    app_init                TCGApp() until the deferred startup finished (in-process)
+
+Measured per layout:
+    render_side             refresh_view("binder") until every slot is built and laid out
+    render_side+images      ... until every slot shows its image
+    apply_binder_filter     filter + re-render of the binder pane
+    update_progress         progress recompute for a loaded set
+"""
+import os, sys, json, time, zlib, shutil, statistics, subprocess, tempfile
+
+from pokebinder import logconfig, storage
+
+from . import synth, core
+
+PAGES = 5 # binder pages rendered per layout
+LAYOUTS = [(3, 3), (5, 5)]
+SETTLE_TIMEOUT = 20
+STARTUP_RUNS = 3
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def start_virtual_display():
+    """Starts Xvfb if there is no display. Returns the process (None if a display already exists)."""
+    if os.environ.get("DISPLAY"): return None
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        raise RuntimeError("No DISPLAY and Xvfb is not installed (apt install xvfb, or run under xvfb-run).")
+    for num in range(99, 140):
+        if os.path.exists(f"/tmp/.X11-unix/X{num}") or os.path.exists(f"/tmp/.X{num}-lock"): continue
+        proc = subprocess.Popen([xvfb, f":{num}", "-screen", "0", "1600x900x24", "-nolisten", "tcp"],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for _ in range(50):
+            if os.path.exists(f"/tmp/.X11-unix/X{num}"):
+                os.environ["DISPLAY"] = f":{num}"
+                return proc
+            if proc.poll() is not None: break
+            time.sleep(0.1)
+        proc.kill()
+    raise RuntimeError("Could not start Xvfb")
+
+def write_images(cards, cache_dir):
+    """Generated 245x342 JPEGs (the TCGDex low.jpg size), one per card id."""
+    from PIL import Image
+    os.makedirs(cache_dir, exist_ok=True)
+    for card in cards:
+        p = os.path.join(cache_dir, f"{card['id']}.jpg")
+        if os.path.exists(p): continue
+        h = zlib.crc32(card['id'].encode())
+        Image.new("RGB", (245, 342), (h & 255, (h >> 8) & 255, (h >> 16) & 255)).save(p, quality=85)
+
+def pending_images(widget):
+    """Slots still showing the "..." placeholder."""
+    count = 0
+    for child in widget.winfo_children():
+        try:
+            if child.winfo_class() == "Label" and child.cget("text") == "...": count += 1
+        except Exception: pass
+        count += pending_images(child)
+    return count
+
+def built(app, root, timeout=SETTLE_TIMEOUT):
+    """Runs the event loop until the render scheduler has built every slot."""
+    end = time.perf_counter() + timeout
+    while app.rendering() and time.perf_counter() < end:
+        root.update()
+    root.update_idletasks()
+
+def settle(app, root, grid, timeout=SETTLE_TIMEOUT):
+    built(app, root, timeout)
+    end = time.perf_counter() + timeout
+    while pending_images(grid) and time.perf_counter() < end:
+        root.update(); time.sleep(0.002)
+    root.update()
+
+def measure_startup(suite, n, runs=STARTUP_RUNS):
+    """Cold starts of the real entry point in the current (scratch) directory."""
+    marks = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, os.path.join(REPO_ROOT, "tcgapp.py"), "--measure-startup"],
+                             capture_output=True, text=True, timeout=120, env={**os.environ, "TCG_LOG": "WARNING"})
+        line = next((l for l in reversed(out.stdout.splitlines()) if l.startswith("{")), None)
+        if line: marks.append(json.loads(line))
+    for name in ("first_paint", "data_loaded", "interactive"):
+        values = [m[name] for m in marks if name in m]
+        if values: suite.record(f"startup/{name}", n, statistics.median(values) / 1000, runs=len(values))
+
+def run(suite, sizes, n_binders=25):
+    display = start_virtual_display()
+    cwd = os.getcwd()
+    tmp = tempfile.mkdtemp(prefix="pokebinder-render-")
+    try:
+        os.chdir(tmp)
+        import tkinter as tk
+        sys.argv = sys.argv[:1] # tcgapp looks at sys.argv for --cli / --self-test
+        if REPO_ROOT not in sys.path: sys.path.insert(0, REPO_ROOT)
+        # Same pipeline and levels as the app, minus the console (tcgapp's own setup() is then a no-op)
+        logconfig.setup("tcg_debug.log", console=False)
+        import tcgapp
+
+        class BenchApp(tcgapp.TCGApp):
+            def switch_user(self): pass # no login dialog; the benchmark logs in directly
+
+        for n in sizes:
+            print(f"[render] {n:,} cards", flush=True)
+            data, sets = synth.make_data(n, n_binders)
+            user = next(iter(data))
+            main = data[user]["binders"][core.MAIN]
+            max_per_page = max(r * c for r, c in LAYOUTS)
+            write_images([c for idx, c in main.items() if idx < PAGES * max_per_page], tcgapp.CACHE_DIR)
+            storage.save_data(data, storage.SAVE_FILE)
+            measure_startup(suite, n)
+
+            root = tk.Tk()
+            t0 = time.perf_counter()
+            app = BenchApp(root)
+            while not app.ready: root.update(); time.sleep(0.002)
+            root.update()
+            suite.record("app_init", n, time.perf_counter() - t0)
+
+            app.authenticated = True; app.current_user = user
+            app.current_binder_name = core.MAIN
+            app.collection.login(user)
+            app.refresh_current_binder_lists()
+            grid = app.left_pane['grid']
+
+            for rows, cols in LAYOUTS:
+                app.collection.set_layout(core.MAIN, rows, cols, len(main) // (rows * cols) + 1)
+                app.refresh_current_binder_lists()
+                laid_out, shown = [], []
+                for page in range(1, PAGES + 1):
+                    app.binder_page = page
+                    t0 = time.perf_counter()
+                    app.refresh_view(target="binder"); built(app, root)
+                    laid_out.append(time.perf_counter() - t0)
+                    settle(app, root, grid)
+                    shown.append(time.perf_counter() - t0)
+                label = f"{rows}x{cols}"
+                suite.record(f"render_side/{label}", n, statistics.median(laid_out), pages=PAGES)
+                suite.record(f"render_side+images/{label}", n, statistics.median(shown), pages=PAGES)
+
+                app.binder_page = 1
+                app.binder_filter_var.set("char")
+                root.after_cancel(app._binder_filter_timer)
+                t0 = time.perf_counter()
+                app.apply_binder_filter(reset_page=True); built(app, root)
+                suite.record(f"apply_binder_filter/{label}", n, time.perf_counter() - t0)
+                app.binder_filter_var.set("")
+                root.after_cancel(app._binder_filter_timer)
+                app.apply_binder_filter(reset_page=True); settle(app, root, grid)
+
+            app.current_set_name = sets[0][1]
+            app.full_set_data = [c for c in main if c['set_name'] == app.current_set_name]
+            suite.measure("update_progress/app", len(main), app.update_progress)
+
+            root.destroy()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(tmp, ignore_errors=True)
+        if display: display.terminate()
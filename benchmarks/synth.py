@@ -0,0 +1,67 @@
+"""
+Deterministic synthetic collections for the benchmarks.
+
+Half of the cards go into "Main Binder" (per-binder operations like sort and
+filter are timed on it), the rest are spread over the other binders. About
+one slot in ten is left empty so binders have realistic gaps.
+"""
+import random
+
+from pokebinder import storage
+from pokebinder.model import Binder
+
+# Image URLs point at a closed local port: a cache miss fails fast instead of touching the network
+IMAGE_BASE = "http://127.0.0.1:9/en"
+
+NAMES = ["Pikachu", "Charizard", "Bulbasaur", "Squirtle", "Eevee", "Mewtwo", "Gengar", "Snorlax",
+         "Lucario", "Gardevoir", "Greninja", "Rayquaza", "Umbreon", "Sylveon", "Dragonite", "Gyarados",
+         "Magikarp", "Jigglypuff", "Psyduck", "Machamp", "Alakazam", "Arcanine", "Lapras", "Ditto"]
+SUFFIXES = ["", "", "", " ex", " V", " VMAX", " GX", " Radiant"]
+
+def make_sets(count=120, rng=None):
+    rng = rng or random.Random(0)
+    return [(f"bs{i:03d}", f"Bench Set {i}", rng.randint(60, 260)) for i in range(count)]
+
+def make_card(rng, sets, serial):
+    set_id, set_name, size = rng.choice(sets)
+    num = rng.randint(1, size)
+    return {
+        'id': f"{set_id}-{num:03d}",
+        'name': rng.choice(NAMES) + rng.choice(SUFFIXES),
+        'image': f"{IMAGE_BASE}/{set_id}/{num:03d}/low.jpg",
+        'set_name': set_name,
+        'set_id': set_id,
+        'card_number': str(num),
+        'uid': f"{serial:012x}",
+    }
+
+def make_binder(rng, cards, per_page=9):
+    binder, idx = Binder(per_page=per_page), 0
+    for card in cards:
+        if rng.random() < 0.1: idx += 1 # leave a gap
+        binder.place(idx, card); idx += 1
+    return binder
+
+def make_user_data(n_cards, n_binders=25, seed=0, pw="1234"):
+    """User profile dict (as storage.load_data returns it) holding n_cards over n_binders."""
+    rng = random.Random(seed)
+    sets = make_sets(rng=rng)
+    cards = [make_card(rng, sets, i) for i in range(n_cards)]
+
+    main, rest = cards[:n_cards // 2], cards[n_cards // 2:]
+    names = ["Main Binder"] + [f"Binder {i}" for i in range(1, n_binders)]
+    chunks = [main] + [rest[i::n_binders - 1] for i in range(n_binders - 1)] if n_binders > 1 else [cards]
+
+    user = storage.new_user_data(pw)
+    user["binders"] = {}; user["order"] = []; user["binder_layouts"] = {}
+    for name, chunk in zip(names, chunks):
+        layout = dict(storage.DEFAULT_LAYOUT)
+        # Size the binder so most cards fit and a few spill into overflow
+        layout["pages"] = max(1, int(len(chunk) * 1.05) // 9)
+        user["binders"][name] = make_binder(rng, chunk)
+        user["order"].append(name); user["binder_layouts"][name] = layout
+    return user, sets
+
+def make_data(n_cards, n_binders=25, seed=0, user="BenchUser"):
+    user_data, sets = make_user_data(n_cards, n_binders, seed)
+    return {user: user_data}, sets
@@ -0,0 +1,11 @@
+"""
+PokeBinder headless core: collection model, binder operations, catalog
+access and storage. The Tk app (tcgapp.py) and the command line both sit
+on top of this package.
+"""
+from .model import Binder, CardLocator, card_number_of, normalize_card_number, filter_cards
+from .collection import Collection
+from .catalog import CatalogResolver
+
+__all__ = ["Binder", "CardLocator", "Collection", "CatalogResolver",
+           "card_number_of", "normalize_card_number", "filter_cards"]
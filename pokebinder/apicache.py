@@ -0,0 +1,214 @@
+"""
+Persistent cache for TCGDex API responses (set lists, sets, searches).
+
+Each response is one JSON file named after a hash of its URL; files older
+than the TTL are refetched and the least recently used are evicted past
+max_entries (file mtime marks use, as with the card image cache). A small
+in-memory LRU sits in front so repeats skip the disk too.
+
+Identical requests that are in flight at the same time share one fetch:
+the first caller does the request and later ones wait on its future. If a
+refetch fails, a stale copy is served rather than nothing.
+
+    cache = ResponseCache("api_cache")
+    catalog.search_cards("pikachu", fetch_json=cache.fetch_json)
+
+stream_json does the same for array responses but yields the elements
+while they download (see catalog.stream_search_cards). SetNames keeps the
+set id -> name map searches are labelled with.
+"""
+import os, json, time, hashlib, logging, threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from . import catalog, perf
+
+logger = logging.getLogger(__name__)
+
+class ResponseCache:
+    def __init__(self, cache_dir, ttl=24 * 3600, max_entries=256, max_memory=32, fetch=None, stream=None):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.fetch = fetch or catalog.fetch_json_url
+        self.stream = stream or catalog.stream_json_url
+        self._memory = OrderedDict() # url -> (fetched, body)
+        self._inflight = {}          # url -> Future
+        self._lock = threading.Lock()
+
+    def path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode()).hexdigest() + ".json")
+
+    def _remember(self, url, entry):
+        with self._lock:
+            self._memory[url] = entry; self._memory.move_to_end(url)
+            while len(self._memory) > self.max_memory: self._memory.popitem(last=False)
+
+    def lookup(self, url):
+        """(fetched, body) from memory or disk, fresh or not. None if never cached."""
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry is not None: self._memory.move_to_end(url); return entry
+        p = self.path(url)
+        try:
+            with open(p, "r") as f: saved = json.load(f)
+            os.utime(p, None) # mark as recently used
+        except FileNotFoundError: return None
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cached response {p}: {e}"); return None
+        entry = (saved["fetched"], saved["body"])
+        self._remember(url, entry)
+        return entry
+
+    def store(self, url, body):
+        entry = (time.time(), body)
+        self._remember(url, entry)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            p = self.path(url); tmp = p + ".tmp"
+            with open(tmp, "w") as f: json.dump({"url": url, "fetched": entry[0], "body": body}, f)
+            os.replace(tmp, p)
+            self.evict()
+        except Exception as e:
+            logger.error(f"Failed to cache response for {url}: {e}")
+
+    def evict(self):
+        """Deletes the least recently used responses past max_entries."""
+        files = [os.path.join(self.cache_dir, f) for f in os.listdir(self.cache_dir) if f.endswith(".json")]
+        if len(files) <= self.max_entries: return
+        files.sort(key=os.path.getmtime)
+        for f in files[:-self.max_entries]:
+            try: os.remove(f)
+            except OSError: pass
+
+    def fetch_json(self, url, ttl=None):
+        """Drop-in for catalog.fetch_json_url: cached when fresh, coalesced with identical requests in flight."""
+        ttl = self.ttl if ttl is None else ttl
+        entry = self.lookup(url)
+        fresh = entry is not None and time.time() - entry[0] < ttl
+        perf.hit("api.cache", fresh)
+        if fresh: return entry[1]
+
+        with self._lock:
+            future = self._inflight.get(url)
+            owner = future is None
+            if owner: future = self._inflight[url] = Future()
+        if not owner:
+            perf.count("api.coalesced")
+            return future.result()
+
+        try:
+            body = self.fetch(url)
+            self.store(url, body)
+            future.set_result(body)
+        except Exception as e:
+            if entry is None:
+                future.set_exception(e); raise
+            logger.warning(f"Refetch failed, serving stale response for {url}: {e}")
+            future.set_result(entry[1])
+        finally:
+            with self._lock: self._inflight.pop(url, None)
+        return future.result()
+
+    def stream_json(self, url, ttl=None):
+        """
+        fetch_json for array responses as a generator: on a miss the elements
+        are yielded as they arrive and the whole array is stored once complete.
+        Callers waiting on the same URL get it in one piece when it is done.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        entry = self.lookup(url)
+        fresh = entry is not None and time.time() - entry[0] < ttl
+        perf.hit("api.cache", fresh)
+        if fresh:
+            yield from entry[1]; return
+
+        with self._lock:
+            future = self._inflight.get(url)
+            owner = future is None
+            if owner: future = self._inflight[url] = Future()
+        if not owner:
+            perf.count("api.coalesced")
+            yield from future.result(); return
+
+        items = []
+        try:
+            for item in self.stream(url):
+                items.append(item); yield item
+            self.store(url, items)
+            future.set_result(items)
+        except Exception as e:
+            if entry is None or items:
+                future.set_exception(e); raise
+            logger.warning(f"Refetch failed, serving stale response for {url}: {e}")
+            future.set_result(entry[1])
+            yield from entry[1]
+        finally:
+            with self._lock: self._inflight.pop(url, None)
+            # Abandoned part way (the generator was closed): release the waiters
+            if not future.done(): future.set_exception(ConnectionError(f"Stream of {url} was abandoned"))
+
+    def clear(self):
+        with self._lock: self._memory.clear()
+        if not os.path.isdir(self.cache_dir): return
+        for f in os.listdir(self.cache_dir):
+            try: os.remove(os.path.join(self.cache_dir, f))
+            except OSError: pass
+
+class SetNames:
+    """
+    Persistent set id -> set name map for labelling search results (the
+    search endpoint returns bare card ids). Kept on disk so a search never
+    waits on the full set list; the list is refetched when an unknown set
+    id shows up (once per session) or by warm() when the file is old.
+    Passes for the `names` mapping of catalog.search_cards.
+    """
+    def __init__(self, path, fetch_json=None, max_age=7 * 24 * 3600):
+        self.path = path
+        self.fetch_json = fetch_json or catalog.fetch_json_url
+        self.max_age = max_age
+        self._names = None
+        self._refreshed = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._names is not None: return
+        try:
+            with open(self.path, "r") as f: self._names = json.load(f)
+        except FileNotFoundError: self._names = {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable set name cache: {e}"); self._names = {}
+
+    def refresh(self, once=False):
+        """Refetches the set list and saves it (once=True: unless already done this session). Returns how many sets are known."""
+        with self._lock:
+            self._load()
+            if once and self._refreshed: return len(self._names)
+            try: names = {s['id']: s['name'] for s in catalog.list_sets(self.fetch_json)}
+            except Exception as e:
+                logger.error(f"Failed to refresh set names: {e}"); return len(self._names)
+            finally: self._refreshed = True
+            self._names = {**self._names, **names}
+            tmp = self.path + ".tmp"
+            try:
+                with open(tmp, "w") as f: json.dump(self._names, f)
+                os.replace(tmp, self.path)
+            except Exception as e:
+                logger.error(f"Failed to save set names: {e}")
+            logger.debug("Set name cache refreshed (%d sets)", len(self._names))
+            return len(self._names)
+
+    def warm(self):
+        """Refreshes in advance if the file is missing or older than max_age (call off the UI thread)."""
+        try: stale = time.time() - os.path.getmtime(self.path) > self.max_age
+        except OSError: stale = True
+        if stale: self.refresh()
+
+    def get(self, set_id, default=None):
+        with self._lock: self._load(); name = self._names.get(set_id)
+        perf.hit("set_names", name is not None)
+        if name is None and not self._refreshed:
+            self.refresh(once=True)
+            with self._lock: name = self._names.get(set_id)
+        return default if name is None else name
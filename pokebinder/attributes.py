@@ -0,0 +1,210 @@
+"""
+Card attribute catalog and indexed filters.
+
+CardAttributes holds the filterable attributes TCGDex set and search
+listings leave out: rarity, types, stage, HP, illustrator, regulation mark
+and category. They are fetched per card id from /cards/{id}, many at a
+time, and kept in tcg_card_attrs.json. A printed card never changes, so
+entries never expire.
+
+AttributeIndex turns a card list plus those attributes into posting lists:
+one bitmap per value over list positions, held as a Python int. A compound
+filter is then a few ANDs however many cards there are:
+
+    rarity:secret type:fire hp>=100 -stage:basic missing pikachu
+
+- key:value matches values containing `value`, and key=value matches
+  exact values.
+- hp also takes > < >= <=.
+- `owned` and `missing` test against the current binder.
+- A leading - negates a term.
+- The remaining words are the plain name / number filter.
+"""
+import os, re, json, time, shlex, logging, threading
+
+from . import catalog, perf
+from .model import filter_cards
+
+logger = logging.getLogger(__name__)
+
+CARD_ATTRS_FILE = "tcg_card_attrs.json"
+RATE_LIMIT = 20 # /cards/{id} requests per second at most
+ATTR_FIELDS = ("rarity", "types", "stage", "hp", "illustrator", "regulation", "category")
+# Query key -> indexed field ("set" is the card's own set_name)
+FIELDS = {"rarity": "rarity", "type": "types", "types": "types", "stage": "stage", "hp": "hp",
+          "illustrator": "illustrator", "artist": "illustrator", "regulation": "regulation", "reg": "regulation",
+          "category": "category", "set": "set_name"}
+FLAGS = ("owned", "missing")
+TERM = re.compile(r"(-?)([a-z]+)(>=|<=|[:=<>])(.+)")
+
+# ==========================================
+# ATTRIBUTE STORE
+# ==========================================
+class CardAttributes:
+    def __init__(self, path=CARD_ATTRS_FILE, fetch_json=None, workers=catalog.LOAD_WORKERS, rate=RATE_LIMIT, save_every=250):
+        self.path = path
+        self.fetch_json = fetch_json or catalog.fetch_json_url
+        self.workers = workers
+        self.rate = rate
+        self.save_every = save_every
+        self.version = 0    # bumped whenever attributes are added (indexes built before are stale)
+        self.failed = set() # ids that could not be fetched this session; not retried
+        self._attrs = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._attrs is not None: return
+        try:
+            with open(self.path, "r") as f: self._attrs = json.load(f)
+        except FileNotFoundError: self._attrs = {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable card attribute cache: {e}"); self._attrs = {}
+
+    def get(self, card_id):
+        with self._lock: self._load(); return self._attrs.get(card_id)
+
+    def missing(self, card_ids):
+        """Ids without stored attributes (each once, in order), skipping ones that already failed."""
+        with self._lock:
+            self._load()
+            return list(dict.fromkeys(cid for cid in card_ids if cid not in self._attrs and cid not in self.failed))
+
+    def save(self):
+        with self._lock: snapshot = dict(self._attrs or {})
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "w") as f: json.dump(snapshot, f)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.error(f"Failed to save card attributes: {e}")
+
+    def enrich(self, card_ids, progress=None, cancel=None):
+        """
+        Fetches attributes for every id not stored yet, in order, at most
+        `workers` requests in flight and `rate` started per second, saving as
+        it goes. progress(done, total) follows each card. Setting the `cancel`
+        Event stops it after the requests in flight. Returns how many were
+        added. Call off the UI thread.
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+        todo = self.missing(card_ids)
+        if not todo: return 0
+        logger.info(f"Fetching attributes for {len(todo)} cards")
+        cancel = cancel or threading.Event()
+        interval = 1 / self.rate if self.rate else 0
+        pending, inflight = iter(todo), {}
+        done = added = 0
+        next_at = time.monotonic()
+        with perf.span("attributes.enrich"), ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(todo)))) as pool:
+            while True:
+                while len(inflight) < self.workers and not cancel.is_set():
+                    cid = next(pending, None)
+                    if cid is None: break
+                    # Pace the requests; waiting on the event lets a cancel cut the pause short
+                    if cancel.wait(max(0, next_at - time.monotonic())): break
+                    next_at = max(next_at, time.monotonic()) + interval
+                    inflight[pool.submit(catalog.card_attributes, cid, self.fetch_json)] = cid
+                if not inflight: break
+                finished, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    cid = inflight.pop(future); done += 1
+                    try:
+                        attrs = future.result()
+                        with self._lock: self._attrs[cid] = attrs; self.version += 1
+                        added += 1
+                        if added % self.save_every == 0: self.save()
+                    except Exception as e:
+                        logger.warning(f"No attributes for {cid}: {e}")
+                        with self._lock: self.failed.add(cid)
+                    if progress: progress(done, len(todo))
+        if cancel.is_set(): logger.info(f"Attribute fetch cancelled after {done}/{len(todo)} cards")
+        if added: self.save()
+        return added
+
+# ==========================================
+# POSTING-LIST INDEX
+# ==========================================
+def parse_query(query):
+    """-> ([(negated, field, op, value)], [plain words]). Unknown keys stay plain words."""
+    try: tokens = shlex.split(query.lower())
+    except ValueError: tokens = query.lower().split() # unbalanced quote
+    terms, words = [], []
+    for tok in tokens:
+        neg = tok.startswith("-")
+        if tok.lstrip("-") in FLAGS:
+            terms.append((neg, tok.lstrip("-"), "", "")); continue
+        m = TERM.fullmatch(tok)
+        if m and m.group(2) in FIELDS:
+            terms.append((bool(m.group(1)), FIELDS[m.group(2)], m.group(3), m.group(4).strip()))
+        else: words.append(tok)
+    return terms, words
+
+def is_attribute_query(query):
+    return bool(parse_query(query)[0])
+
+class AttributeIndex:
+    """Bitmaps over the positions of `cards` for every attribute value; built once per card list."""
+    def __init__(self, cards, attributes):
+        with perf.span("attr_index.build"):
+            self.cards = list(cards)
+            self.n = len(self.cards)
+            self._postings = {f: {} for f in ATTR_FIELDS + ("set_name",)} # field -> value -> [positions]
+            self._bitmaps = {}
+            known = []
+            for i, card in enumerate(self.cards):
+                self._postings["set_name"].setdefault((card.get('set_name') or "").lower(), []).append(i)
+                attrs = attributes.get(card['id'])
+                if attrs is None: continue
+                known.append(i)
+                for field in ATTR_FIELDS:
+                    values = attrs.get(field)
+                    if values is None: continue
+                    for v in (values if isinstance(values, list) else [values]):
+                        self._postings[field].setdefault(str(v).lower(), []).append(i)
+            self.all = (1 << self.n) - 1
+            self.known = self._bits(known) # cards with attributes; negated attribute terms stay inside these
+
+    def _bits(self, positions):
+        buf = bytearray((self.n + 7) // 8)
+        for i in positions: buf[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(buf, "little")
+
+    def bitmap(self, field, value):
+        key = (field, value)
+        bits = self._bitmaps.get(key)
+        if bits is None: bits = self._bitmaps[key] = self._bits(self._postings[field].get(value, ()))
+        return bits
+
+    def match(self, field, op, value):
+        """Bitmap of cards whose `field` satisfies op / value (OR over the matching values)."""
+        values = self._postings[field]
+        if field == "hp":
+            if not value.isdigit(): return 0
+            target = int(value)
+            test = {":": int.__eq__, "=": int.__eq__, ">": int.__gt__, "<": int.__lt__, ">=": int.__ge__, "<=": int.__le__}[op]
+            keys = [k for k in values if k.isdigit() and test(int(k), target)]
+        elif op == "=": keys = [value] if value in values else []
+        elif op == ":": keys = [k for k in values if value in k]
+        else: return 0 # < / > on a text field
+        bits = 0
+        for k in keys: bits |= self.bitmap(field, k)
+        return bits
+
+    def filter(self, query, owned_ids=()):
+        """Cards matching every term of a query, in list order."""
+        with perf.span("attr_filter"):
+            terms, words = parse_query(query)
+            result = self.all
+            for neg, field, op, value in terms:
+                if field in FLAGS:
+                    bits = self._bits(i for i, c in enumerate(self.cards) if c['id'] in owned_ids)
+                    if field == "missing": neg = not neg
+                    scope = self.all
+                else:
+                    bits = self.match(field, op, value)
+                    scope = self.all if field == "set_name" else self.known
+                result &= (scope & ~bits) if neg else bits
+                if not result: break
+            digits = bin(result)[:1:-1] # bit i is character i
+            hits = [self.cards[m.start()] for m in re.finditer("1", digits)]
+        return filter_cards(hits, " ".join(words)) if words else hits
@@ -0,0 +1,231 @@
+"""
+TCGDex catalog access: set lists, set contents, card search and bulk id
+resolution. Returns the plain card dicts the binders store.
+"""
+import os, json, codecs, urllib.parse, logging
+
+from . import perf
+
+logger = logging.getLogger(__name__)
+
+# Overridable so the app can run against a local stand-in (see pokebinder.standin)
+DEFAULT_API_BASE = "https://api.tcgdex.net/v2/en"
+DEFAULT_ASSETS_BASE = "https://assets.tcgdex.net"
+API_BASE = os.environ.get("TCGDEX_API_BASE", DEFAULT_API_BASE).rstrip("/")
+ASSETS_BASE = os.environ.get("TCGDEX_ASSETS_BASE", DEFAULT_ASSETS_BASE).rstrip("/")
+SERIES_PREFIX = "series:" # "series: Scarlet & Violet" in a set query means every set of that series
+LOAD_WORKERS = 10 # Set requests in flight at once when loading several sets (a whole era in one round)
+
+def set_base_urls(api_base=None, assets_base=None):
+    global API_BASE, ASSETS_BASE
+    if api_base: API_BASE = api_base.rstrip("/")
+    if assets_base: ASSETS_BASE = assets_base.rstrip("/")
+
+def endpoint_name(url):
+    """Span name for an API URL: api.sets, api.set, api.search, ..."""
+    path = url[len(API_BASE):].lstrip("/").split("?")[0] if url.startswith(API_BASE) else "other"
+    parts = path.split("/")
+    if parts[0] == "sets": return "api.sets" if len(parts) == 1 else "api.set"
+    if parts[0] == "cards": return "api.search" if len(parts) == 1 else "api.card"
+    return f"api.{parts[0] or 'other'}"
+
+def fetch_json_url(url, timeout=15):
+    import requests # Deferred: importing requests is a large share of app startup
+    with perf.inflight("api.inflight"), perf.span(endpoint_name(url)):
+        r = requests.get(url, timeout=timeout)
+        r.raise_for_status()
+        return r.json()
+
+def iter_json_array(chunks):
+    """
+    Elements of a top-level JSON array, yielded as soon as each one is
+    complete in the incoming text chunks. Anything other than an array
+    yields nothing.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, started = "", 0, False
+    for chunk in chunks:
+        buf += chunk
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,": pos += 1
+            if pos >= len(buf): break
+            if not started:
+                if buf[pos] != "[": return
+                started = True; pos += 1; continue
+            if buf[pos] == "]": return
+            try: item, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError: break # element still arriving
+            yield item
+        buf, pos = buf[pos:], 0
+    if started: raise ValueError("Truncated JSON array")
+
+def stream_json_url(url, timeout=15, chunk_size=16 * 1024):
+    """Like fetch_json_url for array responses, but yields the elements while the body is still downloading."""
+    import requests
+    with perf.inflight("api.inflight"), perf.span(endpoint_name(url)):
+        with requests.get(url, timeout=timeout, stream=True) as r:
+            r.raise_for_status()
+            decode = codecs.getincrementaldecoder("utf-8")().decode
+            yield from iter_json_array(decode(block) for block in _arriving(r, chunk_size))
+
+def _arriving(r, chunk_size):
+    """Body blocks of a streamed response as soon as any data is there (iter_content waits for a full block)."""
+    read1 = getattr(r.raw, "read1", None) # urllib3 2.x
+    if read1 is None:
+        yield from r.iter_content(1024); return
+    while True:
+        block = read1(chunk_size)
+        if not block: return
+        yield block
+
+def image_url(url):
+    """Card image URL as stored -> URL to fetch (saved cards keep the real TCGDex asset host)."""
+    if ASSETS_BASE != DEFAULT_ASSETS_BASE and url.startswith(DEFAULT_ASSETS_BASE):
+        return ASSETS_BASE + url[len(DEFAULT_ASSETS_BASE):]
+    return url
+
+def fetch_image(url, timeout=5):
+    """Raw bytes of a card image."""
+    import requests
+    with perf.span("image.download"):
+        r = requests.get(image_url(url), timeout=timeout)
+        r.raise_for_status()
+        return r.content
+
+def list_sets(fetch_json=fetch_json_url):
+    return fetch_json(f"{API_BASE}/sets")
+
+def find_set(query, sets):
+    """First set whose name contains query (case-insensitive), or None."""
+    q = query.lower()
+    return next((s for s in sets if q in s['name'].lower()), None)
+
+def load_set(set_id, set_name=None, fetch_json=fetch_json_url):
+    """Returns (set name, cards) for one set."""
+    full = fetch_json(f"{API_BASE}/sets/{urllib.parse.quote(set_id)}")
+    set_name = set_name or full.get('name', set_id)
+    cards = [{'id': c['id'], 'name': c['name'], 'image': f"{c['image']}/low.jpg", 'set_name': set_name, 'set_id': set_id}
+             for c in full.get('cards', []) if c.get('image')]
+    return set_name, cards
+
+def card_attributes(card_id, fetch_json=fetch_json_url):
+    """Filterable attributes of one card, from its full TCGDex record (see pokebinder.attributes)."""
+    c = fetch_json(f"{API_BASE}/cards/{urllib.parse.quote(card_id)}")
+    return {"rarity": c.get("rarity"), "types": c.get("types") or [], "stage": c.get("stage"), "hp": c.get("hp"),
+            "illustrator": c.get("illustrator"), "regulation": c.get("regulationMark"), "category": c.get("category")}
+
+def list_series(fetch_json=fetch_json_url):
+    return fetch_json(f"{API_BASE}/series")
+
+def series_sets(series_id, fetch_json=fetch_json_url):
+    """Set briefs (id, name, ...) of one series, oldest first."""
+    return fetch_json(f"{API_BASE}/series/{urllib.parse.quote(series_id)}").get('sets', [])
+
+def resolve_sets(query, fetch_json=fetch_json_url):
+    """
+    "151, Obsidian Flames" or "series: Scarlet & Violet" (terms can be mixed)
+    -> ([set brief], [terms that matched nothing]). A set is listed once.
+    """
+    found, missing, all_sets = {}, [], None
+    for term in [t.strip() for t in query.split(",") if t.strip()]:
+        if term.lower().startswith(SERIES_PREFIX):
+            series = find_set(term[len(SERIES_PREFIX):].strip(), list_series(fetch_json)) # same name match as sets
+            matches = series_sets(series['id'], fetch_json) if series else []
+        else:
+            if all_sets is None: all_sets = list_sets(fetch_json)
+            match = find_set(term, all_sets); matches = [match] if match else []
+        if not matches: missing.append(term)
+        for m in matches: found.setdefault(m['id'], m)
+    return list(found.values()), missing
+
+def load_sets(sets, fetch_json=fetch_json_url, workers=LOAD_WORKERS, progress=None):
+    """
+    Loads several sets concurrently, at most `workers` at a time. Returns
+    [(set name, cards)] in the order given, cards None for a set that failed.
+    progress(set name, ok, done, total) is called as each one finishes.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    results = [None] * len(sets)
+    with perf.span("api.sets_batch"), ThreadPoolExecutor(max_workers=max(1, min(workers, len(sets)))) as pool:
+        futures = {pool.submit(load_set, s['id'], s['name'], fetch_json): i for i, s in enumerate(sets)}
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            try: results[i] = future.result(); ok = True
+            except Exception as e:
+                logger.error(f"Failed to load set {sets[i]['id']}: {e}")
+                results[i] = (sets[i]['name'], None); ok = False
+            if progress: progress(results[i][0], ok, done, len(sets))
+    return results
+
+_set_names = None
+
+def set_names(fetch_json=fetch_json_url):
+    """set id -> set name. Loaded once instead of one request per search result."""
+    global _set_names
+    if _set_names is None:
+        try:
+            logger.debug("Fetching global set list for caching...")
+            _set_names = {s['id']: s['name'] for s in list_sets(fetch_json)}
+        except Exception: _set_names = {}
+    return _set_names
+
+def normalize_search_result(c, names):
+    """Search hit -> card dict, or None for entries the app cannot show."""
+    # TCGDex search results usually have id, name, image (base url)
+    if not c.get('image'): return None
+    # Filter out TCG Pocket cards (identified by 'tcgp' in image path)
+    if "/tcgp/" in c['image']: return None
+
+    s_id = c.get('set', {}).get('id')
+    if not s_id and '-' in c['id']:
+        s_id = c['id'].split('-')[0]
+
+    # Use cached name if the API gave us a code/missing name
+    s_name = c.get('set', {}).get('name')
+    if s_id and (not s_name or s_name == s_id):
+        s_name = names.get(s_id, s_id)
+
+    return {'id': c['id'], 'name': c['name'], 'image': f"{c['image']}/low.jpg", 'set_name': s_name, 'set_id': s_id}
+
+def search_url(query):
+    return f"{API_BASE}/cards?name={urllib.parse.quote(query)}"
+
+def search_cards(query, fetch_json=fetch_json_url, names=None):
+    """Cards whose name matches query across all sets. names: set id -> name (fetched once if not given)."""
+    res = fetch_json(search_url(query))
+    if not res: return []
+    if names is None: names = set_names(fetch_json)
+    return [card for card in (normalize_search_result(c, names) for c in res) if card]
+
+def stream_search_cards(query, names, stream_json=stream_json_url):
+    """search_cards as a generator: cards are yielded while the response is still arriving."""
+    for c in stream_json(search_url(query)):
+        card = normalize_search_result(c, names)
+        if card: yield card
+
+class CatalogResolver:
+    """
+    Resolves card ids against TCGDex a whole set at a time: one set request
+    covers every card of that set in an import batch.
+    """
+    def __init__(self, fetch_json=None):
+        self.fetch_json = fetch_json or fetch_json_url
+        self.sets = {} # set id -> {card id: card} (None if the set lookup failed)
+
+    def _load_set(self, set_id):
+        try:
+            _, cards = load_set(set_id, fetch_json=self.fetch_json)
+            self.sets[set_id] = {c['id']: c for c in cards}
+        except Exception as e:
+            logger.error(f"Catalog lookup failed for set {set_id}: {e}")
+            self.sets[set_id] = None
+
+    def resolve(self, card_ids):
+        """Returns {card id: card} for every id that exists in the catalog."""
+        for set_id in {cid.rsplit('-', 1)[0] for cid in card_ids if '-' in cid}:
+            if set_id not in self.sets: self._load_set(set_id)
+        found = {}
+        for cid in card_ids:
+            cards = self.sets.get(cid.rsplit('-', 1)[0]) if '-' in cid else None
+            if cards and cid in cards: found[cid] = cards[cid]
+        return found
@@ -0,0 +1,89 @@
+"""
+Command line for batch work on a collection without starting the GUI.
+
+    python tcgapp.py --cli report --user Ash
+    python -m pokebinder import inventory.csv --user Ash --binder "Main Binder"
+"""
+import os, sys, json, argparse, getpass, logging
+
+from . import storage
+from .catalog import CatalogResolver
+from .collection import Collection
+
+def build_parser():
+    p = argparse.ArgumentParser(prog="pokebinder", description="Headless PokeBinder collection tools.")
+    p.add_argument("--data", default=storage.SAVE_FILE, help="Path to the data file (default: %(default)s)")
+    p.add_argument("--user", help="Profile to operate on (default: first profile)")
+    p.add_argument("--password", default=os.environ.get("TCG_PASSWORD"), help="Profile password (or TCG_PASSWORD; prompted if missing)")
+    p.add_argument("-v", "--verbose", action="store_true", help="Log progress to stderr")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    def with_binder(sp):
+        sp.add_argument("--binder", help="Binder name (default: first binder)")
+        return sp
+
+    sp = with_binder(sub.add_parser("import", help="Import cards from a .csv or .jsonl file"))
+    sp.add_argument("file")
+    sp = with_binder(sub.add_parser("export", help="Export a binder to a .csv or .jsonl file"))
+    sp.add_argument("file")
+    sp = with_binder(sub.add_parser("sort", help="Sort a binder (repacks from slot 1)"))
+    sp.add_argument("--by", choices=["name", "number"], default="number")
+    with_binder(sub.add_parser("compact", help="Close gaps in a binder, keeping card order"))
+    sp = sub.add_parser("report", help="Summarize binders of the profile")
+    sp.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    sp = sub.add_parser("locate", help="Find which binder, page and slot hold a card")
+    sp.add_argument("query", help="Card name words, #number or card id")
+    return p
+
+def open_collection(args):
+    coll = Collection(args.data)
+    coll.ensure_user()
+    user = args.user or coll.user
+    if user not in coll.data:
+        raise SystemExit(f"No such profile: {user}")
+    pw = args.password if args.password is not None else getpass.getpass(f"Password for {user}: ")
+    if not coll.check_password(user, pw):
+        raise SystemExit("Incorrect password")
+    coll.login(user)
+    return coll
+
+def resolve_binder(coll, name):
+    name = name or coll.binder_names()[0]
+    if name not in coll.user_data["binders"]:
+        raise SystemExit(f"No such binder: {name}")
+    return name
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(levelname)s - %(message)s', stream=sys.stderr)
+    coll = open_collection(args)
+
+    if args.command == "import":
+        name = resolve_binder(coll, args.binder)
+        imported, skipped = coll.import_file(name, args.file, CatalogResolver())
+        print(f"Imported {imported} cards into {name}" + (f" ({skipped} rows skipped)" if skipped else ""))
+    elif args.command == "export":
+        name = resolve_binder(coll, args.binder)
+        print(f"Exported {coll.export_file(name, args.file)} cards from {name}")
+    elif args.command == "sort":
+        name = resolve_binder(coll, args.binder)
+        (coll.sort_by_number if args.by == "number" else coll.sort_by_name)(name)
+        print(f"Sorted {name} by {args.by}")
+    elif args.command == "compact":
+        name = resolve_binder(coll, args.binder)
+        coll.compact(name)
+        print(f"Compacted {name}")
+    elif args.command == "report":
+        rows = coll.report()
+        if args.json:
+            print(json.dumps(rows, indent=2))
+        else:
+            for r in rows:
+                print(f"{r['binder']}: {r['cards']} cards, {r['pages_used']} pages used, "
+                      f"capacity {r['capacity']}" + (f", {r['overflow']} in overflow" if r['overflow'] else ""))
+                for set_name, n in r['sets'].items(): print(f"    {set_name}: {n}")
+    elif args.command == "locate":
+        for b_name, idx, card in coll.locator.lookup(args.query):
+            page, slot = divmod(idx, coll.per_page(b_name))
+            print(f"{b_name}\tpage {page + 1}\tslot {slot + 1}\t{card['name']} ({card.get('set_name', '?')})")
+    return 0
@@ -0,0 +1,251 @@
+"""
+Headless collection core: user profiles, binder operations, capacity and
+persistence. TCGApp and the command line both drive this; nothing here
+touches Tk, so it can be scripted and benchmarked without a display.
+"""
+import logging
+from collections import Counter
+
+from . import storage, transfer
+from .model import Binder, CardLocator, ensure_card_number, name_sort_key, number_sort_key
+
+logger = logging.getLogger(__name__)
+
+class Collection:
+    def __init__(self, path=storage.SAVE_FILE, data=None):
+        self.path = path
+        self.data = storage.load_data(path) if data is None else data
+        self.user = next(iter(self.data), "DefaultUser")
+        self.locator = CardLocator() # Filled on login, only for the authenticated user
+        self.indexed = False
+        self.revision = 0 # bumped on every binder mutation (views derived from binders compare it)
+
+    # ==========================================
+    # USERS
+    # ==========================================
+    def users(self):
+        return list(self.data.keys())
+
+    def ensure_user(self, binder_name=None):
+        """Creates the default profile on first run, fills in missing keys. Returns a valid binder name."""
+        if not self.data:
+            self.data["DefaultUser"] = storage.new_user_data()
+        if self.user not in self.data:
+            self.user = list(self.data.keys())[0]
+        user_data = self.data[self.user]
+        if "order" not in user_data: user_data["order"] = list(user_data["binders"].keys())
+        if "binder_layouts" not in user_data: user_data["binder_layouts"] = {}
+
+        # Initialize theme preference if missing
+        if "dark_mode" not in user_data: user_data["dark_mode"] = True
+
+        return binder_name if binder_name in user_data["binders"] else user_data["order"][0]
+
+    def check_password(self, user, pw):
+        return user in self.data and self.data[user].get("pw") == pw
+
+    def login(self, user):
+        """Makes user current and builds the locator index over their binders."""
+        self.user = user
+        self.locator.rebuild(self.data[user]["binders"])
+        self.indexed = True
+
+    def logout(self):
+        self.locator.clear(); self.indexed = False
+
+    def create_user(self, name, pw):
+        if name in self.data: raise ValueError(f"User {name} already exists")
+        logger.info(f"Creating new user profile: {name}")
+        self.data[name] = storage.new_user_data(pw or "1234")
+        self.save()
+
+    # ==========================================
+    # BINDERS & LAYOUT
+    # ==========================================
+    @property
+    def user_data(self):
+        return self.data[self.user]
+
+    def binder_names(self):
+        return self.user_data["order"]
+
+    def binder(self, name):
+        return self.user_data["binders"][name]
+
+    def layout(self, name):
+        """{"rows", "cols", "pages"} for a binder (defaults filled in)."""
+        return {**storage.DEFAULT_LAYOUT, **self.user_data.get("binder_layouts", {}).get(name, {})}
+
+    def per_page(self, name):
+        layout = self.layout(name)
+        return layout["rows"] * layout["cols"]
+
+    def capacity(self, name):
+        layout = self.layout(name)
+        return layout["rows"] * layout["cols"] * layout["pages"]
+
+    def set_layout(self, name, rows, cols, pages):
+        if rows <= 0 or cols <= 0 or pages <= 0:
+            raise ValueError("Rows, columns, and pages must be positive integers.")
+        logger.info(f"Applying binder grid: {rows} rows x {cols} cols x {pages} pages")
+        self.user_data.setdefault("binder_layouts", {})[name] = {"rows": rows, "cols": cols, "pages": pages}
+        self.binder(name).set_page_size(rows * cols)
+        self.save()
+
+    def create_binder(self, name):
+        if name in self.user_data["binders"]: raise ValueError("Binder name already exists!")
+        logger.info(f"Creating new binder: {name}")
+        self.user_data["binders"][name] = Binder()
+        self.user_data["order"].append(name)
+        self.user_data.setdefault("binder_layouts", {})[name] = dict(storage.DEFAULT_LAYOUT)
+        self.save()
+
+    def delete_binder(self, name):
+        """Deletes a binder (never the last one). Returns False if refused."""
+        if len(self.user_data["binders"]) <= 1: return False
+        logger.warning(f"Deleting binder: {name}")
+        del self.user_data["binders"][name]
+        self.user_data["order"].remove(name)
+        self.user_data.get("binder_layouts", {}).pop(name, None)
+        self.locator.drop_binder(name)
+        self.save()
+        return True
+
+    # ==========================================
+    # PERSISTENCE
+    # ==========================================
+    def save(self):
+        storage.save_data(self.data, self.path)
+
+    def commit(self, *names):
+        """Re-indexes the changed slots of the mutated binders and persists. Every operation below commits exactly once."""
+        self.revision += 1
+        binders = self.user_data["binders"]
+        for name in names:
+            if name not in binders: continue
+            binder = binders[name]; changed = binder.take_changes()
+            if not self.indexed: continue
+            if changed is None: self.locator.index_binder(name, binder)
+            else: self.locator.update_slots(name, binder, changed)
+        self.save()
+
+    # ==========================================
+    # BINDER OPERATIONS
+    # ==========================================
+    def sort_by_name(self, name):
+        logger.info(f"Sorting binder: {name}")
+        binder = self.binder(name)
+        binder.set_cards(sorted(binder, key=name_sort_key))
+        self.commit(name)
+
+    def sort_by_number(self, name):
+        logger.info(f"Sorting binder by number: {name}")
+        binder = self.binder(name)
+        # Repacks from slot 0 (closes gaps); number_sort_key also backfills card_number
+        binder.set_cards(sorted(binder, key=number_sort_key))
+        self.commit(name)
+
+    def compact(self, name):
+        logger.info(f"Compacting binder: {name}")
+        self.binder(name).compact()
+        self.commit(name)
+
+    def clear(self, name):
+        logger.warning(f"User {self.user} cleared binder {name}")
+        self.binder(name).clear()
+        self.commit(name)
+
+    def add_cards(self, name, cards):
+        """Places copies of catalog cards into the first free slots. Returns the count."""
+        binder = self.binder(name)
+        count = 0
+        for card in cards:
+            binder.place_free(Binder.new_instance(card)); count += 1
+        self.commit(name)
+        return count
+
+    def place_card(self, name, idx, card):
+        """Puts a copy of a catalog card at idx (replacing whatever is there)."""
+        self.binder(name).place(idx, Binder.new_instance(card))
+        self.commit(name)
+
+    def move_card(self, name, uid, target_idx):
+        """Swaps the instance uid with whatever sits at target_idx. Returns False if uid is gone."""
+        binder = self.binder(name)
+        origin_idx = binder.index_of(uid)
+        if origin_idx is None: return False
+        binder.swap(origin_idx, target_idx)
+        self.commit(name)
+        return True
+
+    def remove_cards(self, name, uids):
+        binder = self.binder(name)
+        count = sum(1 for uid in uids if binder.pop_instance(uid) is not None)
+        self.commit(name)
+        return count
+
+    def move_to_page(self, name, uids, page):
+        """Moves instances into the free slots of a 1-based page, spilling onto the following pages."""
+        binder = self.binder(name)
+        # Lift all cards out first so they can reuse each other's slots, then fill from the target page on
+        cards = [c for c in (binder.pop_instance(uid) for uid in uids) if c is not None]
+        page -= 1
+        for card in cards:
+            idx = binder.first_free_on_page(page)
+            while idx is None:
+                page += 1; idx = binder.first_free_on_page(page)
+            binder.place(idx, card)
+        self.commit(name)
+
+    def move_to_binder(self, name, uids, target_name):
+        source, target = self.binder(name), self.binder(target_name)
+        for uid in uids:
+            card = source.pop_instance(uid)
+            if card is not None: target.place_free(card)
+        self.commit(name, target_name)
+
+    def import_file(self, name, path, resolver):
+        """Streams a CSV / JSON Lines file into a binder. Returns (imported, skipped)."""
+        stats = {}
+        imported, skipped = transfer.import_collection(path, self.binder(name), resolver, stats)
+        logger.info(f"Imported {imported} cards into {name} ({skipped} rows skipped, {stats['adjusted']} out-of-range slots moved to free slots)")
+        self.commit(name)
+        return imported, skipped
+
+    def place_staged(self, name, staged):
+        """Places pre-parsed (card, slot index) pairs from transfer.read_collection."""
+        count = transfer.place_imported(self.binder(name), staged)
+        self.commit(name)
+        return count
+
+    def export_file(self, name, path):
+        count = transfer.export_collection(self.binder(name), path)
+        logger.info(f"Exported {count} cards from {name} to {path}")
+        return count
+
+    # ==========================================
+    # REPORTS
+    # ==========================================
+    def owned_in_set(self, name, set_name):
+        return sum(1 for c in self.binder(name).values() if c.get('set_name') == set_name)
+
+    def owned_by_set(self, name):
+        """set name -> cards of that set in a binder (one pass, for several sets at once)."""
+        return Counter(c.get('set_name') for c in self.binder(name).values())
+
+    def report(self):
+        """Per-binder summary for the current user (cards, pages, overflow, sets)."""
+        rows = []
+        for name in self.binder_names():
+            binder, per_page, capacity = self.binder(name), self.per_page(name), self.capacity(name)
+            for card in binder.values(): ensure_card_number(card)
+            rows.append({
+                "binder": name,
+                "cards": len(binder),
+                "extent": binder.extent,
+                "pages_used": (binder.extent + per_page - 1) // per_page,
+                "capacity": capacity,
+                "overflow": sum(1 for idx in binder.slots if idx >= capacity),
+                "sets": dict(Counter(c.get('set_name', 'Unknown Set') for c in binder.values()).most_common()),
+            })
+        return rows
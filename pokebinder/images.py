@@ -0,0 +1,92 @@
+"""
+Card image cache: JPEGs on disk plus a small in-memory LRU of decoded
+images, so revisiting a page, warming one before login or rescaling after
+a resize skips both the download and the JPEG decode.
+"""
+import os, logging, threading
+from collections import OrderedDict
+
+from . import catalog, perf
+
+logger = logging.getLogger("pokebinder.images")
+
+class ImageCache:
+    def __init__(self, cache_dir, max_decoded=128):
+        self.cache_dir = cache_dir
+        self.max_decoded = max_decoded # 245x342 RGB is ~250 KB decoded
+        self._decoded = OrderedDict()  # card id -> PIL image (full size)
+        self._lock = threading.Lock()
+        self.downloading = 0 # image downloads in flight; background work (updates) waits for 0
+
+    def path(self, card):
+        return os.path.join(self.cache_dir, f"{card['id']}.jpg")
+
+    def ensure_file(self, card):
+        """Path of the card's JPEG, downloading it on a miss. None if the download failed."""
+        p = self.path(card)
+        cached = os.path.exists(p); perf.hit("image.cache", cached)
+        if not cached:
+            with self._lock: self.downloading += 1
+            try:
+                logger.debug("Downloading image for card: %s", card['id'])
+                content = catalog.fetch_image(card['image'])
+                # Readers only ever see a complete file: write aside, then swap in (one temp per thread)
+                tmp = f"{p}.{threading.get_ident()}.tmp"
+                try:
+                    with open(tmp, "wb") as f: f.write(content)
+                    os.replace(tmp, p)
+                except OSError:
+                    try: os.remove(tmp)
+                    except OSError: pass
+                    raise
+            except Exception as e:
+                logger.error("Image download failed for %s: %s", card['id'], e)
+                return None
+            finally:
+                with self._lock: self.downloading -= 1
+
+        # Update file timestamp to mark as "recently used"
+        try: os.utime(p, None)
+        except OSError: pass
+        return p
+
+    def peek(self, card):
+        """Decoded image if it is in memory, without touching disk or network."""
+        with self._lock: return self._decoded.get(card['id'])
+
+    def local(self, card):
+        """Decoded image from memory or disk only (never downloads). None if neither has it."""
+        img = self.peek(card)
+        if img is not None or not os.path.exists(self.path(card)): return img
+        return self.decoded(card)
+
+    def decoded(self, card):
+        """Full-size PIL image for a card (memory, then disk, then network). None on failure."""
+        key = card['id']
+        with self._lock:
+            img = self._decoded.get(key)
+            if img is not None: self._decoded.move_to_end(key)
+        perf.hit("image.memory", img is not None)
+        if img is not None: return img
+
+        p = self.ensure_file(card)
+        if p is None: return None
+        try:
+            from PIL import Image
+            with perf.span("image.decode"):
+                img = Image.open(p); img.load()
+        except Exception as e:
+            logger.error("Image processing failed for %s: %s", p, e)
+            # Unreadable (e.g. truncated by an older version): drop it so the next request downloads it again
+            try: os.remove(p)
+            except OSError: pass
+            return None
+
+        with self._lock:
+            self._decoded[key] = img
+            while len(self._decoded) > self.max_decoded: self._decoded.popitem(last=False)
+        return img
+
+    def warm(self, cards):
+        """Downloads and decodes ahead of time (run off the UI thread). Returns how many are ready."""
+        return sum(1 for card in cards if self.decoded(card) is not None)
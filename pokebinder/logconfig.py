@@ -0,0 +1,122 @@
+"""
+Logging pipeline: callers only enqueue records, a background listener
+formats and writes them (rotating file + console), so the Tk thread never
+blocks on log I/O.
+
+Levels are set per subsystem with a spec string, from TCG_LOG at startup
+or at runtime via configure():
+
+    "INFO, pokebinder.render=DEBUG, pokebinder.render.slots=DEBUG/25"
+
+"/N" samples a logger: only every Nth record passes (meant for per-slot /
+per-image events). Hot paths should log with %-style arguments so nothing
+is formatted unless a record actually gets through. Scalar arguments cost
+nothing extra. Anything else (lists, cards, exceptions) is rendered when
+the record is queued, because the caller may change it before the
+listener runs.
+"""
+import os, queue, atexit, numbers, logging, threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+FORMAT = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+DEFAULT_SPEC = "INFO, pokebinder.render.slots=WARNING/50, pokebinder.standin=WARNING"
+
+# Subsystem loggers used by the app
+SUBSYSTEMS = ["pokebinder.app", "pokebinder.render", "pokebinder.render.slots", "pokebinder.images",
+              "pokebinder.catalog", "pokebinder.collection", "pokebinder.storage", "pokebinder.transfer", "pokebinder.standin"]
+
+_listener = None
+_configured = {} # logger name -> spec fragment, for current_spec()
+
+SCALARS = (str, bytes, numbers.Number, type(None)) # immutable: safe to format later
+
+class _Rendered:
+    """A mutable log argument as it was when logged; formats the same under %s and %r."""
+    __slots__ = ("s", "r")
+    def __init__(self, value): self.s, self.r = str(value), repr(value)
+    def __str__(self): return self.s
+    def __repr__(self): return self.r
+
+def _snapshot(value):
+    return value if isinstance(value, SCALARS) else _Rendered(value)
+
+class LazyQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves msg % args to the listener thread (the stock
+    one formats in the caller). Non-scalar arguments and exception text
+    are rendered eagerly, while they still hold what was logged.
+    """
+    def prepare(self, record):
+        if not isinstance(record.msg, str): record.msg = str(record.msg)
+        if isinstance(record.args, dict): record.args = {k: _snapshot(v) for k, v in record.args.items()}
+        elif record.args: record.args = tuple(_snapshot(a) for a in record.args)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+class SamplingFilter(logging.Filter):
+    """Lets one record in every `every` through."""
+    def __init__(self, every):
+        super().__init__()
+        self.every = max(1, int(every))
+        self._n = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        with self._lock:
+            self._n += 1
+            return (self._n - 1) % self.every == 0
+
+def setup(log_file="tcg_debug.log", spec=None, console=True, max_bytes=2 * 1024 * 1024, backup_count=1):
+    """Installs the queue handler on the root logger and starts the listener. Safe to call twice."""
+    global _listener
+    if _listener is not None: return _listener
+    handlers = []
+    if log_file:
+        # Limit log file to 2MB, keep 1 backup file.
+        handlers.append(RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, delay=True))
+    if console: handlers.append(logging.StreamHandler())
+    for h in handlers: h.setFormatter(logging.Formatter(FORMAT))
+
+    q = queue.SimpleQueue()
+    root = logging.getLogger()
+    for h in list(root.handlers): root.removeHandler(h)
+    root.addHandler(LazyQueueHandler(q))
+
+    _listener = QueueListener(q, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown)
+    configure(spec if spec is not None else os.environ.get("TCG_LOG", DEFAULT_SPEC))
+    return _listener
+
+def shutdown():
+    """Flushes queued records and stops the listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop(); _listener = None
+
+def configure(spec):
+    """
+    Applies a level spec ("LEVEL, name=LEVEL[/N], ...") at runtime. A bare
+    LEVEL sets the root logger. Returns the loggers that were changed.
+    Raises ValueError on an unknown level.
+    """
+    changed = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, setting = part.rpartition("=")
+        level_name, _, every = setting.partition("/")
+        level = logging.getLevelName(level_name.strip().upper())
+        if not isinstance(level, int): raise ValueError(f"Unknown log level: {level_name}")
+        target = logging.getLogger(name.strip() or None)
+        target.setLevel(level)
+        for f in [f for f in target.filters if isinstance(f, SamplingFilter)]: target.removeFilter(f)
+        if every.strip(): target.addFilter(SamplingFilter(every))
+        _configured[name.strip()] = part.strip() if name.strip() else level_name.strip().upper()
+        changed.append(name.strip() or "root")
+    return changed
+
+def current_spec():
+    """The spec currently in effect (for pre-filling the runtime editor)."""
+    root = _configured.get("", logging.getLevelName(logging.getLogger().level))
+    return ", ".join([root] + [v for k, v in _configured.items() if k])
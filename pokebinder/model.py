@@ -0,0 +1,332 @@
+"""
+Collection model: sparse binders, the card locator index and the card
+helpers shared by filtering and sorting. No Tk, no network.
+"""
+import re, bisect, uuid
+
+from . import perf
+
+def normalize_card_number(num):
+    """ "#025" / "025" / 25 -> "25" (keeps variant suffixes like "12a") """
+    n = str(num).strip().lstrip('#').lstrip('0').lower()
+    return n or "0"
+
+def card_number_of(card):
+    """ Card number from stored field, ID (e.g. "me02-129") or image URL """
+    if 'card_number' in card: return str(card['card_number'])
+    if '-' in card.get('id', ''): return card['id'].split('-')[-1]
+    match = re.search(r'/([^/]+)/low\.jpg', card.get('image', ''))
+    return match.group(1) if match else "0"
+
+# ==========================================
+# CARD LOCATOR INDEX
+# ==========================================
+class CardLocator:
+    """
+    Inverted index over every binder of one user.
+    Maps card id, name tokens and card number -> (binder, slot index) so
+    "where is this card?" never has to walk the binders.
+    """
+    TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.by_id = {}       # card id -> {(binder, idx), ...}
+        self.by_id_key = {}   # lowercased card id -> {card id, ...} (ids like "swsh12.5-GG01" keep their case)
+        self.by_token = {}    # name token -> {card id, ...}
+        self.by_number = {}   # normalized number -> {card id, ...}
+        self.cards = {}       # card id -> card dict (for display)
+        self.slots = {}       # binder -> {idx: card id}
+        self._sorted_tokens = None # Lazily rebuilt for prefix lookups
+
+    def rebuild(self, binders):
+        self.clear()
+        for name, cards in binders.items(): self.index_binder(name, cards)
+
+    def index_binder(self, binder, cards):
+        """Replaces all entries of one binder with its current contents (a Binder)."""
+        self.drop_binder(binder)
+        self.slots[binder] = {}
+        for idx, card in cards.slots.items(): self._add(binder, idx, card)
+
+    def update_slots(self, binder, cards, idxs):
+        """Re-reads only the given slot indexes of a binder (see Binder.take_changes)."""
+        for idx in idxs:
+            self._remove(binder, idx)
+            card = cards.get(idx)
+            if card is not None: self._add(binder, idx, card)
+
+    def _add(self, binder, idx, card):
+        cid = card.get('id')
+        if not cid: return
+        self.slots.setdefault(binder, {})[idx] = cid
+        self.by_id.setdefault(cid, set()).add((binder, idx))
+        if cid not in self.cards:
+            self.cards[cid] = card
+            self.by_id_key.setdefault(cid.lower(), set()).add(cid)
+            for tok in self.TOKEN_RE.findall(card.get('name', '').lower()):
+                if tok not in self.by_token: self._sorted_tokens = None
+                self.by_token.setdefault(tok, set()).add(cid)
+            self.by_number.setdefault(normalize_card_number(card_number_of(card)), set()).add(cid)
+
+    def _remove(self, binder, idx):
+        cid = self.slots.get(binder, {}).pop(idx, None)
+        places = self.by_id.get(cid)
+        if places is None: return
+        places.discard((binder, idx))
+        if not places: self._forget_card(cid)
+
+    def drop_binder(self, binder):
+        for idx in list(self.slots.get(binder, ())): self._remove(binder, idx)
+        self.slots.pop(binder, None)
+
+    def _forget_card(self, cid):
+        del self.by_id[cid]
+        card = self.cards.pop(cid, None)
+        if not card: return
+        ids = self.by_id_key.get(cid.lower())
+        if ids is not None:
+            ids.discard(cid)
+            if not ids: del self.by_id_key[cid.lower()]
+        for tok in self.TOKEN_RE.findall(card.get('name', '').lower()):
+            ids = self.by_token.get(tok)
+            if ids is not None:
+                ids.discard(cid)
+                if not ids: del self.by_token[tok]; self._sorted_tokens = None
+        num = normalize_card_number(card_number_of(card))
+        ids = self.by_number.get(num)
+        if ids is not None:
+            ids.discard(cid)
+            if not ids: del self.by_number[num]
+
+    def _ids_for_prefix(self, prefix):
+        if self._sorted_tokens is None: self._sorted_tokens = sorted(self.by_token)
+        toks = self._sorted_tokens
+        ids = set()
+        i = bisect.bisect_left(toks, prefix)
+        while i < len(toks) and toks[i].startswith(prefix):
+            ids |= self.by_token[toks[i]]; i += 1
+        return ids
+
+    def lookup(self, query, limit=200):
+        """
+        Returns sorted [(binder, idx, card), ...] for a card id, a number
+        ("#25" / "25") or name words (each word matches as a prefix).
+        """
+        q = query.lower().strip()
+        if not q: return []
+        if query.strip() in self.by_id:
+            ids = {query.strip()}
+        elif q in self.by_id_key:
+            ids = self.by_id_key[q]
+        elif q.startswith('#') or q.isdigit():
+            ids = self.by_number.get(normalize_card_number(q), set())
+        else:
+            ids = None
+            for tok in self.TOKEN_RE.findall(q):
+                matched = self._ids_for_prefix(tok)
+                ids = matched if ids is None else ids & matched
+                if not ids: break
+            ids = ids or set()
+
+        # Stop collecting once the limit is hit so broad queries stay cheap
+        hits = []
+        for cid in ids:
+            hits.extend((b, idx, self.cards[cid]) for b, idx in self.by_id[cid])
+            if len(hits) >= limit: break
+        hits.sort(key=lambda h: (h[0].lower(), h[1]))
+        return hits[:limit]
+
+# ==========================================
+# BINDER STORAGE
+# ==========================================
+class Binder:
+    """
+    Sparse binder: slot index -> card, plus the extent (furthest used slot + 1).
+    Only occupied slots are stored, so memory, filtering and the save file
+    scale with cards owned rather than with the furthest page used.
+
+    Ordered iteration walks a sorted key list that is rebuilt only after a
+    slot is added or emptied; values() skips the ordering for passes where
+    it does not matter (counts, membership).
+
+    A per-page occupancy bitmap answers "first free slot on page N" and
+    "first free slot anywhere" without scanning slots.
+
+    Every placed card carries a stable instance id ('uid'); a position map
+    resolves it to its slot in O(1), so two copies of the same card are
+    always told apart.
+    """
+    def __init__(self, slots=None, per_page=9):
+        self.slots = dict(slots or {})
+        self.extent = max(self.slots) + 1 if self.slots else 0
+        self._changed = set() # slot indexes touched since take_changes(); None after a wholesale change
+        self._order = None    # sorted slot indexes, None when stale
+        self._reindex_positions()
+        self.set_page_size(per_page)
+
+    @staticmethod
+    def new_instance(card):
+        """Copy of a catalog/search card with a fresh instance id, ready to place."""
+        inst = {k: v for k, v in card.items() if k != 'uid'}
+        inst['uid'] = uuid.uuid4().hex[:12]
+        return inst
+
+    def _reindex_positions(self):
+        self._pos = {}  # uid -> slot index
+        for idx, card in self.slots.items():
+            # Older saves have no ids, and copied dicts can share one
+            if not card.get('uid') or card['uid'] in self._pos: card['uid'] = uuid.uuid4().hex[:12]
+            self._pos[card['uid']] = idx
+
+    @classmethod
+    def from_json(cls, raw, per_page=9):
+        # Legacy format: flat list padded with {"id": "empty"} placeholder dicts
+        if isinstance(raw, list):
+            return cls({i: c for i, c in enumerate(raw) if c.get('id') != 'empty'}, per_page)
+        return cls({int(i): c for i, c in raw.get("slots", {}).items()}, per_page)
+
+    def to_json(self):
+        return {"extent": self.extent, "slots": {str(i): self.slots[i] for i in self._keys()}}
+
+    def __len__(self): return len(self.slots)
+    def __iter__(self): return (self.slots[i] for i in self._keys())
+    def items(self): return [(i, self.slots[i]) for i in self._keys()]
+    def values(self): return self.slots.values() # slot order not guaranteed
+    def get(self, idx): return self.slots.get(idx)
+
+    def _keys(self):
+        if self._order is None: self._order = sorted(self.slots)
+        return self._order
+    def index_of(self, uid): return self._pos.get(uid)
+
+    # --- Free-slot index ---
+    def set_page_size(self, per_page):
+        """Rebuilds the page bitmaps (on load and whenever rows x cols changes)."""
+        self.per_page = max(1, per_page)
+        self._full_mask = (1 << self.per_page) - 1
+        self._page_masks = {}  # page (0-based) -> bitmask of occupied slots
+        self._free_from = 0    # Every page below this one is known to be full
+        for idx in self.slots: self._mark(idx)
+
+    def _mark(self, idx):
+        page, bit = divmod(idx, self.per_page)
+        self._page_masks[page] = self._page_masks.get(page, 0) | (1 << bit)
+
+    def _unmark(self, idx):
+        page, bit = divmod(idx, self.per_page)
+        mask = self._page_masks.get(page, 0) & ~(1 << bit)
+        if mask: self._page_masks[page] = mask
+        else: self._page_masks.pop(page, None)
+        if page < self._free_from: self._free_from = page
+
+    def first_free_on_page(self, page):
+        """First empty slot index on a 0-based page, or None if the page is full."""
+        mask = self._page_masks.get(page, 0)
+        if mask == self._full_mask: return None
+        return page * self.per_page + ((~mask & (mask + 1)).bit_length() - 1)
+
+    def first_free(self):
+        """First empty slot index anywhere (amortized O(1) across bulk placement)."""
+        page = self._free_from
+        while self._page_masks.get(page, 0) == self._full_mask: page += 1
+        self._free_from = page
+        return self.first_free_on_page(page)
+
+    # --- Mutations ---
+    def place(self, idx, card):
+        """Puts a card instance at idx (overwriting); an instance already in the binder moves."""
+        if not card.get('uid'): card['uid'] = uuid.uuid4().hex[:12]
+        if card['uid'] in self._pos: self.pop(self._pos[card['uid']])
+        old = self.slots.get(idx)
+        if old is None: self._mark(idx); self._order = None
+        else: self._pos.pop(old['uid'], None)
+        self.slots[idx] = card
+        self._pos[card['uid']] = idx
+        if idx >= self.extent: self.extent = idx + 1
+        if self._changed is not None: self._changed.add(idx)
+
+    def place_free(self, card):
+        """Puts card into the first empty slot and returns that slot index."""
+        idx = self.first_free()
+        self.place(idx, card)
+        return idx
+
+    def pop(self, idx):
+        card = self.slots.pop(idx, None)
+        if card is None: return None
+        self._pos.pop(card['uid'], None)
+        self._unmark(idx); self._order = None
+        if self._changed is not None: self._changed.add(idx)
+        if idx == self.extent - 1:
+            while self.extent and (self.extent - 1) not in self.slots: self.extent -= 1
+        return card
+
+    def swap(self, a, b):
+        card_a, card_b = self.pop(a), self.pop(b)
+        if card_a is not None: self.place(b, card_a)
+        if card_b is not None: self.place(a, card_b)
+
+    def append(self, card):
+        self.place(self.extent, card)
+
+    def take_changes(self):
+        """Slot indexes changed since the last call, or None if the whole binder was replaced."""
+        changed, self._changed = self._changed, set()
+        return changed
+
+    def pop_instance(self, uid):
+        """Removes exactly this card instance, leaving its slot empty."""
+        idx = self._pos.get(uid)
+        return None if idx is None else self.pop(idx)
+
+    def set_cards(self, cards):
+        """Replaces contents with cards packed from slot 0 (used by sorting)."""
+        self.slots = dict(enumerate(cards)); self.extent = len(self.slots); self._changed = None
+        self._order = list(range(self.extent))
+        self._reindex_positions()
+        self.set_page_size(self.per_page)
+
+    def compact(self):
+        """Closes every gap in one pass, keeping the current card order."""
+        self.set_cards(list(self))
+
+    def clear(self):
+        self.slots.clear(); self.extent = 0; self._pos.clear(); self._changed = None; self._order = []
+        self.set_page_size(self.per_page)
+
+# ==========================================
+# FILTERING & SORTING
+# ==========================================
+def ensure_card_number(card):
+    """Stores card_number on the card dict if it is missing (older saves lack it)."""
+    if 'card_number' not in card:
+        try: card['card_number'] = card_number_of(card)
+        except Exception: card['card_number'] = "0"
+    return card['card_number']
+
+@perf.timed("filter_cards")
+def filter_cards(cards, query):
+    """
+    Name substring match, or exact number match when the query looks like
+    a number ("#023", "23"; leading zeros ignored).
+    """
+    q = query.lower().strip()
+    if not q: return list(cards)
+
+    if q.startswith('#') or q.isdigit():
+        search_num = normalize_card_number(q)
+        return [c for c in cards if normalize_card_number(ensure_card_number(c)) == search_num]
+    return [c for c in cards if q in c['name'].lower()]
+
+def name_sort_key(card):
+    return card['name'].lower()
+
+def number_sort_key(card):
+    """Handles "1", "2", "10" correctly instead of "1", "10", "2" (variants like "12a" sort by digits)."""
+    try:
+        num_part = "".join(filter(str.isdigit, str(ensure_card_number(card))))
+        return int(num_part) if num_part else 9999
+    except Exception: return 9999
@@ -0,0 +1,97 @@
+"""
+Pre-composited binder pages. Each sheet is one PIL image of a whole page,
+drawn at the current slot size from images already in memory or on disk
+(never downloading) off the UI thread, so a page flip can show the page at
+once while the real slots are built behind it.
+
+A sheet is keyed by (binder, page) and carries a signature of everything
+drawn on it (cards, selection, overflow, layout, slot width, palette); a
+lookup with a different signature is a miss, so edits to other pages never
+invalidate it.
+"""
+import logging, threading
+from collections import OrderedDict
+
+from . import perf
+
+logger = logging.getLogger("pokebinder.images")
+
+PAD = 5                    # grid padx / pady around each slot
+TITLE_H, BUTTONS_H = 22, 26 # title label / button row of a slot
+REMOVE_BG, BUY_BG = "#8B0000", "#2B6CB0"
+
+def slot_height(card_w):
+    return int(card_w * 1.4) + 85
+
+class PageSheets:
+    def __init__(self, images, max_sheets=12):
+        self.images = images
+        self.max_sheets = max_sheets # a 5x5 sheet at 1600px is ~6 MB decoded
+        self._sheets = OrderedDict() # (binder, page) -> (signature, PIL image)
+        self._building = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def signature(slots, cols, card_w, palette):
+        """slots: [(card or None, selected, overflow)] in slot order."""
+        return (cols, card_w, palette, tuple((card and (card.get('uid') or card['id']), sel, over) for card, sel, over in slots))
+
+    def get(self, key, signature):
+        """The sheet for a page if it is current, else None."""
+        with self._lock:
+            entry = self._sheets.get(key)
+            found = entry is not None and entry[0] == signature
+            if found: self._sheets.move_to_end(key)
+        perf.hit("page_sheet", found)
+        return entry[1] if found else None
+
+    def request(self, key, signature, slots, cols, card_w, colors):
+        """Composes a page in the background unless a current sheet exists or is being built."""
+        with self._lock:
+            entry = self._sheets.get(key)
+            if (entry is not None and entry[0] == signature) or (key, signature) in self._building: return
+            self._building.add((key, signature))
+        def work():
+            try:
+                sheet = self.compose(slots, cols, card_w, colors)
+                with self._lock:
+                    self._sheets[key] = (signature, sheet); self._sheets.move_to_end(key)
+                    while len(self._sheets) > self.max_sheets: self._sheets.popitem(last=False)
+            except Exception as e:
+                logger.error("Page sheet failed for %s: %s", key, e)
+            finally:
+                with self._lock: self._building.discard((key, signature))
+        threading.Thread(target=work, daemon=True).start()
+
+    def compose(self, slots, cols, card_w, colors):
+        """Draws a page the way render_side lays it out: bordered slots, title, image, button row."""
+        from PIL import Image, ImageDraw, ImageEnhance
+        with perf.span("sheet.compose"):
+            slot_h = slot_height(card_w)
+            rows = (len(slots) + cols - 1) // cols
+            cell_w, cell_h = card_w + 2 * PAD, slot_h + 2 * PAD
+            sheet = Image.new("RGB", (cols * cell_w, rows * cell_h), colors["bg"])
+            draw = ImageDraw.Draw(sheet)
+            img_w = card_w - 10; img_h = int(img_w * 1.4)
+            max_chars = max(4, card_w // 6)
+
+            for i, (card, selected, overflow) in enumerate(slots):
+                r, c = divmod(i, cols)
+                x, y = c * cell_w + PAD, r * cell_h + PAD
+                border = colors["hl"] if selected else colors["overflow" if overflow else "accent"]
+                draw.rectangle([x, y, x + card_w - 1, y + slot_h - 1], fill=colors["card_bg"], outline=border, width=4 if selected else 2)
+                if card is None: continue
+
+                title = f"{card.get('set_name', 'Unknown Set')}, #{card.get('card_number', '?')} - {card['name']}"
+                try: draw.text((x + 6, y + 5), title if len(title) <= max_chars else title[:max_chars - 3] + "...", fill=colors["text"])
+                except UnicodeError: pass # the bitmap fallback font is latin-1 only; the real slot shows the title
+                img = self.images.local(card) # a card not cached yet stays blank; its slot loads it
+                if img is not None:
+                    thumb = img.resize((img_w, img_h), Image.Resampling.LANCZOS)
+                    if overflow: thumb = ImageEnhance.Brightness(thumb).enhance(0.5)
+                    sheet.paste(thumb, (x + (card_w - img_w) // 2, y + TITLE_H + max(0, (slot_h - TITLE_H - BUTTONS_H - img_h) // 2)))
+
+                by, half = y + slot_h - BUTTONS_H + 2, (card_w - 8) // 2
+                draw.rectangle([x + 4, by, x + 3 + half, by + BUTTONS_H - 6], fill=REMOVE_BG)
+                draw.rectangle([x + 4 + half, by, x + card_w - 5, by + BUTTONS_H - 6], fill=BUY_BG)
+            return sheet
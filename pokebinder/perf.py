@@ -0,0 +1,141 @@
+"""
+Lightweight hot-path instrumentation: timing spans aggregated into rolling
+histograms, hit/miss counters and gauges (queue depths, work in flight).
+
+    with perf.span("render_side"): ...
+    perf.hit("image.cache", found)
+    with perf.inflight("image.queue"): ...
+
+Cheap enough to stay on in release builds (two perf_counter calls and a
+deque append per span); TCG_PERF=0 turns it off. The GUI overlay reads
+snapshot(); export_jsonl() appends the same data for offline comparison.
+"""
+import os, json, time, threading, functools
+from collections import deque
+from contextlib import contextmanager
+
+WINDOW = 1000 # samples kept per span
+
+enabled = os.environ.get("TCG_PERF", "1") != "0"
+_lock = threading.Lock()
+_spans = {}    # name -> deque of seconds (rolling window)
+_totals = {}   # name -> [count, total seconds] since reset
+_counters = {} # name -> int
+_gauges = {}   # name -> [current, peak]
+
+def record(name, seconds):
+    if not enabled: return
+    with _lock:
+        samples = _spans.get(name)
+        if samples is None: samples = _spans[name] = deque(maxlen=WINDOW); _totals[name] = [0, 0.0]
+        samples.append(seconds)
+        tot = _totals[name]; tot[0] += 1; tot[1] += seconds
+
+@contextmanager
+def span(name):
+    if not enabled:
+        yield; return
+    t0 = time.perf_counter()
+    try: yield
+    finally: record(name, time.perf_counter() - t0)
+
+def timed(name):
+    """Decorator form of span()."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            if not enabled: return fn(*args, **kwargs)
+            t0 = time.perf_counter()
+            try: return fn(*args, **kwargs)
+            finally: record(name, time.perf_counter() - t0)
+        return inner
+    return wrap
+
+def count(name, n=1):
+    if not enabled: return
+    with _lock: _counters[name] = _counters.get(name, 0) + n
+
+def hit(name, found):
+    """Counts a cache lookup as name.hit or name.miss."""
+    count(f"{name}.hit" if found else f"{name}.miss")
+
+def adjust(name, delta):
+    """Moves a gauge (e.g. a queue depth) by delta, tracking its peak."""
+    if not enabled: return
+    with _lock:
+        g = _gauges.setdefault(name, [0, 0])
+        g[0] += delta; g[1] = max(g[1], g[0])
+
+def set_gauge(name, value):
+    """Sets a gauge to an absolute value (e.g. the length of a queue the caller owns), tracking its peak."""
+    if not enabled: return
+    with _lock:
+        g = _gauges.setdefault(name, [0, 0])
+        g[0] = value; g[1] = max(g[1], value)
+
+@contextmanager
+def inflight(name):
+    adjust(name, 1)
+    try: yield
+    finally: adjust(name, -1)
+
+def _percentile(ordered, q):
+    if not ordered: return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def snapshot():
+    """{"spans": {name: {count, p50_ms, p95_ms, max_ms, mean_ms}}, "hit_rates": {...}, "counters": {...}, "gauges": {...}}"""
+    with _lock:
+        windows = {name: sorted(samples) for name, samples in _spans.items()}
+        totals = {name: tuple(t) for name, t in _totals.items()}
+        counters = dict(_counters)
+        gauges = {name: {"current": g[0], "peak": g[1]} for name, g in _gauges.items()}
+    spans = {}
+    for name, ordered in sorted(windows.items()):
+        n, total = totals[name]
+        spans[name] = {
+            "count": n,
+            "p50_ms": _percentile(ordered, 0.50) * 1000,
+            "p95_ms": _percentile(ordered, 0.95) * 1000,
+            "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+            "mean_ms": total / n * 1000 if n else 0.0,
+        }
+    hit_rates = {}
+    for key in counters:
+        if key.endswith(".hit") or key.endswith(".miss"):
+            base = key.rsplit(".", 1)[0]
+            hits, misses = counters.get(f"{base}.hit", 0), counters.get(f"{base}.miss", 0)
+            hit_rates[base] = hits / (hits + misses) if hits + misses else 0.0
+    return {"spans": spans, "hit_rates": hit_rates, "counters": counters, "gauges": gauges}
+
+def export_jsonl(path, **meta):
+    """Appends one JSON line per span plus one for counters / gauges. Returns the number of lines."""
+    snap, ts = snapshot(), time.strftime("%Y-%m-%dT%H:%M:%S")
+    lines = [{"ts": ts, "kind": "span", "name": name, **stats, **meta} for name, stats in snap["spans"].items()]
+    lines.append({"ts": ts, "kind": "counters", "hit_rates": snap["hit_rates"], "counters": snap["counters"], "gauges": snap["gauges"], **meta})
+    with open(path, "a", encoding="utf-8") as f:
+        for line in lines: f.write(json.dumps(line) + "\n")
+    return len(lines)
+
+def reset():
+    with _lock:
+        _spans.clear(); _totals.clear(); _counters.clear()
+        # Gauges track live state (queue depths), only their peaks restart
+        for g in _gauges.values(): g[1] = g[0]
+
+def format_table(snap=None):
+    """Plain-text summary for the overlay / logs."""
+    snap = snap or snapshot()
+    out = [f"{'span':<24}{'n':>7}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+    for name, s in snap["spans"].items():
+        out.append(f"{name:<24}{s['count']:>7}{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}{s['max_ms']:>10.1f}")
+    if snap["hit_rates"]:
+        out.append("")
+        for name, rate in sorted(snap["hit_rates"].items()):
+            hits, misses = snap["counters"].get(f"{name}.hit", 0), snap["counters"].get(f"{name}.miss", 0)
+            out.append(f"{name:<24}hit rate {rate * 100:5.1f}%  ({hits} hit / {misses} miss)")
+    if snap["gauges"]:
+        out.append("")
+        for name, g in sorted(snap["gauges"].items()):
+            out.append(f"{name:<24}now {g['current']:>4}  peak {g['peak']:>4}")
+    return "\n".join(out)
@@ -0,0 +1,58 @@
+"""
+Last-session state per profile (binder, page, filters, loaded search, grid
+sizes), plus the app-wide theme choice, which also applies at the login
+screen. Kept in its own small file so page flips never rewrite the data
+file, and written atomically so a crash cannot leave it half written.
+"""
+import os, json, logging
+
+logger = logging.getLogger(__name__)
+
+SESSION_FILE = "tcg_session.json"
+
+class Session:
+    def __init__(self, path=SESSION_FILE):
+        self.path = path
+        self.state = {"last_user": None, "users": {}}
+        self.dirty = False
+        try:
+            if os.path.exists(path):
+                with open(path, "r") as f: self.state.update(json.load(f))
+        except Exception as e:
+            logger.error(f"Failed to load session: {e}")
+
+    @property
+    def last_user(self):
+        return self.state.get("last_user")
+
+    @property
+    def dark_mode(self):
+        """The last theme chosen, by anyone or before login (None if never toggled)."""
+        return self.state.get("dark_mode")
+
+    def set_dark_mode(self, on):
+        """Returns True if it changed (save() is then due)."""
+        if self.state.get("dark_mode") == on: return False
+        self.state["dark_mode"] = on; self.dirty = True
+        return True
+
+    def get(self, user):
+        """Saved state for a profile ({} if none)."""
+        return dict(self.state["users"].get(user, {}))
+
+    def update(self, user, state):
+        """Replaces a profile's state; returns True if anything changed (save() is then due)."""
+        if self.state["users"].get(user) == state and self.state.get("last_user") == user: return False
+        self.state["users"][user] = state; self.state["last_user"] = user
+        self.dirty = True
+        return True
+
+    def save(self):
+        if not self.dirty: return
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "w") as f: json.dump(self.state, f, indent=2)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except Exception as e:
+            logger.error(f"Failed to save session: {e}")
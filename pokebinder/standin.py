@@ -0,0 +1,337 @@
+"""
+Local TCGDex stand-in: replays recorded API responses and card images over
+HTTP with optional latency, errors and throttled bodies, so set loads and
+the image pipeline can be measured offline and deterministically.
+
+    python -m pokebinder.standin record recordings/ --set 151 --search pikachu --images 20
+    python -m pokebinder.standin synth recordings/ --sets 5
+    python -m pokebinder.standin serve recordings/ --latency 0.2 --error-rate 0.05
+
+Point the app at it with the TCGDEX_API_BASE / TCGDEX_ASSETS_BASE values
+printed by `serve`. Responses carry ETags (If-None-Match gets a 304) and
+byte ranges are honoured, so the updater's cached release checks and
+resumed downloads can be exercised too (see synth_release).
+
+Recording layout: one file per request, mirroring the URL path. API
+responses get a .json suffix, a query string is appended after '@'
+(v2/en/cards@name=pikachu.json) and images live under assets/.
+"""
+import os, re, sys, json, time, hashlib, random, argparse, logging, threading, mimetypes, urllib.parse
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from . import catalog
+
+logger = logging.getLogger(__name__)
+
+ASSETS_PREFIX = "/assets"
+
+# ==========================================
+# RECORDING LAYOUT
+# ==========================================
+def key_for_url(url):
+    """Real TCGDex URL -> stand-in request path (+ normalized query)."""
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path
+    if parts.netloc == urllib.parse.urlsplit(catalog.DEFAULT_ASSETS_BASE).netloc:
+        path = ASSETS_PREFIX + path
+    return path + (f"?{parts.query}" if parts.query else "")
+
+def file_for_key(root, key):
+    path, _, query = key.partition("?")
+    rel = urllib.parse.unquote(path).lstrip("/")
+    if query:
+        rel += "@" + urllib.parse.quote(urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(query))), safe="=&")
+    if not path.startswith(ASSETS_PREFIX + "/"): rel += ".json"
+    full = os.path.realpath(os.path.join(root, rel))
+    # Never serve anything outside the recording
+    if not full.startswith(os.path.realpath(root) + os.sep): return None
+    return full
+
+def save_response(root, key, content):
+    path = file_for_key(root, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f: f.write(content)
+    return path
+
+# ==========================================
+# SERVER
+# ==========================================
+class StandIn:
+    """
+    Threaded HTTP server replaying a recording directory.
+
+    Faults apply to requests whose path matches `match` (all by default):
+      latency / jitter   seconds added before responding (jitter is uniform 0..jitter)
+      error_rate         share of requests answered with error_status
+      slow_rate          share of responses trickled out at slow_bps bytes/second
+    Runs are reproducible for a given seed.
+    """
+    def __init__(self, root, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, error_rate=0.0, error_status=503,
+                 slow_rate=0.0, slow_bps=64 * 1024, seed=0, match=None):
+        self.root = root
+        self.latency, self.jitter = latency, jitter
+        self.error_rate, self.error_status = error_rate, error_status
+        self.slow_rate, self.slow_bps = slow_rate, slow_bps
+        self.match = re.compile(match) if match else None
+        self.rng = random.Random(seed)
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.standin = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_base(self):
+        return self.base_url + urllib.parse.urlsplit(catalog.DEFAULT_API_BASE).path
+
+    @property
+    def assets_base(self):
+        return self.base_url + ASSETS_PREFIX
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"TCGDex stand-in serving {self.root} at {self.base_url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown(); self.httpd.server_close()
+
+    def __enter__(self): return self.start()
+    def __exit__(self, *exc): self.stop()
+
+    def plan(self, path):
+        """(delay, error, slow) for one request."""
+        with self._lock:
+            self.stats["requests"] += 1
+            if self.match and not self.match.search(path): return 0.0, False, False
+            delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            error = self.rng.random() < self.error_rate
+            slow = not error and self.rng.random() < self.slow_rate
+            if error: self.stats["errors"] += 1
+            if slow: self.stats["slow"] += 1
+            return delay, error, slow
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        logger.debug("standin: " + fmt % args)
+
+    def handle(self):
+        try: super().handle()
+        except (BrokenPipeError, ConnectionResetError): pass # client hung up between requests
+
+    def send_body(self, status, content, content_type, slow=False, headers=()):
+        standin = self.server.standin
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in headers: self.send_header(name, value)
+        self.end_headers()
+        if not slow:
+            self.wfile.write(content); return
+        chunk = max(1, standin.slow_bps // 10)
+        try:
+            for i in range(0, len(content), chunk):
+                self.wfile.write(content[i:i + chunk]); self.wfile.flush()
+                time.sleep(0.1)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True # client stopped reading (a streamed search that was cut short)
+
+    def do_GET(self):
+        standin = self.server.standin
+        delay, error, slow = standin.plan(self.path)
+        if delay: time.sleep(delay)
+        if error:
+            body = json.dumps({"error": "injected failure"}).encode()
+            return self.send_body(standin.error_status, body, "application/json")
+
+        path = file_for_key(standin.root, self.path)
+        if not path or not os.path.isfile(path):
+            with standin._lock: standin.stats["misses"] += 1
+            logger.warning(f"standin: not recorded: {self.path}")
+            body = json.dumps({"error": "not recorded", "path": self.path}).encode()
+            return self.send_body(404, body, "application/json")
+
+        with open(path, "rb") as f: content = f.read()
+        content_type = "application/json" if path.endswith(".json") else (mimetypes.guess_type(path)[0] or "application/octet-stream")
+        etag = '"%s"' % hashlib.sha1(content).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            with standin._lock: standin.stats["not_modified"] += 1
+            return self.send_body(304, b"", content_type, headers=[("ETag", etag)])
+
+        # Single open-ended or bounded byte ranges (bytes=N- / bytes=N-M), as resumable downloads send
+        m = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if m and self.headers.get("If-Range", etag) != etag: m = None # changed since the partial: send it all
+        if m:
+            start = int(m.group(1)); end = min(int(m.group(2)) if m.group(2) else len(content) - 1, len(content) - 1)
+            with standin._lock: standin.stats["ranges"] += 1
+            if start >= len(content):
+                return self.send_body(416, b"", content_type, headers=[("Content-Range", f"bytes */{len(content)}")])
+            return self.send_body(206, content[start:end + 1], content_type, slow,
+                                  [("ETag", etag), ("Content-Range", f"bytes {start}-{end}/{len(content)}")])
+        self.send_body(200, content, content_type, slow, [("ETag", etag), ("Accept-Ranges", "bytes")])
+
+# ==========================================
+# RECORD / SYNTHESIZE
+# ==========================================
+def record(root, set_queries=(), searches=(), images=0):
+    """Captures real TCGDex responses (set list, sets, searches, up to `images` images each) into root."""
+    import requests
+
+    def get(url):
+        r = requests.get(url, timeout=30); r.raise_for_status()
+        save_response(root, key_for_url(url), r.content)
+        return r
+
+    api = catalog.DEFAULT_API_BASE
+    sets = get(f"{api}/sets").json()
+    image_bases = []
+    for q in set_queries:
+        if q.lower().startswith(catalog.SERIES_PREFIX):
+            series = catalog.find_set(q[len(catalog.SERIES_PREFIX):].strip(), get(f"{api}/series").json())
+            matches = get(f"{api}/series/{urllib.parse.quote(series['id'])}").json().get('sets', []) if series else []
+        else:
+            match = catalog.find_set(q, sets); matches = [match] if match else []
+        if not matches:
+            logger.warning(f"No set matching {q!r}"); continue
+        for match in matches:
+            full = get(f"{api}/sets/{urllib.parse.quote(match['id'])}").json()
+            image_bases += [c['image'] for c in full.get('cards', []) if c.get('image')][:images]
+    for q in searches:
+        res = get(f"{api}/cards?name={urllib.parse.quote(q)}").json()
+        image_bases += [c['image'] for c in res if c.get('image') and "/tcgp/" not in c['image']][:images]
+    for base in image_bases:
+        try: get(f"{base}/low.jpg")
+        except Exception as e: logger.warning(f"Image not recorded: {base}: {e}")
+    return len(image_bases)
+
+SYNTH_NAMES = ["Pikachu", "Charizard", "Eevee", "Mewtwo", "Gengar", "Snorlax", "Lucario", "Gardevoir"]
+
+def synth(root, n_sets=5, cards_per_set=120, with_images=True, seed=0):
+    """Writes a synthetic recording (no network needed): n_sets sets in one series, one search per SYNTH_NAMES entry."""
+    rng = random.Random(seed)
+    api_path = urllib.parse.urlsplit(catalog.DEFAULT_API_BASE).path
+    sets, by_name = [], {name: [] for name in SYNTH_NAMES}
+    jpegs = _synth_jpegs(rng) if with_images else []
+
+    for s in range(n_sets):
+        set_id, set_name = f"syn{s:02d}", f"Synthetic Set {s}"
+        cards = []
+        for n in range(1, cards_per_set + 1):
+            name = rng.choice(SYNTH_NAMES)
+            card = {"id": f"{set_id}-{n:03d}", "localId": f"{n:03d}", "name": name,
+                    "image": f"{catalog.DEFAULT_ASSETS_BASE}/en/synth/{set_id}/{n:03d}"}
+            cards.append(card); by_name[name].append(card)
+            save_response(root, f"{api_path}/cards/{card['id']}", json.dumps({**card, **_synth_attributes(rng)}).encode())
+            if jpegs: save_response(root, key_for_url(card["image"] + "/low.jpg"), jpegs[n % len(jpegs)])
+        sets.append({"id": set_id, "name": set_name, "cardCount": {"total": len(cards), "official": len(cards)}})
+        save_response(root, f"{api_path}/sets/{set_id}", json.dumps({**sets[-1], "cards": cards}).encode())
+
+    save_response(root, f"{api_path}/sets", json.dumps(sets).encode())
+    series = {"id": "syn", "name": "Synthetic Series", "sets": [{"id": x["id"], "name": x["name"]} for x in sets]}
+    save_response(root, f"{api_path}/series", json.dumps([{"id": "syn", "name": series["name"]}]).encode())
+    save_response(root, f"{api_path}/series/syn", json.dumps(series).encode())
+    for name, cards in by_name.items():
+        save_response(root, f"{api_path}/cards?name={urllib.parse.quote(name)}", json.dumps(cards).encode())
+    return sets
+
+def synth_release(root, base_url, version, exe_bytes, exe_name="PokeBinder.exe", repo="Mir-Khan/pokebinder", manifest=True):
+    """
+    Writes a GitHub "latest release" for repo whose assets (the exe and, with
+    manifest=True, a SHA256SUMS for it) are served by the stand-in at
+    base_url. Point the app at it with TCG_GITHUB_API=<base_url>.
+    """
+    assets_url = f"{base_url}{ASSETS_PREFIX}/releases/v{version}"
+    assets = [{"name": exe_name, "size": len(exe_bytes), "browser_download_url": f"{assets_url}/{exe_name}"}]
+    save_response(root, f"{ASSETS_PREFIX}/releases/v{version}/{exe_name}", exe_bytes)
+    if manifest:
+        sums = f"{hashlib.sha256(exe_bytes).hexdigest()}  {exe_name}\n".encode()
+        save_response(root, f"{ASSETS_PREFIX}/releases/v{version}/SHA256SUMS", sums)
+        assets.append({"name": "SHA256SUMS", "size": len(sums), "browser_download_url": f"{assets_url}/SHA256SUMS"})
+    release = {"tag_name": f"v{version}", "name": f"v{version}", "body": f"Synthetic release {version}", "assets": assets}
+    save_response(root, f"/repos/{repo}/releases/latest", json.dumps(release).encode())
+    return release
+
+SYNTH_RARITIES = ["Common", "Uncommon", "Rare", "Double rare", "Illustration rare", "Special illustration rare", "Secret Rare"]
+SYNTH_TYPES = ["Fire", "Water", "Grass", "Lightning", "Psychic", "Fighting", "Darkness", "Metal", "Colorless"]
+
+def _synth_attributes(rng):
+    """Fields of a full /cards/{id} record that pokebinder.attributes indexes."""
+    return {"category": "Pokemon", "rarity": rng.choice(SYNTH_RARITIES), "types": [rng.choice(SYNTH_TYPES)],
+            "stage": rng.choice(["Basic", "Stage1", "Stage2"]), "hp": rng.randrange(3, 34) * 10,
+            "illustrator": f"Artist {rng.randrange(12)}", "regulationMark": rng.choice("FGH")}
+
+def _synth_jpegs(rng, count=8):
+    """A few noisy 245x342 JPEGs (close to real low.jpg sizes) reused across cards."""
+    import io
+    from PIL import Image
+    out = []
+    for i in range(count):
+        noise = Image.effect_noise((245, 342), 40 + 8 * i).convert("RGB")
+        tint = Image.new("RGB", noise.size, (rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+        buf = io.BytesIO(); Image.blend(noise, tint, 0.6).save(buf, "JPEG", quality=85)
+        out.append(buf.getvalue())
+    return out
+
+# ==========================================
+# COMMAND LINE
+# ==========================================
+def main(argv=None):
+    p = argparse.ArgumentParser(prog="pokebinder.standin", description="Local TCGDex stand-in server.")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    sp = sub.add_parser("serve", help="Replay a recording over HTTP")
+    sp.add_argument("root")
+    sp.add_argument("--host", default="127.0.0.1")
+    sp.add_argument("--port", type=int, default=8765)
+    sp.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    sp.add_argument("--jitter", type=float, default=0.0, help="Extra random delay, 0..JITTER seconds")
+    sp.add_argument("--error-rate", type=float, default=0.0, help="Share of requests that fail")
+    sp.add_argument("--error-status", type=int, default=503)
+    sp.add_argument("--slow-rate", type=float, default=0.0, help="Share of responses trickled out slowly")
+    sp.add_argument("--slow-bps", type=int, default=64 * 1024, help="Bytes per second for slow responses")
+    sp.add_argument("--match", help="Only inject faults on paths matching this regex")
+    sp.add_argument("--seed", type=int, default=0)
+
+    sp = sub.add_parser("record", help="Record responses from the real TCGDex API")
+    sp.add_argument("root")
+    sp.add_argument("--set", action="append", default=[], help="Set name (or \"series: NAME\") to record (repeatable)")
+    sp.add_argument("--search", action="append", default=[], help="Card name search to record (repeatable)")
+    sp.add_argument("--images", type=int, default=0, help="Images to record per set / search")
+
+    sp = sub.add_parser("synth", help="Write a synthetic recording (no network)")
+    sp.add_argument("root")
+    sp.add_argument("--sets", type=int, default=5)
+    sp.add_argument("--cards", type=int, default=120, help="Cards per set")
+    sp.add_argument("--no-images", action="store_true")
+
+    args = p.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s', stream=sys.stderr)
+
+    if args.command == "record":
+        n = record(args.root, args.set, args.search, args.images)
+        print(f"Recorded into {args.root} ({n} images)")
+    elif args.command == "synth":
+        sets = synth(args.root, args.sets, args.cards, not args.no_images)
+        print(f"Wrote {len(sets)} synthetic sets to {args.root}")
+    else:
+        standin = StandIn(args.root, args.host, args.port, args.latency, args.jitter, args.error_rate, args.error_status,
+                          args.slow_rate, args.slow_bps, args.seed, args.match)
+        print(f"TCGDEX_API_BASE={standin.api_base}")
+        print(f"TCGDEX_ASSETS_BASE={standin.assets_base}", flush=True)
+        try: standin.httpd.serve_forever()
+        except KeyboardInterrupt: pass
+        finally: standin.httpd.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+JSON persistence for all user profiles and their binders.
+"""
+import os, json, logging
+
+from . import perf
+from .model import Binder
+
+logger = logging.getLogger(__name__)
+
+# Data file for users and binders
+SAVE_FILE = "tcg_data.json"
+DEFAULT_LAYOUT = {"rows": 3, "cols": 3, "pages": 10}
+
+def new_user_data(pw="1234"):
+    return {
+        "pw": pw,
+        "binders": {"Main Binder": Binder()},
+        "order": ["Main Binder"],
+        "binder_layouts": {"Main Binder": dict(DEFAULT_LAYOUT)}
+    }
+
+@perf.timed("load_data")
+def load_data(path=SAVE_FILE):
+    if os.path.exists(path):
+        try:
+            with open(path, 'r') as f:
+                logger.info("Loading user data from file.")
+                data = json.load(f)
+            # Binders are kept sparse in memory (older files store padded lists)
+            for user_data in data.values():
+                layouts = user_data.get("binder_layouts", {})
+                user_data["binders"] = {
+                    n: Binder.from_json(b, layouts.get(n, {}).get("rows", 3) * layouts.get(n, {}).get("cols", 3))
+                    for n, b in user_data.get("binders", {}).items()
+                }
+            return data
+        except Exception as e:
+            logger.error(f"Failed to load JSON: {e}")
+            return {}
+    return {}
+
+@perf.timed("save_data")
+def save_data(data, path=SAVE_FILE):
+    try:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=4, default=lambda o: o.to_json())
+            logger.debug("Data saved successfully.")
+    except Exception as e:
+        logger.error(f"Failed to save data: {e}")
@@ -0,0 +1,90 @@
+"""
+Streaming bulk import / export of binders as CSV or JSON Lines.
+"""
+import csv, json
+
+from .model import Binder, card_number_of
+
+EXPORT_FIELDS = ["page", "slot", "id", "name", "card_number", "set_name", "set_id", "image"]
+
+def iter_collection_rows(path):
+    """Yields one row dict at a time from a .csv or .jsonl file (never reads the whole file)."""
+    if path.lower().endswith(('.jsonl', '.ndjson')):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line: yield json.loads(line)
+    else:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            yield from csv.DictReader(f)
+
+def read_collection(path, resolver, per_page=9, stats=None, batch_size=500):
+    """
+    Streams (card, slot index or None) pairs from an import file.
+    Rows need an 'id'; optional 'quantity' and 'page'/'slot' (1-based).
+    Rows without name/image are filled from the catalog in batches; ids the
+    catalog does not know are counted in stats["skipped"]. A page/slot outside
+    the binder's layout (page < 1, slot not in 1..per_page) is ignored, the
+    card goes to the first free slot and the row counts in stats["adjusted"].
+    """
+    stats = stats if stats is not None else {}
+    stats.setdefault("skipped", 0); stats.setdefault("adjusted", 0)
+    rows = iter_collection_rows(path)
+    while True:
+        batch = [r for _, r in zip(range(batch_size), rows)]
+        if not batch: break
+        need = {str(r.get('id') or '').strip() for r in batch if not (r.get('name') and r.get('image'))} - {''}
+        catalog = resolver.resolve(need) if need else {}
+
+        for row in batch:
+            cid = str(row.get('id') or '').strip()
+            if row.get('name') and row.get('image') and cid:
+                card = {k: str(row[k]).strip() for k in ('id', 'name', 'image', 'set_name', 'set_id', 'card_number') if row.get(k)}
+            elif cid in catalog:
+                card = dict(catalog[cid])
+            else:
+                stats["skipped"] += 1; continue
+
+            try: qty = max(1, int(row.get('quantity') or 1))
+            except ValueError: qty = 1
+            slot_idx = None
+            if row.get('page') or row.get('slot'):
+                try: page, slot = int(row['page']), int(row['slot'])
+                except (KeyError, TypeError, ValueError): page = slot = 0
+                if page >= 1 and 1 <= slot <= per_page: slot_idx = (page - 1) * per_page + slot - 1
+                else: stats["adjusted"] += 1
+
+            for n in range(qty):
+                yield card, slot_idx if n == 0 else None
+
+def place_imported(binder, entries):
+    """Places (card, slot index or None) pairs, honouring free requested slots. Returns the count."""
+    count = 0
+    for card, slot_idx in entries:
+        inst = Binder.new_instance(card)
+        if slot_idx is not None and slot_idx >= 0 and binder.get(slot_idx) is None: binder.place(slot_idx, inst)
+        else: binder.place_free(inst)
+        count += 1
+    return count
+
+def import_collection(path, binder, resolver, stats=None):
+    """Streams an import file straight into binder. Returns (imported, skipped); stats also gets "adjusted"."""
+    stats = stats if stats is not None else {}
+    imported = place_imported(binder, read_collection(path, resolver, binder.per_page, stats))
+    return imported, stats["skipped"]
+
+def export_collection(binder, path):
+    """Streams the binder's occupied slots to .csv or .jsonl. Returns the row count."""
+    count = 0
+    as_jsonl = path.lower().endswith(('.jsonl', '.ndjson'))
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = None if as_jsonl else csv.DictWriter(f, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+        if writer: writer.writeheader()
+        for idx, card in binder.items():
+            page, slot = divmod(idx, binder.per_page)
+            row = {"page": page + 1, "slot": slot + 1, **{k: card.get(k, "") for k in EXPORT_FIELDS[2:]}}
+            if not row["card_number"]: row["card_number"] = card_number_of(card)
+            if writer: writer.writerow(row)
+            else: f.write(json.dumps(row) + "\n")
+            count += 1
+    return count
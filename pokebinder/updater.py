@@ -0,0 +1,191 @@
+"""
+Self-update support: release metadata from the GitHub releases API and a
+resumable, verified download of the release executable. Nothing here
+touches Tk; the app drives it from a background thread.
+
+Release metadata is cached with its ETag, so a repeat check is a 304 that
+costs no rate limit. Downloads go to <dest>.part with 1 MiB reads; an
+interrupted one resumes with a Range request on the next attempt, but only
+for the same release (a sidecar records url, size and ETag). A
+release may carry a SHA256SUMS asset (sha256sum format, "<hex>  <file>");
+when it does, the download must match it before it replaces anything.
+
+Point TCG_GITHUB_API at a stand-in (see pokebinder.standin.synth_release)
+to exercise all of this offline.
+"""
+import os, json, time, hashlib, logging
+
+from . import perf
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API = os.environ.get("TCG_GITHUB_API", "https://api.github.com").rstrip("/")
+RELEASE_CACHE = "tcg_release_cache.json"
+MANIFEST_ASSET = "SHA256SUMS"
+CHUNK_SIZE = 1024 * 1024
+TIMEOUT = (5, 30) # connect, read (per chunk, not the whole download)
+
+class UpdateError(Exception):
+    """Download could not be completed or failed verification."""
+
+# ==========================================
+# RELEASE METADATA
+# ==========================================
+def _load_cache(path):
+    try:
+        with open(path, "r") as f: return json.load(f)
+    except FileNotFoundError: return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable release cache: {e}"); return {}
+
+def _save_cache(path, cache):
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w") as f: json.dump(cache, f)
+        os.replace(tmp, path)
+    except Exception as e:
+        logger.error(f"Failed to save release cache: {e}")
+
+def latest_release(repo, cache_path=RELEASE_CACHE, max_age=0, timeout=TIMEOUT):
+    """
+    Latest release JSON for a repo. Answered from the cache when it is younger
+    than max_age seconds, otherwise revalidated with If-None-Match.
+    """
+    import requests
+    url = f"{GITHUB_API}/repos/{repo}/releases/latest"
+    cache = _load_cache(cache_path)
+    entry = cache.get(url)
+    if entry and time.time() - entry.get("fetched", 0) < max_age:
+        perf.hit("release.cache", True)
+        return entry["release"]
+
+    headers = {"Accept": "application/vnd.github+json"}
+    if entry and entry.get("etag"): headers["If-None-Match"] = entry["etag"]
+    with perf.span("api.release"):
+        r = requests.get(url, headers=headers, timeout=timeout)
+    fresh = not (r.status_code == 304 and entry)
+    perf.hit("release.cache", not fresh)
+    if fresh:
+        r.raise_for_status()
+        entry = {"etag": r.headers.get("ETag"), "release": r.json()}
+    logger.debug("Release metadata %s", "fetched" if fresh else "revalidated (304)")
+    entry["fetched"] = time.time()
+    cache[url] = entry; _save_cache(cache_path, cache)
+    return entry["release"]
+
+def parse_release(data):
+    """Release JSON -> {version, notes, exe_name, exe_url, size, manifest_url}; exe_* are None without an .exe asset."""
+    assets = data.get("assets", [])
+    exe = next((a for a in assets if a["name"].endswith(".exe")), None)
+    manifest = next((a for a in assets if a["name"] == MANIFEST_ASSET), None)
+    return {"version": data["tag_name"].lstrip("v"), "notes": data.get("body") or "",
+            "exe_name": exe and exe["name"], "exe_url": exe and exe["browser_download_url"], "size": exe and exe.get("size"),
+            "manifest_url": manifest and manifest["browser_download_url"]}
+
+def parse_manifest(text):
+    """sha256sum output -> {file name: hex digest}."""
+    sums = {}
+    for line in text.splitlines():
+        parts = line.strip().split(None, 1)
+        if len(parts) == 2: sums[parts[1].lstrip("*")] = parts[0].lower()
+    return sums
+
+def expected_sha256(release, timeout=TIMEOUT):
+    """Digest the release manifest lists for its executable, or None if the release has no manifest."""
+    if not release["manifest_url"]: return None
+    import requests
+    r = requests.get(release["manifest_url"], timeout=timeout); r.raise_for_status()
+    digest = parse_manifest(r.text).get(release["exe_name"])
+    if digest is None: raise UpdateError(f"{MANIFEST_ASSET} does not list {release['exe_name']}")
+    return digest
+
+# ==========================================
+# DOWNLOAD
+# ==========================================
+def sha256_file(path, chunk_size=CHUNK_SIZE):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""): h.update(block)
+    return h.hexdigest()
+
+def _partial_state(part):
+    """The {url, size, etag} sidecar of a partial download, or None."""
+    try:
+        with open(part + ".json", "r") as f: return json.load(f)
+    except (OSError, ValueError): return None
+
+def _discard(part):
+    for p in (part, part + ".json"):
+        try: os.remove(p)
+        except FileNotFoundError: pass
+
+def _fetch_into(url, part, size, chunk_size, progress, yield_to):
+    """Appends the rest of url to part (or restarts it if the server ignores Range or the file changed)."""
+    import requests
+    have = os.path.getsize(part) if os.path.exists(part) else 0
+    state = _partial_state(part) or {}
+    if have and (state.get("url") != url or state.get("size") != size or (size and have > size)):
+        # Left by another release (or unknown origin): never splice it into this one
+        logger.info("Discarding partial download from a different release"); _discard(part); have, state = 0, {}
+    if size and have == size: return
+    headers = {"Range": f"bytes={have}-"} if have else {}
+    if have and state.get("etag"): headers["If-Range"] = state["etag"] # server sends it all again if the file changed
+    with requests.get(url, headers=headers, stream=True, timeout=TIMEOUT) as r:
+        if r.status_code == 416: return # nothing past `have`: already complete, the size / checksum checks decide
+        r.raise_for_status()
+        if have and r.status_code != 206:
+            logger.info("Server ignored the range request; restarting download"); have = 0
+        elif have: logger.info(f"Resuming download at {have} bytes")
+        with open(part + ".json", "w") as f: json.dump({"url": url, "size": size, "etag": r.headers.get("ETag")}, f)
+        length = int(r.headers.get("Content-Length") or 0)
+        total = have + length if length else size
+        done = have
+        with open(part, "ab" if have else "wb") as f:
+            for chunk in r.iter_content(chunk_size):
+                # Card images come first: hold off while the app is fetching any
+                while yield_to and yield_to(): time.sleep(0.05)
+                f.write(chunk); done += len(chunk)
+                if progress: progress(done, total)
+        if length and done < have + length:
+            raise ConnectionError(f"Connection closed at {done}/{have + length} bytes")
+
+def download(url, dest, sha256=None, size=None, chunk_size=CHUNK_SIZE, retries=3, progress=None, yield_to=None):
+    """
+    Downloads url to dest, resuming a <dest>.part left by an earlier try of
+    the same url and size (a <dest>.part.json sidecar records which).
+    progress(done, total) is called per chunk (total may be None); while
+    yield_to() is true the download pauses. Raises UpdateError on failure,
+    wrong size or checksum mismatch (the partial file is kept only in the
+    first case). Returns the file's SHA-256.
+    """
+    import requests
+    part = dest + ".part"
+    with perf.span("update.download"):
+        for attempt in range(retries + 1):
+            try:
+                _fetch_into(url, part, size, chunk_size, progress, yield_to); break
+            except (requests.RequestException, OSError) as e:
+                if attempt == retries: raise UpdateError(f"Download failed: {e}") from e
+                logger.warning(f"Download interrupted ({e}); retrying")
+                time.sleep(min(8, 2 ** attempt))
+
+    got = os.path.getsize(part)
+    if size and got != size:
+        _discard(part)
+        raise UpdateError(f"Size mismatch: expected {size} bytes, got {got}")
+    with perf.span("update.verify"):
+        digest = sha256_file(part)
+    if sha256 and digest != sha256.lower():
+        _discard(part)
+        raise UpdateError(f"Checksum mismatch: expected {sha256.lower()}, got {digest}")
+    os.replace(part, dest); _discard(part)
+    logger.info(f"Downloaded {dest} ({os.path.getsize(dest)} bytes, sha256 {digest})")
+    return digest
+
+def lower_thread_priority():
+    """Puts the calling thread in background mode on Windows (lower CPU and I/O priority). No-op elsewhere."""
+    try:
+        import ctypes
+        k32 = ctypes.windll.kernel32
+        k32.SetThreadPriority(k32.GetCurrentThread(), 0x00010000) # THREAD_MODE_BACKGROUND_BEGIN
+    except Exception: pass
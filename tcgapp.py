@@ -1,43 +1,68 @@
-import os, json, requests, webbrowser, threading, urllib.parse, re, logging, sys
+import os, time, json, webbrowser, threading, urllib.parse, logging, sys
+from collections import Counter, deque
+STARTUP_T0 = time.perf_counter() # Time-to-first-paint / time-to-interactive are measured from here
 import subprocess
-from logging.handlers import RotatingFileHandler
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
-from PIL import Image, ImageTk
+# requests and PIL are imported on first use: together they cost more than the rest of startup
+
+from pokebinder import catalog, logconfig, perf, storage, updater
+from pokebinder import CatalogResolver
+from pokebinder.collection import Collection
+from pokebinder.apicache import ResponseCache, SetNames
+from pokebinder.attributes import AttributeIndex, CardAttributes, is_attribute_query
+from pokebinder.images import ImageCache
+from pokebinder.pagesheets import PageSheets
+from pokebinder.session import Session
+from pokebinder.theme import ThemeRegistry
+from pokebinder.model import Binder, card_number_of, ensure_card_number, filter_cards
+from pokebinder.transfer import read_collection
 
 # --- SELF-TEST MODE ---
 # Used by the updater to verify the exe is valid before installing
 if "--self-test" in sys.argv:
     sys.exit(0)
 
+# --- COMMAND LINE MODE ---
+# Headless batch operations: tcgapp.py --cli <command> ... (see pokebinder/cli.py)
+if "--cli" in sys.argv:
+    from pokebinder.cli import main
+    sys.exit(main(sys.argv[sys.argv.index("--cli") + 1:]))
+
 # ==========================================
 # LOGGING CONFIGURATION
 # ==========================================
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        # Limit log file to 2MB, keep 1 backup file. 
-        # This prevents the log from ballooning in size over time.
-        RotatingFileHandler("tcg_debug.log", maxBytes=2*1024*1024, backupCount=1),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+# Records are queued and written by a background listener; levels per subsystem
+# come from TCG_LOG (see pokebinder/logconfig.py) and can be changed at runtime.
+# The pipeline itself is started off the UI thread during startup (TCGApp.load_in_background).
+LOG_FILE = "tcg_debug.log"
+logger = logging.getLogger("pokebinder.app")
+render_log = logging.getLogger("pokebinder.render")
+slot_log = logging.getLogger("pokebinder.render.slots") # per-slot events, sampled
+image_log = logging.getLogger("pokebinder.images")
 
-# Data file for users and binders
-SAVE_FILE = "tcg_data.json"
 CACHE_DIR = "card_cache"
 MAX_CACHE_FILES = 300 # Limit cache to 300 images to save disk space
+API_CACHE_DIR = "api_cache" # Set lists, sets and searches (pokebinder.apicache)
+API_CACHE_TTL = 24 * 3600 # Seconds before a cached response is refetched
+SET_NAMES_FILE = "tcg_set_names.json" # Set id -> name, for labelling search results
+SEARCH_STREAM_MS = 250 # While a search streams in, append results to the view this often
+CARD_ATTRS_FILE = "tcg_card_attrs.json" # Rarity / types / HP / illustrator ... per card id, for attribute filters
+RESIZE_SETTLE_MS = 120 # Relayout once a window / sash drag pauses this long
+RENDER_BUDGET_MS = 12 # Slot building per event-loop turn; clicks and typing are handled in between
+# Binder layouts with at least this many slots flip pages behind a pre-composited sheet (0 turns sheets off)
+PAGE_SHEET_MIN_SLOTS = int(os.environ.get("TCG_PAGE_SHEETS", "16"))
+BINDER_ROW_H = 26 # Side menu binder list row height
 
 # --- UPDATE CONFIGURATION ---
 # CHANGE ON NEW RELEASES
 CURRENT_VERSION = os.environ.get("TCG_APP_VERSION", "1.0.1")
 GITHUB_REPO = os.environ.get("TCG_GITHUB_REPO", "Mir-Khan/pokebinder")
 
-if not os.path.exists(CACHE_DIR): 
-    os.makedirs(CACHE_DIR)
-    logger.info(f"Created cache directory: {CACHE_DIR}")
+def ensure_cache_dir():
+    if not os.path.exists(CACHE_DIR): 
+        os.makedirs(CACHE_DIR)
+        logger.info(f"Created cache directory: {CACHE_DIR}")
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -51,8 +76,6 @@ def resource_path(relative_path):
 
 class TCGApp:
     def __init__(self, root):
-        logger.info("Initializing TCGApp...")
-        
         # --- Windows High DPI Fix (Makes it look good on Win 10/11) ---
         try:
             from ctypes import windll
@@ -71,19 +94,37 @@ class TCGApp:
         self.root.geometry("1600x900")
         
         # --- Drag and Drop State ---
-        self.drag_data = {"card": None, "origin_idx": None, "is_binder": False, "widget": None}
+        self.drag_data = {"card": None, "is_binder": False, "widget": None}
         self.drag_ghost = None
         self.last_hovered_slot = None
         
         # --- Application State ---
-        self.data = self.load_all_data()
+        # Binder logic and persistence live in the headless core (pokebinder.Collection),
+        # loaded in the background after the first paint (see finish_startup)
+        self.collection = None
+        self.data = {}
         self.authenticated = False 
-        
-        user_list = list(self.data.keys())
-        self.current_user = user_list[0] if user_list else "DefaultUser"
         self.current_binder_name = "Main Binder"
-        
-        self.ensure_user_exists()
+        self.ready = False
+        self.startup_marks = {}
+        self._startup_result = None
+        self.session = None # Last binder / page / search per profile (pokebinder.session)
+        self._session_timer = None
+        self.search_source = None # What the search pane shows: {"kind": "set" / "sets" / "search", ...}
+        self._warm_catalog = {} # source key -> (name, cards); None while a fetch is running
+        self.images = ImageCache(CACHE_DIR)
+        self.responses = ResponseCache(API_CACHE_DIR, ttl=API_CACHE_TTL) # repeat searches / set loads skip the network
+        self.search_gen = 0 # bumped by every set load / card search; older results are dropped when they land
+        self.set_names = SetNames(SET_NAMES_FILE, fetch_json=lambda url: self.responses.fetch_json(url, ttl=0))
+        self.card_attrs = CardAttributes(CARD_ATTRS_FILE)
+        self._attr_indexes = {} # "search" / "binder" -> (source key, AttributeIndex)
+        self._enriching = False
+        self._enrich_cancel = threading.Event() # set by the status bar's stop button, on close and on user switch
+        self._enrich_key = None; self._enrich_stopped = set() # (pane, source key) of the running fetch / of ones the user stopped
+        self.sheets = PageSheets(self.images) # whole binder pages, composited in the background
+        self._resize_pending = set() # canvases resized since the last relayout
+        self._resize_timer = None
+        self._scroll_pending = set()
 
         # --- UI Variables ---
         self.dark_mode = tk.BooleanVar(value=True)
@@ -111,6 +152,8 @@ class TCGApp:
                 "prog_100": "#69F0AE", "prog_75": "#66BB6A", "prog_50": "#FFCA28", "prog_25": "#FFA726", "prog_0": "#EF5350"
             }
         }
+        # Main-window widgets register their color roles here; apply_theme recolors them in place
+        self.theme = ThemeRegistry(self.themes, self.theme_name())
         
         self.b_rows, self.b_cols = tk.StringVar(value="3"), tk.StringVar(value="3")
         self.b_total_pages = tk.StringVar(value="10")
@@ -121,8 +164,13 @@ class TCGApp:
         self.max_search_pages_var = tk.StringVar(value="Max: 1")
         self.max_binder_pages_var = tk.StringVar(value="Max: 1")
         
-        self.binder_title_var = tk.StringVar(value=self.current_binder_name.upper())
+        self.binder_title_var = tk.StringVar(value="")
         
+        # --- Multi-select & batching ---
+        self.selected_binder = set() # Instance uids
+        self.selected_search = set() # Card ids
+        self.selection_var = tk.StringVar(value="0 in binder / 0 in search")
+
         # Debounce timers
         self._search_filter_timer = None
         self._binder_filter_timer = None
@@ -152,21 +200,236 @@ class TCGApp:
         # --- Card Data Containers ---
         self.full_set_data = [] 
         self.display_search_data = [] 
-        self.refresh_current_binder_lists()
         self.current_set_name = ""
-        
         self.menu_visible = True
+
+        # --- Fast startup: paint a themed shell now, build the UI once the data is loaded ---
+        self.show_splash()
+        threading.Thread(target=self.load_in_background, daemon=True).start()
+        self.root.after(15, self.poll_startup)
+
+    # ==========================================
+    # STARTUP
+    # ==========================================
+    def show_splash(self):
+        t = self.themes["lunar" if self.dark_mode.get() else "solar"]
+        self.root.configure(bg=t["bg"])
+        self.splash = tk.Label(self.root, text="PokeBinder\nLoading collection...", font=("Segoe UI", 16, "bold"), bg=t["bg"], fg=t["accent"])
+        self.splash.place(relx=0.5, rely=0.5, anchor="center")
+        self.splash.bind("<Expose>", self.on_first_paint)
+
+    def on_first_paint(self, event=None):
+        if "first_paint" not in self.startup_marks:
+            self.startup_marks["first_paint"] = time.perf_counter() - STARTUP_T0
+
+    def load_in_background(self):
+        """Everything the shell window does not need: logging, the cache directory and the data file."""
+        try:
+            logconfig.setup(LOG_FILE)
+            logger.info("Initializing TCGApp...")
+            ensure_cache_dir()
+            self.session = Session()
+            self._startup_result = Collection(storage.SAVE_FILE)
+            threading.Thread(target=self.set_names.warm, daemon=True).start()
+        except Exception as e:
+            logger.critical(f"Startup failed: {e}", exc_info=True)
+            self._startup_result = e
+
+    def poll_startup(self):
+        # Wait for the data, and for the shell to be painted (give up waiting on the paint after 1s)
+        painted = "first_paint" in self.startup_marks or time.perf_counter() - STARTUP_T0 > 1.0
+        if self._startup_result is None or not painted:
+            self.root.after(15, self.poll_startup); return
+        if isinstance(self._startup_result, Exception):
+            messagebox.showerror("Startup Failed", str(self._startup_result)); self.root.destroy(); return
+        self.finish_startup(self._startup_result)
+
+    def finish_startup(self, collection):
+        self.startup_marks["data_loaded"] = time.perf_counter() - STARTUP_T0
+        self.collection = collection
+        self.data = collection.data
+        self.current_binder_name = collection.ensure_user(self.current_binder_name)
+        self.refresh_current_binder_lists()
+
+        self.splash.destroy()
+        if self.session.dark_mode is not None: self.dark_mode.set(self.session.dark_mode)
         self.setup_ui()
         self.apply_theme()
         
         # --- Events ---
-        self.root.bind("<Configure>", lambda e: self.on_resize(e))
+        self.root.bind("<F12>", lambda e: self.toggle_perf_overlay())
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.root.after(100, self.switch_user)
 
-        # Start background cache cleanup
-        threading.Thread(target=self.cleanup_cache, daemon=True).start()
+        # The cache cleanup scans the whole directory and nothing needs it soon
+        self.root.after(5000, lambda: threading.Thread(target=self.cleanup_cache, daemon=True).start())
 
+        self.ready = True
+        self.root.after_idle(self.on_interactive)
         logger.info("UI Setup complete.")
+
+    def on_interactive(self):
+        marks = self.startup_marks
+        marks["interactive"] = time.perf_counter() - STARTUP_T0
+        for name, seconds in marks.items(): perf.record(f"startup.{name}", seconds)
+        logger.info("Startup: first paint %.0f ms, data loaded %.0f ms, interactive %.0f ms",
+                    marks.get("first_paint", 0) * 1000, marks["data_loaded"] * 1000, marks["interactive"] * 1000)
+        # Used by the benchmarks: print the timings and quit
+        if "--measure-startup" in sys.argv:
+            print(json.dumps({name: round(seconds * 1000, 1) for name, seconds in marks.items()}), flush=True)
+            self.root.destroy()
+
+    def on_close(self):
+        self._enrich_cancel.set()
+        if self._session_timer: self.root.after_cancel(self._session_timer)
+        if self.session is not None: self.session.save()
+        self.root.destroy()
+
+    # ==========================================
+    # SESSION RESTORE
+    # ==========================================
+    def session_state(self):
+        return {
+            "binder": self.current_binder_name,
+            "binder_page": self.binder_page,
+            "binder_filter": self.binder_filter_var.get(),
+            "search_source": self.search_source,
+            "search_page": self.search_page,
+            "search_filter": self.filter_var.get(),
+            "search_grid": [self.s_rows.get(), self.s_cols.get()],
+        }
+
+    def remember_session(self):
+        """Runs after every refresh; the file write is debounced."""
+        if not self.authenticated or self.session is None: return
+        if self.session.update(self.current_user, self.session_state()): self.schedule_session_save()
+
+    def schedule_session_save(self):
+        if self._session_timer: self.root.after_cancel(self._session_timer)
+        self._session_timer = self.root.after(1000, self.session.save)
+
+    @staticmethod
+    def source_key(source):
+        return json.dumps(source, sort_keys=True)
+
+    def fetch_search_source(self, source):
+        """(name, cards) for a saved search pane source. Hits the network: call off the UI thread."""
+        fetch_json = self.responses.fetch_json
+        if source["kind"] == "set": return catalog.load_set(source["id"], source.get("name"), fetch_json=fetch_json)
+        if source["kind"] == "sets":
+            groups = catalog.load_sets([{"id": i, "name": n} for i, n in source["sets"]], fetch_json)
+            return source["name"], [c for _, cards in groups if cards for c in cards]
+        return f"Search: {source['query']}", catalog.search_cards(source["query"], fetch_json=fetch_json, names=self.set_names)
+
+    def prefetch_search_source(self, source):
+        """Starts fetching a source into _warm_catalog unless it is already there or in flight."""
+        key = self.source_key(source)
+        if key in self._warm_catalog: return
+        self._warm_catalog[key] = None
+        def work():
+            try: self._warm_catalog[key] = self.fetch_search_source(source)
+            except Exception as e:
+                logger.warning(f"Could not fetch saved search {source}: {e}")
+                self._warm_catalog.pop(key, None)
+        threading.Thread(target=work, daemon=True).start()
+
+    @staticmethod
+    def page_of(cards, page, per_page, is_binder):
+        start = (page - 1) * per_page
+        if is_binder: return [c for c in (cards.get(i) for i in range(start, start + per_page)) if c is not None]
+        return cards[start:start + per_page]
+
+    def warm_session(self, user):
+        """
+        While the login dialog is open: fetch the saved search pane and download
+        / decode the images of the saved binder and search pages, so the view
+        after login renders from memory.
+        """
+        state = self.session.get(user) if self.session else {}
+        if not state: return
+        binder = self.data.get(user, {}).get("binders", {}).get(state.get("binder"))
+        logger.info(f"Warming last session of {user}")
+
+        source = state.get("search_source")
+        if source: self.prefetch_search_source(source)
+        key = source and self.source_key(source)
+
+        try: s_per = int(state["search_grid"][0]) * int(state["search_grid"][1])
+        except Exception: s_per = 9
+
+        page_cards = []
+        if binder is not None:
+            layout = {**storage.DEFAULT_LAYOUT, **self.data[user].get("binder_layouts", {}).get(state["binder"], {})}
+            q = state.get("binder_filter", "")
+            view = Binder(enumerate(filter_cards(binder, q))) if q.strip() else binder
+            page_cards = self.page_of(view, state.get("binder_page", 1), layout["rows"] * layout["cols"], True)
+
+        def work():
+            self.images.warm(page_cards)
+            # The search page needs the catalog first
+            deadline = time.perf_counter() + 30
+            while key and self._warm_catalog.get(key) is None and key in self._warm_catalog and time.perf_counter() < deadline:
+                time.sleep(0.05)
+            if key and self._warm_catalog.get(key):
+                _, cards = self._warm_catalog[key]
+                q = state.get("search_filter", "")
+                self.images.warm(self.page_of(filter_cards(cards, q) if q.strip() else cards, state.get("search_page", 1), s_per, False))
+        threading.Thread(target=work, daemon=True).start()
+
+    def set_filter_quietly(self, var, value, timer_attr):
+        """Sets a filter entry without triggering its debounced re-filter."""
+        var.set(value)
+        timer = getattr(self, timer_attr)
+        if timer: self.root.after_cancel(timer); setattr(self, timer_attr, None)
+
+    def restore_session(self, user):
+        """Puts a freshly logged in user back on their last binder page and search (no rendering here)."""
+        state = self.session.get(user) if self.session else {}
+        if state.get("binder") in self.data[user]["binders"]: self.current_binder_name = state["binder"]
+        self.binder_page = max(1, int(state.get("binder_page", 1)))
+        self.jump_binder_var.set(str(self.binder_page))
+        if state.get("search_grid"):
+            self.s_rows.set(str(state["search_grid"][0])); self.s_cols.set(str(state["search_grid"][1]))
+
+        self.refresh_current_binder_lists()
+        self.set_filter_quietly(self.binder_filter_var, state.get("binder_filter", ""), "_binder_filter_timer")
+        q = self.binder_filter_var.get()
+        if q.strip(): self.display_owned_cards = Binder(enumerate(self.binder_filtered(q)))
+
+        source = state.get("search_source")
+        if not source: return
+        self.set_filter_quietly(self.filter_var, state.get("search_filter", ""), "_search_filter_timer")
+        page = max(1, int(state.get("search_page", 1)))
+        warmed = self._warm_catalog.get(self.source_key(source))
+        if warmed:
+            self.restore_search(source, warmed, page)
+            return
+
+        # Not warmed yet: show the binder now and fill the search pane when the fetch lands
+        self.status_var.set("Restoring last search...")
+        self.prefetch_search_source(source)
+        key = self.source_key(source)
+        def wait():
+            if key not in self._warm_catalog:
+                self.status_var.set("Could not restore last search"); return
+            if self._warm_catalog[key] is None:
+                self.root.after(50, wait); return
+            self.restore_search(source, self._warm_catalog[key], page)
+            self.status_var.set("Ready")
+            self.refresh_view(target="search")
+        self.root.after(50, wait)
+
+    def restore_search(self, source, result, page):
+        name, cards = result
+        self.search_gen += 1
+        self.search_source = source
+        self.current_set_name = name
+        self.full_set_data = cards
+        q = self.filter_var.get()
+        self.display_search_data = self.search_filtered(q) if q.strip() else cards.copy()
+        self.selected_search.clear()
+        self.search_page = page
+        self.jump_search_var.set(str(page))
     
     def cleanup_cache(self):
         """Deletes oldest files if cache exceeds MAX_CACHE_FILES"""
@@ -191,15 +454,65 @@ class TCGApp:
         elif event.num == 5: canvas.yview_scroll(1, "units")
         else: canvas.yview_scroll(1 if event.delta < 0 else -1, "units")
 
-    def bind_tree_to_scroll(self, widget, canvas):
-        widget.bind("<MouseWheel>", lambda e: self._on_mousewheel(e, canvas))
-        widget.bind("<Button-4>", lambda e: self._on_mousewheel(e, canvas))
-        widget.bind("<Button-5>", lambda e: self._on_mousewheel(e, canvas))
-        for child in widget.winfo_children(): self.bind_tree_to_scroll(child, canvas)
+    @staticmethod
+    def route(widget, *tags):
+        """Puts a grid widget under its pane's bind tags (see bind_pane_events) instead of binding it directly."""
+        widget.bindtags((str(widget),) + tags + widget.bindtags()[1:])
 
     def on_resize(self, event):
-        if hasattr(self, 'left_pane'): self.update_scroll_region(self.left_pane['canvas'])
-        if hasattr(self, 'right_pane'): self.update_scroll_region(self.right_pane['canvas'])
+        """<Configure> of a pane canvas. A drag of the window edge or the sash sends a burst of these; only the last one relays out."""
+        self._resize_pending.add(event.widget)
+        if self._resize_timer: self.root.after_cancel(self._resize_timer)
+        self._resize_timer = self.root.after(RESIZE_SETTLE_MS, self.relayout)
+
+    @staticmethod
+    def slot_width(pane_width, cols):
+        return max(60, int((pane_width / cols) - 25))
+
+    def relayout(self):
+        """Resizes the slots of the panes that changed width, in place, and rescales their images from the local caches."""
+        self._resize_timer = None
+        pending, self._resize_pending = self._resize_pending, set()
+        for pane in [self.left_pane, self.right_pane]:
+            if pane['canvas'] not in pending: continue
+            cols = pane.get('cols')
+            card_w = self.slot_width(pane['canvas'].winfo_width(), cols) if cols else None
+            if card_w is None or card_w == pane.get('card_w'):
+                self.request_scroll_update(pane['canvas']); continue
+
+            self.drop_sheet(pane) # drawn for the old width
+            with perf.span("relayout"):
+                render_log.debug("relayout: card width %s -> %d", pane.get('card_w'), card_w)
+                pane['card_w'] = card_w; pane['layout_gen'] = pane.get('layout_gen', 0) + 1
+                if pane.get('render_job'): pane['render_job']['card_w'] = card_w # slots not built yet
+                jobs = []
+                for slot in pane['grid'].winfo_children():
+                    if not hasattr(slot, 'slot_index'): continue
+                    slot.configure(width=card_w, height=int(card_w * 1.4) + 85)
+                    if slot.title_lbl is not None: slot.title_lbl.configure(wraplength=card_w - 10)
+                    if slot.overlay is not None: slot.overlay.configure(wraplength=card_w)
+                    if slot.card is not None: jobs.append((slot.card, slot.img_lbl, slot.overflow))
+                self.rescale_images(pane, jobs, card_w - 10)
+            self.request_scroll_update(pane['canvas'])
+
+    def rescale_images(self, pane, jobs, width):
+        """Re-renders slot images at a new width from memory / card_cache only (no downloads); a newer layout cancels the rest."""
+        gen = pane['layout_gen']
+        def work():
+            for card, lbl, dim in jobs:
+                if pane['layout_gen'] != gen: return
+                perf.adjust("image.queue", 1)
+                self.update_label_image(lbl, self.get_cached_image(card, width, dim=dim, local_only=True), pane['canvas'])
+        if jobs: threading.Thread(target=work, daemon=True).start()
+
+    def request_scroll_update(self, canvas):
+        """Recomputes a canvas' scroll region once per idle pass, however many images land in between."""
+        if canvas in self._scroll_pending: return
+        self._scroll_pending.add(canvas)
+        def run():
+            self._scroll_pending.discard(canvas)
+            if canvas.winfo_exists(): self.update_scroll_region(canvas)
+        self.root.after_idle(run)
 
     def update_scroll_region(self, canvas):
         canvas.update_idletasks()
@@ -208,21 +521,17 @@ class TCGApp:
     # ==========================================
     # BINDER MANAGEMENT ACTIONS
     # ==========================================
+    def binder_layout(self):
+        """(rows, cols, pages) of the active binder, from the collection rather than the entry fields."""
+        layout = self.collection.layout(self.current_binder_name)
+        return layout["rows"], layout["cols"], layout["pages"]
+
     def apply_binder_grid(self):
         try:
             rows = int(self.b_rows.get())
             cols = int(self.b_cols.get())
             pages = int(self.b_total_pages.get())
-            if rows <= 0 or cols <= 0 or pages <= 0:
-                raise ValueError("Rows, columns, and pages must be positive integers.")
-            
-            logger.info(f"Applying binder grid: {rows} rows x {cols} cols x {pages} pages")
-            
-            # Save layout configuration
-            user_data = self.data[self.current_user]
-            if "binder_layouts" not in user_data: user_data["binder_layouts"] = {}
-            user_data["binder_layouts"][self.current_binder_name] = {"rows": rows, "cols": cols, "pages": pages}
-            self.save_all_data()
+            self.collection.set_layout(self.current_binder_name, rows, cols, pages)
             
             # Re-render the current page with the updated grid
             self.refresh_view(target="binder")
@@ -230,60 +539,21 @@ class TCGApp:
             logger.error(f"Invalid grid size: {e}")
             messagebox.showerror("Invalid Input", "Rows, columns, and pages must be positive integers.")
 
-
-
     def sort_binder(self):
-        logger.info(f"Sorting binder: {self.current_binder_name}")
-        self.owned_cards = [c for c in self.owned_cards if c.get('id') != 'empty']
-        self.owned_cards.sort(key=lambda x: x['name'].lower())
-        self.data[self.current_user]["binders"][self.current_binder_name] = self.owned_cards
-        self.save_all_data()
+        self.collection.sort_by_name(self.current_binder_name)
         self.apply_binder_filter(reset_page=False)
     
     def sort_binder_by_number(self):
-        logger.info(f"Sorting binder by number: {self.current_binder_name}")
-        
-        # 1. Ensure card_number exists for all cards (Data Migration)
-        for card in self.owned_cards:
-            if card.get('id') != 'empty' and 'card_number' not in card:
-                try:
-                    # Extract from ID (e.g. "me02-129" -> "129")
-                    if '-' in card['id']:
-                        card['card_number'] = card['id'].split('-')[-1]
-                    # Fallback: Extract from Image URL
-                    elif 'image' in card:
-                        match = re.search(r'/([^/]+)/low\.jpg', card['image'])
-                        if match: card['card_number'] = match.group(1)
-                    
-                    if 'card_number' not in card: card['card_number'] = "0"
-                except:
-                    card['card_number'] = "0"
-
-        # 2. Filter out empty slots
-        self.owned_cards = [c for c in self.owned_cards if c.get('id') != 'empty']
-        
-        # 3. Sort logic (handles "1", "2", "10" correctly instead of "1", "10", "2")
-        def get_num(c):
-            try: 
-                # Extract digits to handle variants like "12a"
-                s = str(c.get('card_number', '0'))
-                num_part = "".join(filter(str.isdigit, s))
-                return int(num_part) if num_part else 9999
-            except: return 9999
-
-        self.owned_cards.sort(key=get_num)
-        
-        # 4. Update and Save to Disk
-        self.data[self.current_user]["binders"][self.current_binder_name] = self.owned_cards
-        self.save_all_data()
+        self.collection.sort_by_number(self.current_binder_name)
+        self.apply_binder_filter(reset_page=False)
+
+    def compact_binder(self):
+        self.collection.compact(self.current_binder_name)
         self.apply_binder_filter(reset_page=False)
 
     def clear_binder(self):
         if messagebox.askyesno("Confirm", "Empty current binder?"):
-            logger.warning(f"User {self.current_user} cleared binder {self.current_binder_name}")
-            self.owned_cards.clear()
-            self.data[self.current_user]["binders"][self.current_binder_name] = self.owned_cards
-            self.save_all_data()
+            self.collection.clear(self.current_binder_name)
             self.apply_binder_filter(reset_page=True)
 
     def add_full_set_to_binder(self):
@@ -291,51 +561,173 @@ class TCGApp:
             logger.info("Add Full Set cancelled: No set data loaded.")
             return
         
-        try:
-            capacity = int(self.b_rows.get()) * int(self.b_cols.get()) * int(self.b_total_pages.get())
-            if len(self.owned_cards) + len(self.full_set_data) > capacity:
-                if not messagebox.askyesno("Capacity Warning", f"Adding this set will exceed your physical binder limit.\n\nContinue?"):
-                    return
-        except Exception as e: 
-            logger.error(f"Error calculating capacity: {e}")
+        if len(self.owned_cards) + len(self.full_set_data) > self.collection.capacity(self.current_binder_name):
+            if not messagebox.askyesno("Capacity Warning", f"Adding this set will exceed your physical binder limit.\n\nContinue?"):
+                return
 
         logger.info(f"Adding full set {self.current_set_name} to binder.")
-        self.owned_cards.extend(self.full_set_data)
-        self.save_all_data()
+        self.collection.add_cards(self.current_binder_name, self.full_set_data)
+        self.apply_binder_filter(reset_page=False)
+
+    def import_binder(self):
+        """Streams a CSV / JSON Lines file into the active binder with a single save at the end."""
+        if not self.authenticated: return
+        path = filedialog.askopenfilename(title="Import Cards", filetypes=[("Collection files", "*.csv *.jsonl *.ndjson"), ("All files", "*.*")])
+        if not path: return
+
+        binder_name = self.current_binder_name
+        per_page = self.owned_cards.per_page
+        self.status_var.set(f"Importing {os.path.basename(path)}...")
+        logger.info(f"Importing {path} into {binder_name}")
+
+        def work():
+            try:
+                # Parse and resolve off the UI thread; placement happens in one batch on it
+                stats = {}
+                staged = list(read_collection(path, CatalogResolver(), per_page, stats))
+                self.root.after(0, lambda: self._finish_import(binder_name, staged, stats["skipped"], stats["adjusted"]))
+            except Exception as e:
+                logger.error(f"Import failed: {e}")
+                self.root.after(0, lambda: self.status_var.set("Import failed"))
+        threading.Thread(target=work, daemon=True).start()
+
+    def _finish_import(self, binder_name, staged, skipped, adjusted=0):
+        if binder_name not in self.data[self.current_user]["binders"]: return
+        count = self.collection.place_staged(binder_name, staged)
+        logger.info(f"Imported {count} cards into {binder_name} ({skipped} rows skipped, {adjusted} out-of-range slots)")
+        self.status_var.set(f"Imported {count} cards" + (f", skipped {skipped} unknown rows" if skipped else "")
+                            + (f", {adjusted} placed in free slots" if adjusted else ""))
+        self.apply_binder_filter(reset_page=False)
+
+    def export_binder(self):
+        if not self.authenticated: return
+        path = filedialog.asksaveasfilename(title="Export Binder", defaultextension=".csv", initialfile=f"{self.current_binder_name}.csv",
+                                            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl")])
+        if not path: return
+        try:
+            count = self.collection.export_file(self.current_binder_name, path)
+            self.status_var.set(f"Exported {count} cards")
+        except Exception as e:
+            logger.error(f"Export failed: {e}")
+            messagebox.showerror("Export Failed", f"Error: {str(e)}")
+
+    # ==========================================
+    # MULTI-SELECT & BATCH OPERATIONS
+    # ==========================================
+    def toggle_select(self, event, pane):
+        """Ctrl+Click: toggles a card in the pane's selection without re-rendering."""
+        is_binder = pane['type'] == "binder"
+        slot = self.slot_of(event.widget)
+        if (is_binder and not self.authenticated) or slot is None or slot.card is None: return
+        sel = self.selected_binder if is_binder else self.selected_search
+        key = slot.card['uid'] if is_binder else slot.card['id']
+        if key in sel: sel.discard(key)
+        else: sel.add(key)
+
+        slot.selected = key in sel
+        self.theme.style(slot, highlightbackground="hl" if slot.selected else slot.border_role)
+        slot.configure(highlightthickness=4 if slot.selected else 2)
+        self.update_selection_status()
+
+    def select_page(self, type_name):
+        """Adds every card on the current page of a pane to its selection."""
+        if type_name == "binder":
+            if not self.authenticated: return
+            per = self.owned_cards.per_page; start = (self.binder_page - 1) * per
+            for idx in range(start, start + per):
+                card = self.display_owned_cards.get(idx)
+                if card is not None: self.selected_binder.add(card['uid'])
+            self.refresh_view(target="binder")
+        else:
+            per = int(self.s_rows.get()) * int(self.s_cols.get()); start = (self.search_page - 1) * per
+            self.selected_search.update(c['id'] for c in self.display_search_data[start:start + per])
+            self.refresh_view(target="search")
+        self.update_selection_status()
+
+    def clear_selection(self):
+        self.selected_binder.clear(); self.selected_search.clear()
+        self.update_selection_status()
+        self.refresh_view()
+
+    def update_selection_status(self):
+        self.selection_var.set(f"{len(self.selected_binder)} in binder / {len(self.selected_search)} in search")
+
+    def _selected_binder_uids(self):
+        """Selected instances of the active binder, in slot order."""
+        return [c['uid'] for c in self.owned_cards if c['uid'] in self.selected_binder]
+
+    def add_selected(self):
+        cards = [c for c in self.full_set_data if c['id'] in self.selected_search]
+        if not cards or not self.authenticated: return
+        if len(self.owned_cards) + len(cards) > self.collection.capacity(self.current_binder_name):
+            if not messagebox.askyesno("Capacity Warning", f"Adding {len(cards)} cards will exceed your physical binder limit.\n\nContinue?"):
+                return
+
+        logger.info(f"Batch add: {len(cards)} cards to {self.current_binder_name}")
+        self.collection.add_cards(self.current_binder_name, cards)
+        self.selected_search.clear(); self.update_selection_status()
+        self.apply_binder_filter(reset_page=False)
+        self.refresh_view(target="search")
+
+    def remove_selected(self):
+        uids = self._selected_binder_uids()
+        if not uids or not messagebox.askyesno("Confirm", f"Remove {len(uids)} selected cards?"): return
+        logger.info(f"Batch remove: {len(uids)} cards from {self.current_binder_name}")
+        self.collection.remove_cards(self.current_binder_name, uids)
+        self.selected_binder.clear(); self.update_selection_status()
+        self.apply_binder_filter(reset_page=False)
+
+    def move_selected_to_page(self):
+        uids = self._selected_binder_uids()
+        if not uids: return
+        target_page = simpledialog.askinteger("Move Cards", f"Move {len(uids)} cards to page:", minvalue=1, maxvalue=200)
+        if not target_page: return
+
+        logger.info(f"Batch move: {len(uids)} cards to page {target_page}")
+        self.collection.move_to_page(self.current_binder_name, uids, target_page)
+        self.selected_binder.clear(); self.update_selection_status()
+        self.apply_binder_filter(reset_page=False)
+
+    def show_move_to_binder_menu(self, event=None):
+        targets = [b for b in self.data[self.current_user]["order"] if b != self.current_binder_name]
+        if not self.selected_binder or not targets: return
+        menu = tk.Menu(self.root, tearoff=0)
+        for name in targets:
+            menu.add_command(label=f"📂 {name}", command=lambda n=name: self.move_selected_to_binder(n))
+        menu.post(self.root.winfo_pointerx(), self.root.winfo_pointery())
+
+    def move_selected_to_binder(self, target_name):
+        uids = self._selected_binder_uids()
+        if not uids: return
+        logger.info(f"Batch move: {len(uids)} cards from {self.current_binder_name} to {target_name}")
+        self.collection.move_to_binder(self.current_binder_name, uids, target_name)
+        self.selected_binder.clear(); self.update_selection_status()
         self.apply_binder_filter(reset_page=False)
 
     # ==========================================
     # DRAG AND DROP & CONTEXT MENUS
     # ==========================================
-    def show_binder_context_menu(self, event, card, idx):
+    def show_binder_context_menu(self, event, card):
         menu = tk.Menu(self.root, tearoff=0)
-        menu.add_command(label=f"Move {card['name']} to Page...", command=lambda: self.prompt_move_to_page(card, idx))
+        menu.add_command(label=f"Move {card['name']} to Page...", command=lambda: self.prompt_move_to_page(card))
         menu.add_separator()
         menu.add_command(label="Remove Card", command=lambda: self.remove_card_by_object(card))
         menu.post(event.x_root, event.y_root)
 
-    def prompt_move_to_page(self, card, origin_idx):
+    def prompt_move_to_page(self, card):
         target_page = simpledialog.askinteger("Move Card", "Enter Target Page Number:", minvalue=1, maxvalue=200)
         if target_page:
             logger.debug(f"Prompting move for {card['name']} to page {target_page}")
-            rows, cols = int(self.b_rows.get()), int(self.b_cols.get())
-            per_page = rows * cols
-            start_idx = (target_page - 1) * per_page
-            end_idx = start_idx + per_page
-            
-            found_slot = -1
-            for i in range(start_idx, end_idx):
-                if i >= len(self.owned_cards) or self.owned_cards[i].get('id') == 'empty':
-                    found_slot = i
-                    break
-            
-            if found_slot == -1: found_slot = end_idx
-            self.execute_move(card, origin_idx, found_slot, True)
+            found_slot = self.owned_cards.first_free_on_page(target_page - 1)
+            if found_slot is None:
+                messagebox.showinfo("Page Full", f"Page {target_page} has no empty slots.")
+                return
+            self.execute_move(card, found_slot, True)
 
     def on_drag_start(self, event, card, idx, is_binder):
         if is_binder and not self.authenticated: return
         logger.debug(f"Drag started: {card['name']} at index {idx}")
-        self.drag_data = {"card": card, "origin_idx": idx, "is_binder": is_binder}
+        self.drag_data = {"card": card, "is_binder": is_binder}
         self.drag_ghost = tk.Toplevel(self.root)
         self.drag_ghost.overrideredirect(True)
         self.drag_ghost.attributes("-alpha", 0.7)
@@ -356,20 +748,18 @@ class TCGApp:
                 grid_parent = curr; break
             curr = curr.master if hasattr(curr, 'master') else None
 
-        t = self.themes["lunar" if self.dark_mode.get() else "solar"]
+        t = self.theme.colors
+        rows, cols, _ = self.binder_layout()
         if self.last_hovered_slot:
-            slot_idx = getattr(self.last_hovered_slot, 'slot_index', 0)
-            try: capacity = int(self.b_rows.get()) * int(self.b_cols.get()) * int(self.b_total_pages.get())
-            except: capacity = 9999
-            border = t["overflow"] if slot_idx >= capacity else t["accent"]
-            self.last_hovered_slot.configure(highlightbackground=border)
+            # The hover color is never registered, so the slot's own role puts it back
+            border = "hl" if getattr(self.last_hovered_slot, 'selected', False) else getattr(self.last_hovered_slot, 'border_role', "accent")
+            self.last_hovered_slot.configure(highlightbackground=t[border])
             self.last_hovered_slot = None
 
         if grid_parent:
             rel_x = event.x_root - grid_parent.winfo_rootx()
             rel_y = event.y_root - grid_parent.winfo_rooty()
             try:
-                rows, cols = int(self.b_rows.get()), int(self.b_cols.get())
                 sample = grid_parent.winfo_children()[0]
                 sw, sh = sample.winfo_width() + 10, sample.winfo_height() + 10
                 c, r = rel_x // sw, rel_y // sh
@@ -400,7 +790,7 @@ class TCGApp:
             rel_x = event.x_root - grid_parent.winfo_rootx()
             rel_y = event.y_root - grid_parent.winfo_rooty()
             try:
-                rows, cols = int(self.b_rows.get()), int(self.b_cols.get())
+                rows, cols, _ = self.binder_layout()
                 per_page = rows * cols
                 sample = grid_parent.winfo_children()[0]
                 sw, sh = sample.winfo_width() + 10, sample.winfo_height() + 10
@@ -408,75 +798,52 @@ class TCGApp:
                 
                 if 0 <= drop_col < cols and 0 <= drop_row < rows:
                     target_idx = ((self.binder_page - 1) * per_page) + (drop_row * cols + drop_col)
+                    if self.display_owned_cards is not self.owned_cards:
+                        # Filtered view shows matches packed from slot 0: only drops onto a card map to a real slot
+                        target_card = self.display_owned_cards.get(target_idx)
+                        if target_card is None: return
+                        target_idx = self.owned_cards.index_of(target_card['uid'])
                     logger.info(f"Card dropped at target index {target_idx}")
-                    self.execute_move(self.drag_data['card'], self.drag_data['origin_idx'], target_idx, self.drag_data['is_binder'])
+                    self.execute_move(self.drag_data['card'], target_idx, self.drag_data['is_binder'])
             except Exception as e: 
                 logger.error(f"Drag release failed: {e}")
 
-    def execute_move(self, card, origin_idx, target_idx, was_in_binder):
-        logger.debug(f"Executing move: {card['name']} from {origin_idx} to {target_idx}")
-        
-        while len(self.owned_cards) <= target_idx:
-            self.owned_cards.append({"name": "Empty Slot", "id": "empty", "image": ""})
-
-        if was_in_binder and origin_idx is not None:
-            while len(self.owned_cards) <= origin_idx:
-                self.owned_cards.append({"name": "Empty Slot", "id": "empty", "image": ""})
-            self.owned_cards[origin_idx], self.owned_cards[target_idx] = self.owned_cards[target_idx], self.owned_cards[origin_idx]
+    def execute_move(self, card, target_idx, was_in_binder):
+        if was_in_binder:
+            # Resolve the exact dragged instance, not the first equal-looking card
+            logger.debug(f"Executing move: {card['name']} to {target_idx}")
+            if not self.collection.move_card(self.current_binder_name, card.get('uid'), target_idx): return
         else:
-            self.owned_cards[target_idx] = card
+            logger.debug(f"Executing move: {card['name']} from search to {target_idx}")
+            self.collection.place_card(self.current_binder_name, target_idx, card)
 
-        self.save_all_data()
         self.apply_binder_filter(reset_page=False)
 
     # ==========================================
     # DATA PERSISTENCE (JSON)
     # ==========================================
-    def load_all_data(self):
-        if os.path.exists(SAVE_FILE):
-            try:
-                with open(SAVE_FILE, 'r') as f: 
-                    logger.info("Loading user data from file.")
-                    return json.load(f)
-            except Exception as e: 
-                logger.error(f"Failed to load JSON: {e}")
-                return {}
-        return {}
-
-    def save_all_data(self):
-        try:
-            with open(SAVE_FILE, 'w') as f: 
-                json.dump(self.data, f, indent=4)
-                logger.info("Data saved successfully.")
-        except Exception as e:
-            logger.error(f"Failed to save data: {e}")
+    @property
+    def current_user(self):
+        return self.collection.user
 
-    def ensure_user_exists(self):
-        if not self.data:
-            self.data["DefaultUser"] = {"pw": "1234", "binders": {"Main Binder": []}, "order": ["Main Binder"], "binder_layouts": {"Main Binder": {"rows": 3, "cols": 3, "pages": 10}}}
-        if self.current_user not in self.data:
-            self.current_user = list(self.data.keys())[0]
-        user_data = self.data[self.current_user]
-        if "order" not in user_data: user_data["order"] = list(user_data["binders"].keys())
-        if "binder_layouts" not in user_data: user_data["binder_layouts"] = {}
-        
-        # Initialize theme preference if missing
-        if "dark_mode" not in user_data: user_data["dark_mode"] = True
+    @current_user.setter
+    def current_user(self, name):
+        self.collection.user = name
 
-        if self.current_binder_name not in user_data["binders"]:
-            self.current_binder_name = user_data["order"][0]
+    def save_all_data(self):
+        self.collection.save()
 
     def refresh_current_binder_lists(self):
-        self.owned_cards = self.data[self.current_user]["binders"][self.current_binder_name]
-        self.display_owned_cards = self.owned_cards.copy()
+        self.owned_cards = self.collection.binder(self.current_binder_name)
+        self.display_owned_cards = self.owned_cards
         self.binder_title_var.set(self.current_binder_name.upper())
         
-        # Load layout settings for this binder
-        layouts = self.data[self.current_user].get("binder_layouts", {})
-        layout = layouts.get(self.current_binder_name, {"rows": 3, "cols": 3, "pages": 10})
-        self.b_rows.set(str(layout.get("rows", 3)))
-        self.b_cols.set(str(layout.get("cols", 3)))
-        self.b_total_pages.set(str(layout.get("pages", 10)))
+        # Load layout settings for this binder into the entry fields
+        rows, cols, pages = self.binder_layout()
+        self.b_rows.set(str(rows))
+        self.b_cols.set(str(cols))
+        self.b_total_pages.set(str(pages))
+        if self.owned_cards.per_page != rows * cols: self.owned_cards.set_page_size(rows * cols)
     
     # ==========================================
     # AUTO-UPDATER LOGIC
@@ -490,72 +857,58 @@ class TCGApp:
         logger.info("Checking for updates...")
         def _check():
             try:
-                url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-                resp = requests.get(url, timeout=5)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    latest_tag = data['tag_name'].lstrip('v') # Remove 'v' if present
-                    
-                    # Simple version comparison
-                    if latest_tag != CURRENT_VERSION:
-                        # Find the .exe asset
-                        exe_url = next((a['browser_download_url'] for a in data['assets'] if a['name'].endswith('.exe')), None)
-                        
-                        if exe_url:
-                            self.root.after(0, lambda: self.prompt_update(latest_tag, exe_url, data['body']))
-                        elif not silent:
-                            self.root.after(0, lambda: messagebox.showinfo("Update", "New version detected, but no executable found."))
+                # Manual checks always revalidate (a 304 when nothing changed); silent ones trust the cache for an hour
+                release = updater.parse_release(updater.latest_release(GITHUB_REPO, max_age=3600 if silent else 0))
+                
+                # Simple version comparison
+                if release['version'] != CURRENT_VERSION:
+                    if release['exe_url']:
+                        self.root.after(0, lambda: self.prompt_update(release))
                     elif not silent:
-                        self.root.after(0, lambda: messagebox.showinfo("Up to Date", f"You are running the latest version ({CURRENT_VERSION})."))
+                        self.root.after(0, lambda: messagebox.showinfo("Update", "New version detected, but no executable found."))
+                elif not silent:
+                    self.root.after(0, lambda: messagebox.showinfo("Up to Date", f"You are running the latest version ({CURRENT_VERSION})."))
             except Exception as e:
                 logger.error(f"Update check failed: {e}")
                 if not silent: self.root.after(0, lambda: messagebox.showerror("Error", "Failed to check for updates."))
         
         threading.Thread(target=_check, daemon=True).start()
 
-    def prompt_update(self, version, url, notes):
-        msg = f"A new version ({version}) is available!\n\nRelease Notes:\n{notes}\n\nUpdate now?"
+    def prompt_update(self, release):
+        msg = f"A new version ({release['version']}) is available!\n\nRelease Notes:\n{release['notes']}\n\nUpdate now?"
         if messagebox.askyesno("Update Available", msg):
-            self.perform_update(url)
-
-    def perform_update(self, url):
-        """Downloads new exe and restarts."""
-        try:
-            # 1. Download the new executable
-            self.status_var.set("Downloading update...")
-            new_exe_name = "PokeBinder_new.exe"
-            
-            # Stream download to avoid freezing
-            def _download():
-                try:
-                    r = requests.get(url, stream=True)
-                    r.raise_for_status()
-                    
-                    total_size = int(r.headers.get('content-length', 0))
-                    downloaded = 0
-                    
-                    with open(new_exe_name, 'wb') as f:
-                        for chunk in r.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                    
-                    if total_size != 0 and downloaded != total_size:
-                        raise Exception(f"Incomplete download: {downloaded}/{total_size} bytes")
-
-                    logger.info("Download complete. proceeding to update.")
-                    self.root.after(0, self.finalize_update, new_exe_name)
-                    
-                except Exception as e:
-                    logger.error(f"Download failed: {e}")
-                    self.root.after(0, lambda: messagebox.showerror("Update Failed", f"Error: {str(e)}"))
-                    try: os.remove(new_exe_name)
-                    except: pass
-            
-            threading.Thread(target=_download, daemon=True).start()
-            
-        except Exception as e:
-            logger.error(f"Update init failed: {e}")
+            self.perform_update(release)
+
+    def perform_update(self, release):
+        """Downloads the new exe in the background (resumable, checksum-verified) and restarts."""
+        self.status_var.set("Downloading update...")
+        new_exe_name = "PokeBinder_new.exe"
+        
+        def _download():
+            updater.lower_thread_priority()
+            shown = [-1]
+            def progress(done, total):
+                pct = int(done * 100 / total) if total else -1
+                if pct != shown[0]:
+                    shown[0] = pct
+                    self.root.after(0, lambda: self.status_var.set(f"Downloading update... {pct}%" if pct >= 0 else f"Downloading update... {done // 1024} KB"))
+            try:
+                expected = updater.expected_sha256(release)
+                if expected is None: logger.warning(f"Release {release['version']} has no {updater.MANIFEST_ASSET}; download is not verified")
+                # Yield to card image downloads so browsing stays responsive while the update trickles in
+                updater.download(release['exe_url'], new_exe_name, sha256=expected, size=release['size'], progress=progress,
+                                 yield_to=lambda: self.images.downloading > 0)
+                logger.info("Download complete. proceeding to update.")
+                self.root.after(0, lambda: self.status_var.set("Update downloaded."))
+                self.root.after(0, self.finalize_update, new_exe_name)
+            except Exception as e:
+                # A partial download is kept and resumed by the next attempt
+                logger.error(f"Download failed: {e}")
+                msg = str(e)
+                self.root.after(0, lambda: self.status_var.set("Update failed."))
+                self.root.after(0, lambda: messagebox.showerror("Update Failed", f"Error: {msg}"))
+        
+        threading.Thread(target=_download, daemon=True).start()
 
     def finalize_update(self, new_exe):
         """Creates the batch script and restarts."""
@@ -613,33 +966,37 @@ del "%~f0" & exit
     # UI CONSTRUCTION
     # ==========================================
     def setup_ui(self):
-        t = self.themes["lunar" if self.dark_mode.get() else "solar"]
+        S = self.theme.style
+        S(self.root, bg="bg")
 
-        self.main_container = tk.Frame(self.root, bg=t["bg"])
+        self.main_container = S(tk.Frame(self.root), bg="bg")
         self.main_container.pack(fill="both", expand=True)
 
-        self.menu_frame = tk.Frame(self.main_container, width=220, bg=t["menu"])
+        self.menu_frame = S(tk.Frame(self.main_container, width=220), bg="menu")
         self.menu_frame.pack(side="left", fill="y")
         self.setup_side_menu()
 
-        self.content_frame = tk.Frame(self.main_container, bg=t["bg"])
+        self.content_frame = S(tk.Frame(self.main_container), bg="bg")
         self.content_frame.pack(side="right", fill="both", expand=True)
 
-        self.top = tk.Frame(self.content_frame, pady=5, bg=t["bg"])
+        self.top = S(tk.Frame(self.content_frame, pady=5), bg="bg")
         self.top.pack(fill="x", side="top")
         
-        self.menu_btn = tk.Button(self.top, text="☰", font=("Arial", 11, "bold"), command=self.toggle_menu, 
-                                  relief="flat", bg=t["btn"], fg=t["btn_text"], activebackground=t["hl"], activeforeground=t["bg"])
+        self.menu_btn = S(tk.Button(self.top, text="☰", font=("Arial", 11, "bold"), command=self.toggle_menu, relief="flat"),
+                          bg="btn", fg="btn_text", activebackground="hl", activeforeground="bg")
         self.menu_btn.pack(side="left", padx=10)
 
-        self.theme_btn = tk.Checkbutton(self.top, text="🌙 Theme", variable=self.dark_mode, command=self.apply_theme, 
-                                        indicatoron=False, bg=t["btn"], fg=t["text"], selectcolor=t["hl"], activebackground=t["hl"])
+        self.theme_btn = S(tk.Checkbutton(self.top, text="🌙 Theme", variable=self.dark_mode, command=self.toggle_theme, indicatoron=False),
+                           bg="btn", fg="text", selectcolor="hl", activebackground="hl")
         self.theme_btn.pack(side="right", padx=10)
 
-        self.status_lbl = tk.Label(self.top, textvariable=self.status_var, font=("Arial", 9, "italic"), bg=t["bg"], fg=t["text"])
+        self.status_lbl = S(tk.Label(self.top, textvariable=self.status_var, font=("Arial", 9, "italic")), bg="bg", fg="text")
         self.status_lbl.pack(side="right", padx=20)
+        # Shown next to the status only while card details are being fetched
+        self.enrich_stop_btn = S(tk.Button(self.top, text="✕ Stop", font=("Arial", 8), command=self.stop_enrich, relief="flat"),
+                                 bg="btn", fg="btn_text", activebackground="hl", activeforeground="bg")
         
-        self.paned = tk.PanedWindow(self.content_frame, orient="horizontal", sashwidth=4, bg=t["bg"], sashrelief="flat")
+        self.paned = S(tk.PanedWindow(self.content_frame, orient="horizontal", sashwidth=4, sashrelief="flat"), bg="bg")
         self.paned.pack(fill="both", expand=True)
         
         self.left_pane = self.create_scrollable_pane(self.paned, self.binder_title_var, "binder")
@@ -648,137 +1005,122 @@ del "%~f0" & exit
         self.setup_binder_header()
         self.setup_search_header()
 
+    # Shared header widgets (colors are palette roles, see pokebinder/theme.py)
+    def header_frame(self, parent, text):
+        f = self.theme.style(tk.LabelFrame(parent, text=text, font=("Segoe UI", 8, "bold"), padx=5, pady=2, relief="flat", bd=1), bg="bg", fg="frame_fg")
+        f.pack(side="left", padx=5, pady=2, fill="y")
+        return f
+
+    def header_entry(self, parent, width, var=None):
+        e = self.theme.style(tk.Entry(parent, width=width, textvariable=var, relief="flat", highlightthickness=1),
+                             bg="input_bg", fg="input_fg", insertbackground="input_fg", highlightbackground="frame_fg")
+        e.pack(side="left", padx=2, ipady=2)
+        return e
+
+    def header_btn(self, parent, text, cmd, bg_role):
+        b = self.theme.style(tk.Button(parent, text=text, command=cmd, font=("Arial", 8, "bold"), relief="flat", padx=8),
+                             bg=bg_role, fg="btn_text", activebackground="hl", activeforeground="bg")
+        b.pack(side="left", padx=2, pady=1)
+        return b
+
+    def header_label(self, parent, **kw):
+        return self.theme.style(tk.Label(parent, font=("Arial", 8), **kw), bg="bg", fg="text")
+
     def setup_binder_header(self):
         h = self.left_pane['header_tools']
-        for w in h.winfo_children(): w.destroy()
-        t = self.themes["lunar" if self.dark_mode.get() else "solar"]
-        
-        # Helper functions for consistent styling
-        def style_frame(parent, text):
-            f = tk.LabelFrame(parent, text=text, font=("Segoe UI", 8, "bold"), padx=5, pady=2, 
-                              bg=t["bg"], fg=t["frame_fg"], relief="flat", bd=1)
-            f.pack(side="left", padx=5, pady=2, fill="y")
-            return f
-
-        def style_entry(parent, var, width):
-            e = tk.Entry(parent, width=width, textvariable=var, bg=t["input_bg"], fg=t["input_fg"], 
-                         insertbackground=t["input_fg"], relief="flat", highlightthickness=1, highlightbackground=t["frame_fg"])
-            e.pack(side="left", padx=2, ipady=2)
-            return e
-
-        def style_btn(parent, text, cmd, bg_col):
-            b = tk.Button(parent, text=text, command=cmd, bg=bg_col, fg=t["btn_text"], 
-                          font=("Arial", 8, "bold"), relief="flat", activebackground=t["hl"], activeforeground=t["bg"], padx=8)
-            b.pack(side="left", padx=2, pady=1)
-            return b
+        frame, entry, btn, label = self.header_frame, self.header_entry, self.header_btn, self.header_label
         
         # --- Layout Controls Group ---
-        layout_frame = style_frame(h, "Grid Layout")
+        layout_frame = frame(h, "Grid Layout")
         
-        tk.Label(layout_frame, text="Rows:", font=("Arial", 8), bg=t["bg"], fg=t["text"]).pack(side="left")
-        style_entry(layout_frame, self.b_rows, 3)
-        tk.Label(layout_frame, text="Cols:", font=("Arial", 8), bg=t["bg"], fg=t["text"]).pack(side="left")
-        style_entry(layout_frame, self.b_cols, 3)
-        tk.Label(layout_frame, text="Pages:", font=("Arial", 8), bg=t["bg"], fg=t["text"]).pack(side="left", padx=(5, 2))
-        style_entry(layout_frame, self.b_total_pages, 4)
+        label(layout_frame, text="Rows:").pack(side="left")
+        entry(layout_frame, 3, self.b_rows)
+        label(layout_frame, text="Cols:").pack(side="left")
+        entry(layout_frame, 3, self.b_cols)
+        label(layout_frame, text="Pages:").pack(side="left", padx=(5, 2))
+        entry(layout_frame, 4, self.b_total_pages)
         
-        style_btn(layout_frame, "Apply", self.apply_binder_grid, t["btn_success"])
+        btn(layout_frame, "Apply", self.apply_binder_grid, "btn_success")
 
         # --- Binder Actions Group ---
-        action_frame = style_frame(h, "Actions")
+        action_frame = frame(h, "Actions")
+        
+        btn(action_frame, "Sort A-Z", self.sort_binder, "btn_neutral")
+        btn(action_frame, "Sort #", self.sort_binder_by_number, "btn_neutral")
+        btn(action_frame, "Compact", self.compact_binder, "btn_neutral")
+        btn(action_frame, "Clear All", self.clear_binder, "btn_danger")
+        btn(action_frame, "+ Add Loaded Set", self.add_full_set_to_binder, "btn_success")
+        btn(action_frame, "Import...", self.import_binder, "btn_info")
+        btn(action_frame, "Export...", self.export_binder, "btn_info")
+
+        # --- Selection Group (Ctrl+Click cards to select) ---
+        sel_frame = frame(h, "Selection (Ctrl+Click)")
+
+        label(sel_frame, textvariable=self.selection_var).pack(side="left", padx=(0, 4))
+        btn(sel_frame, "Select Page", lambda: self.select_page("binder"), "btn_neutral")
+        btn(sel_frame, "Move to Page", self.move_selected_to_page, "btn_info")
+        btn(sel_frame, "Move to Binder ▾", self.show_move_to_binder_menu, "btn_info")
+        btn(sel_frame, "Remove", self.remove_selected, "btn_danger")
+        btn(sel_frame, "Clear", self.clear_selection, "btn_neutral")
+
+    def placeholder_entry(self, parent, width, placeholder):
+        """Header entry showing a greyed-out hint while empty."""
+        e = self.header_entry(parent, width)
+        def on_focus_in(event):
+            if e.get() == placeholder:
+                e.delete(0, "end")
+                self.theme.style(e, fg="input_fg")
+        
+        def on_focus_out(event):
+            if not e.get():
+                e.insert(0, placeholder)
+                self.theme.style(e, fg="frame_fg")
         
-        style_btn(action_frame, "Sort A-Z", self.sort_binder, t["btn_neutral"])
-        style_btn(action_frame, "Sort #", self.sort_binder_by_number, t["btn_neutral"])
-        style_btn(action_frame, "Clear All", self.clear_binder, t["btn_danger"])
-        style_btn(action_frame, "+ Add Loaded Set", self.add_full_set_to_binder, t["btn_success"])
+        e.bind("<FocusIn>", on_focus_in)
+        e.bind("<FocusOut>", on_focus_out)
+        
+        # Initialize with placeholder
+        e.insert(0, placeholder)
+        self.theme.style(e, fg="frame_fg")
+        return e
 
     def setup_search_header(self):
-        # Preserve values during theme switch
-        # Check against placeholders to avoid saving them as actual values
-        raw_set = self.set_entry.get() if hasattr(self, 'set_entry') and self.set_entry.winfo_exists() else ""
-        current_set_val = raw_set if raw_set != "Name of set here..." else ""
-
-        raw_search = self.card_search_entry.get() if hasattr(self, 'card_search_entry') and self.card_search_entry.winfo_exists() else ""
-        current_search_val = raw_search if raw_search != "Card name..." else ""
-
         h = self.right_pane['header_tools']
-        for w in h.winfo_children(): w.destroy()
-        t = self.themes["lunar" if self.dark_mode.get() else "solar"]
-
-        # Helper functions (reused logic)
-        def style_frame(parent, text):
-            f = tk.LabelFrame(parent, text=text, font=("Segoe UI", 8, "bold"), padx=5, pady=2, 
-                              bg=t["bg"], fg=t["frame_fg"], relief="flat", bd=1)
-            f.pack(side="left", padx=5, pady=2, fill="y")
-            return f
-
-        def style_entry(parent, width, var=None, placeholder=None):
-            e = tk.Entry(parent, width=width, textvariable=var, bg=t["input_bg"], fg=t["input_fg"], 
-                         insertbackground=t["input_fg"], relief="flat", highlightthickness=1, highlightbackground=t["frame_fg"])
-            e.pack(side="left", padx=2, ipady=2)
-            
-            if placeholder and not var:
-                def on_focus_in(event):
-                    if e.get() == placeholder:
-                        e.delete(0, "end")
-                        e.config(fg=t["input_fg"])
-                
-                def on_focus_out(event):
-                    if not e.get():
-                        e.insert(0, placeholder)
-                        e.config(fg=t["frame_fg"])
-                
-                e.bind("<FocusIn>", on_focus_in)
-                e.bind("<FocusOut>", on_focus_out)
-                
-                # Initialize with placeholder
-                e.insert(0, placeholder)
-                e.config(fg=t["frame_fg"])
-            
-            return e
-
-        def style_btn(parent, text, cmd, bg_col):
-            b = tk.Button(parent, text=text, command=cmd, bg=bg_col, fg=t["btn_text"], 
-                          font=("Arial", 8, "bold"), relief="flat", activebackground=t["hl"], activeforeground=t["bg"], padx=8)
-            b.pack(side="left", padx=2, pady=1)
-            return b
+        frame, entry, btn, label = self.header_frame, self.header_entry, self.header_btn, self.header_label
         
         # --- Search Grid Group ---
-        view_frame = style_frame(h, "View")
+        view_frame = frame(h, "View")
         
-        tk.Label(view_frame, text="Rows:", font=("Arial", 8), bg=t["bg"], fg=t["text"]).pack(side="left")
-        style_entry(view_frame, 3, self.s_rows)
-        tk.Label(view_frame, text="Columns:", font=("Arial", 8), bg=t["bg"], fg=t["text"]).pack(side="left")
-        style_entry(view_frame, 3, self.s_cols)
-        style_btn(view_frame, "Set Search Grid", lambda: self.refresh_view(target="search"), t["btn_neutral"])
+        label(view_frame, text="Rows:").pack(side="left")
+        entry(view_frame, 3, self.s_rows)
+        label(view_frame, text="Columns:").pack(side="left")
+        entry(view_frame, 3, self.s_cols)
+        btn(view_frame, "Set Search Grid", lambda: self.refresh_view(target="search"), "btn_neutral")
 
         # --- Set Loader Group ---
-        load_frame = style_frame(h, "Load Set (TCGDex)")
+        load_frame = frame(h, "Load Set (TCGDex)")
         
-        self.set_entry = style_entry(load_frame, 18, placeholder="Name of set here...")
-        if current_set_val:
-            self.set_entry.delete(0, "end")
-            self.set_entry.insert(0, current_set_val)
-            self.set_entry.config(fg=t["input_fg"])
-            
+        self.set_entry = self.placeholder_entry(load_frame, 18, "Name of set here...")
         self.set_entry.bind("<Return>", self.handle_load)
-        style_btn(load_frame, "Load Set", self.handle_load, t["btn_info"])
+        btn(load_frame, "Load Set", self.handle_load, "btn_info")
 
         # --- Card Search Group ---
-        find_frame = style_frame(h, "Find Card")
+        find_frame = frame(h, "Find Card")
         
-        self.card_search_entry = style_entry(find_frame, 15, placeholder="Card name...")
-        if current_search_val:
-            self.card_search_entry.delete(0, "end")
-            self.card_search_entry.insert(0, current_search_val)
-            self.card_search_entry.config(fg=t["input_fg"])
-            
+        self.card_search_entry = self.placeholder_entry(find_frame, 15, "Card name...")
         self.card_search_entry.bind("<Return>", self.handle_card_search)
-        style_btn(find_frame, "Search", self.handle_card_search, t["btn_info"])
+        btn(find_frame, "Search", self.handle_card_search, "btn_info")
+
+        # --- Selection Group ---
+        sel_frame = frame(h, "Selection")
+
+        btn(sel_frame, "Select Page", lambda: self.select_page("search"), "btn_neutral")
+        btn(sel_frame, "Add Selected", self.add_selected, "btn_success")
 
          # --- Status ---
         # Use progress_scroll_var and fixed width to support scrolling text
-        self.progress_label = tk.Label(h, textvariable=self.progress_scroll_var, font=("Segoe UI", 9, "bold"), fg=t["owned"], bg=t["bg"], width=30, anchor="e")
+        self.progress_label = self.theme.style(tk.Label(h, textvariable=self.progress_scroll_var, font=("Segoe UI", 9, "bold"), width=30, anchor="e"),
+                                               fg="owned", bg="bg")
         self.progress_label.pack(side="right", padx=10)
 
     def toggle_menu(self):
@@ -787,247 +1129,500 @@ del "%~f0" & exit
         self.menu_visible = not self.menu_visible
 
     def setup_side_menu(self):
-        for w in self.menu_frame.winfo_children(): w.destroy()
-        t = self.themes["lunar" if self.dark_mode.get() else "solar"]
-        user_sec = tk.Frame(self.menu_frame, pady=10, bg=t["menu"])
+        """Built once; login, binder switches and edits only update it (see refresh_binder_list)."""
+        S = self.theme.style
+        self.menu_user_var = tk.StringVar(value=f"👤 {self.current_user}")
+        self.menu_binders_var = tk.StringVar(value="YOUR BINDERS")
+        self.binder_list_filter = tk.StringVar()
+        self._binder_rows, self._binder_row_items, self._binder_list_src = [], {}, None
+
+        user_sec = S(tk.Frame(self.menu_frame, pady=10), bg="menu")
         user_sec.pack(fill="x")
-        tk.Label(user_sec, text=f"👤 {self.current_user}", font=("Segoe UI", 11, "bold"), bg=t["menu"], fg=t["text"]).pack()
-        tk.Button(user_sec, text=f"v{CURRENT_VERSION} (Check Updates)", command=lambda: self.check_for_updates(silent=False), 
-                  font=("Arial", 7), bg=t["menu"], fg=t["accent"], relief="flat", cursor="hand2").pack(pady=2)
+        S(tk.Label(user_sec, textvariable=self.menu_user_var, font=("Segoe UI", 11, "bold")), bg="menu", fg="text").pack()
+        S(tk.Button(user_sec, text=f"v{CURRENT_VERSION} (Check Updates)", command=lambda: self.check_for_updates(silent=False), 
+                    font=("Arial", 7), relief="flat", cursor="hand2"), bg="menu", fg="accent").pack(pady=2)
         tk.Button(user_sec, text="Switch User", command=self.switch_user, font=("Arial", 8), bg="#555555", fg="white").pack(pady=5)
+        S(tk.Button(user_sec, text="🔍 Locate Card", command=self.open_locator, font=("Arial", 8, "bold"), fg="white", relief="flat"), bg="btn_info").pack(fill="x", padx=10)
+        S(tk.Button(user_sec, text="📊 Performance (F12)", command=self.toggle_perf_overlay, font=("Arial", 8), fg="white", relief="flat"), bg="btn_neutral").pack(fill="x", padx=10, pady=(3, 0))
         ttk.Separator(self.menu_frame, orient='horizontal').pack(fill='x', padx=10, pady=5)
-        tk.Label(self.menu_frame, text="YOUR BINDERS", font=("Arial", 9, "bold"), bg=t["menu"], fg=t["text"]).pack(pady=5)
-        for b_name in self.data[self.current_user]["order"]:
-            f = tk.Frame(self.menu_frame, bg=t["menu"]); f.pack(fill="x", pady=1, padx=5)
-            active = b_name == self.current_binder_name
-            btn_style = {"bg": "#3E4A89", "fg": "white"} if active else {"bg": "#DDDDDD", "fg": "black"}
-            tk.Button(f, text=f"📂 {b_name}", command=lambda n=b_name: self.select_binder(n), anchor="w", font=("Arial", 9), relief="flat", **btn_style).pack(side="left", fill="x", expand=True)
-            tk.Button(f, text="×", command=lambda n=b_name: self.delete_binder(n), bg="#8B0000", fg="white", relief="flat", width=2, font=("Arial", 10, "bold")).pack(side="right", padx=1)
-        tk.Button(self.menu_frame, text="+ Create New Binder", command=self.create_binder, bg="#2E7D32", fg="white", font=("Arial", 9, "bold")).pack(fill="x", padx=10, pady=(5, 20))
+        S(tk.Label(self.menu_frame, textvariable=self.menu_binders_var, font=("Arial", 9, "bold")), bg="menu", fg="text").pack(pady=5)
+
+        ent = S(tk.Entry(self.menu_frame, textvariable=self.binder_list_filter, relief="flat", highlightthickness=1),
+                bg="input_bg", fg="input_fg", insertbackground="input_fg", highlightbackground="frame_fg")
+        ent.pack(fill="x", padx=10, pady=(0, 4), ipady=2)
+        ent.bind("<Escape>", lambda e: self.binder_list_filter.set(""))
+        self.binder_list_filter.trace_add("write", lambda *a: self.refresh_binder_list())
+
+        tk.Button(self.menu_frame, text="+ Create New Binder", command=self.create_binder, bg="#2E7D32", fg="white", font=("Arial", 9, "bold")).pack(side="bottom", fill="x", padx=10, pady=(5, 20))
+
+        # Virtualized binder list: canvas items for the rows in view only
+        box = S(tk.Frame(self.menu_frame), bg="menu"); box.pack(fill="both", expand=True, padx=(5, 0))
+        c = self.binder_canvas = S(tk.Canvas(box, width=200, highlightthickness=0), bg="menu")
+        sb = ttk.Scrollbar(box, orient="vertical", command=lambda *a: (c.yview(*a), self.draw_binder_rows()))
+        c.configure(yscrollcommand=sb.set)
+        sb.pack(side="right", fill="y"); c.pack(side="left", fill="both", expand=True)
+        c.bind("<Configure>", lambda e: self.draw_binder_rows())
+        c.bind("<Button-1>", self.on_binder_list_click)
+        def wheel(e):
+            self._on_mousewheel(e, c); self.draw_binder_rows()
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"): c.bind(seq, wheel)
+        self.refresh_binder_list()
+
+    def refresh_binder_list(self):
+        """Re-filters the binder list if the names or the filter changed; otherwise just moves the active highlight."""
+        names = self.data[self.current_user]["order"]
+        src = (self.current_user, tuple(names), self.binder_list_filter.get().strip().lower())
+        self.menu_user_var.set(f"👤 {self.current_user}")
+        if src == self._binder_list_src:
+            self.mark_active_binder(); return
+        self._binder_list_src = src
+        q = src[2]
+        self._binder_rows = [n for n in names if q in n.lower()] if q else list(names)
+        self.menu_binders_var.set(f"YOUR BINDERS ({len(self._binder_rows)}/{len(names)})" if q else f"YOUR BINDERS ({len(names)})")
+        self.binder_canvas.configure(scrollregion=(0, 0, 0, len(self._binder_rows) * BINDER_ROW_H))
+        self.draw_binder_rows()
+
+    def binder_row_colors(self, name):
+        """(background, name text, count text) of a row."""
+        return ("#3E4A89", "white", "#C5CAE9") if name == self.current_binder_name else ("#DDDDDD", "black", "#555555")
+
+    def draw_binder_rows(self):
+        c, rows = self.binder_canvas, self._binder_rows
+        c.delete("row"); self._binder_row_items = {}
+        w = max(120, c.winfo_width()); h = c.winfo_height() or 400
+        top = max(0, int(c.canvasy(0)) // BINDER_ROW_H)
+        max_chars = max(6, (w - 70) // 7)
+        binders = self.data[self.current_user]["binders"]
+        for i in range(top, min(len(rows), top + h // BINDER_ROW_H + 2)):
+            name = rows[i]; y = i * BINDER_ROW_H; mid = y + BINDER_ROW_H // 2
+            bg, fg, count_fg = self.binder_row_colors(name)
+            label = name if len(name) <= max_chars else name[:max_chars - 1] + "…"
+            items = (c.create_rectangle(2, y + 1, w - 27, y + BINDER_ROW_H - 1, fill=bg, outline="", tags="row"),
+                     c.create_text(8, mid, text=f"📂 {label}", anchor="w", fill=fg, font=("Arial", 9), tags="row"),
+                     c.create_text(w - 32, mid, text=str(len(binders[name])), anchor="e", fill=count_fg, font=("Arial", 8), tags="row"))
+            c.create_rectangle(w - 25, y + 1, w - 3, y + BINDER_ROW_H - 1, fill="#8B0000", outline="", tags="row")
+            c.create_text(w - 14, mid, text="×", fill="white", font=("Arial", 10, "bold"), tags="row")
+            self._binder_row_items[name] = items
+
+    def mark_active_binder(self):
+        """Recolors the rows in view for the current binder and refreshes their card counts."""
+        c, binders = self.binder_canvas, self.data[self.current_user]["binders"]
+        for name, (bg_id, text_id, count_id) in self._binder_row_items.items():
+            bg, fg, count_fg = self.binder_row_colors(name)
+            c.itemconfigure(bg_id, fill=bg); c.itemconfigure(text_id, fill=fg)
+            c.itemconfigure(count_id, fill=count_fg, text=str(len(binders[name])))
+
+    def on_binder_list_click(self, event):
+        c = self.binder_canvas
+        i = int(c.canvasy(event.y)) // BINDER_ROW_H
+        if not 0 <= i < len(self._binder_rows): return
+        name = self._binder_rows[i]
+        if event.x >= max(120, c.winfo_width()) - 25: self.delete_binder(name)
+        else: self.select_binder(name)
 
     def create_scrollable_pane(self, parent, title_var, type_name):
-        t = self.themes["lunar" if self.dark_mode.get() else "solar"]
+        S = self.theme.style
         
-        frame = tk.Frame(parent, bg=t["bg"]); parent.add(frame, stretch="always")
-        header = tk.Frame(frame, bg=t["bg"]); header.pack(fill="x", pady=2)
+        frame = S(tk.Frame(parent), bg="bg"); parent.add(frame, stretch="always")
+        header = S(tk.Frame(frame), bg="bg"); header.pack(fill="x", pady=2)
         
-        tk.Label(header, textvariable=title_var, font=('Segoe UI', 10, 'bold'), bg=t["bg"], fg=t["text"]).pack(side="left", padx=10)
+        S(tk.Label(header, textvariable=title_var, font=('Segoe UI', 10, 'bold')), bg="bg", fg="text").pack(side="left", padx=10)
         
         # Filter Entry with Label
         if type_name == "binder":
-            tk.Label(header, text="Filter Binder:", font=("Arial", 8), bg=t["bg"], fg=t["text"]).pack(side="left", padx=(10, 2))
+            self.header_label(header, text="Filter Binder:").pack(side="left", padx=(10, 2))
             
-        tk.Entry(header, width=15 if type_name == "binder" else 10, textvariable=self.binder_filter_var if type_name == "binder" else self.filter_var,
-                 bg=t["input_bg"], fg=t["input_fg"], insertbackground=t["input_fg"], 
-                 relief="flat", highlightthickness=1, highlightbackground=t["frame_fg"]).pack(side="left", padx=2)
+        entry_roles = {"bg": "input_bg", "fg": "input_fg", "insertbackground": "input_fg", "highlightbackground": "frame_fg"}
+        S(tk.Entry(header, width=15 if type_name == "binder" else 10, textvariable=self.binder_filter_var if type_name == "binder" else self.filter_var,
+                   relief="flat", highlightthickness=1), **entry_roles).pack(side="left", padx=2)
         
-        nav = tk.Frame(header, bg=t["bg"]); nav.pack(side="right", padx=10)
+        nav = S(tk.Frame(header), bg="bg"); nav.pack(side="right", padx=10)
         
-        tk.Label(nav, textvariable=self.max_binder_pages_var if type_name == "binder" else self.max_search_pages_var, 
-                 font=("Arial", 8), bg=t["bg"], fg=t["text"]).pack(side="left", padx=5)
+        self.header_label(nav, textvariable=self.max_binder_pages_var if type_name == "binder" else self.max_search_pages_var).pack(side="left", padx=5)
         
-        btn_args = {"bg": t["btn"], "fg": t["btn_text"], "activebackground": t["hl"], "activeforeground": t["bg"], "relief": "flat", "font": ("Arial", 8)}
+        btn_roles = {"bg": "btn", "fg": "btn_text", "activebackground": "hl", "activeforeground": "bg"}
+        def nav_btn(text, cmd): return S(tk.Button(nav, text=text, command=cmd, relief="flat", font=("Arial", 8)), **btn_roles)
         
-        tk.Button(nav, text="|<<", command=lambda: self.go_to_first(type_name), **btn_args).pack(side="left", padx=1)
-        tk.Button(nav, text="<", command=lambda: self.change_page(type_name, -1), **btn_args).pack(side="left", padx=1)
+        nav_btn("|<<", lambda: self.go_to_first(type_name)).pack(side="left", padx=1)
+        nav_btn("<", lambda: self.change_page(type_name, -1)).pack(side="left", padx=1)
         
-        ent = tk.Entry(nav, width=3, textvariable=self.jump_binder_var if type_name == "binder" else self.jump_search_var,
-                       bg=t["input_bg"], fg=t["input_fg"], insertbackground=t["input_fg"], 
-                       relief="flat", highlightthickness=1, highlightbackground=t["frame_fg"])
+        ent = S(tk.Entry(nav, width=3, textvariable=self.jump_binder_var if type_name == "binder" else self.jump_search_var,
+                         relief="flat", highlightthickness=1), **entry_roles)
         ent.pack(side="left", padx=2); ent.bind("<Return>", lambda e: self.jump_to_page(type_name, e))
         
-        tk.Button(nav, text=">", command=lambda: self.change_page(type_name, 1), **btn_args).pack(side="left", padx=1)
-        tk.Button(nav, text=">>|", command=lambda: self.go_to_last(type_name), **btn_args).pack(side="left", padx=1)
+        nav_btn(">", lambda: self.change_page(type_name, 1)).pack(side="left", padx=1)
+        nav_btn(">>|", lambda: self.go_to_last(type_name)).pack(side="left", padx=1)
         
-        tools_row = tk.Frame(frame, bg=t["bg"]); tools_row.pack(fill="x", pady=2)
-        container = tk.Frame(frame, bg=t["bg"]); container.pack(fill="both", expand=True)
-        canvas = tk.Canvas(container, highlightthickness=0, bg=t["bg"])
+        tools_row = S(tk.Frame(frame), bg="bg"); tools_row.pack(fill="x", pady=2)
+        container = S(tk.Frame(frame), bg="bg"); container.pack(fill="both", expand=True)
+        canvas = S(tk.Canvas(container, highlightthickness=0), bg="bg")
+        canvas.bind("<Configure>", self.on_resize)
         v_scroll = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-        grid = tk.Frame(canvas, bg=t["bg"]); canvas.create_window((0, 0), window=grid, anchor="nw")
+        grid = S(tk.Frame(canvas), bg="bg"); canvas.create_window((0, 0), window=grid, anchor="nw")
         canvas.configure(yscrollcommand=v_scroll.set)
         canvas.pack(side="left", fill="both", expand=True); v_scroll.pack(side="right", fill="y")
-        return {"grid": grid, "canvas": canvas, "frame": frame, "header": header, "header_tools": tools_row, "container": container}
+        pane = {"grid": grid, "canvas": canvas, "frame": frame, "header": header, "header_tools": tools_row, "container": container,
+                "type": type_name, "slots": {}}
+        self.bind_pane_events(pane)
+        return pane
+
+    # ==========================================
+    # SLOT EVENT ROUTING
+    # ==========================================
+    # Grid widgets get no bindings or callbacks of their own. Each pane has two
+    # bind tags, bound once here, and handlers find the slot from event.widget.
+    def bind_pane_events(self, pane):
+        type_name = pane['type']; is_binder = type_name == "binder"
+        pane['slot_tag'], pane['scroll_tag'] = f"{type_name}_slot", f"{type_name}_scroll"
+        if not hasattr(self, '_slot_action_cmd'):
+            # Slot buttons run "<cmd> <pane> <action> <slot index>" instead of one lambda each
+            self._slot_action_cmd = self.root.register(self.on_slot_action)
+
+        scroll = lambda e, c=pane['canvas']: self._on_mousewheel(e, c)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"): self.root.bind_class(pane['scroll_tag'], seq, scroll)
+
+        tag = pane['slot_tag']
+        self.root.bind_class(tag, "<Button-1>", lambda e: self.on_slot_press(e, pane))
+        self.root.bind_class(tag, "<Control-Button-1>", lambda e: self.toggle_select(e, pane))
+        self.root.bind_class(tag, "<B1-Motion>", self.on_drag_motion)
+        self.root.bind_class(tag, "<ButtonRelease-1>", self.on_drag_release)
+        if is_binder: self.root.bind_class(tag, "<Button-3>", lambda e: self.on_slot_context(e, pane))
+        self.route(pane['grid'], pane['scroll_tag'])
+
+    @staticmethod
+    def slot_of(widget):
+        """The slot frame a grid widget belongs to (None outside a slot)."""
+        while widget is not None and not hasattr(widget, 'slot_index'): widget = getattr(widget, 'master', None)
+        return widget
+
+    def on_slot_press(self, event, pane):
+        slot = self.slot_of(event.widget)
+        if slot is not None and slot.card is not None:
+            self.on_drag_start(event, slot.card, slot.slot_index, pane['type'] == "binder")
+
+    def on_slot_context(self, event, pane):
+        slot = self.slot_of(event.widget)
+        if slot is not None and slot.card is not None: self.show_binder_context_menu(event, slot.card)
+
+    def on_slot_action(self, type_name, action, idx):
+        pane = self.left_pane if type_name == "binder" else self.right_pane
+        slot = pane['slots'].get(int(idx))
+        card = slot.card if slot is not None and slot.winfo_exists() else None
+        if card is None: return
+        if action == "remove": self.remove_card_by_object(card)
+        elif action == "add": self.quick_add(card)
+        elif action == "buy":
+            q = f"{card['name']} {card.get('set_name', '').title()}"
+            webbrowser.open(f"https://www.tcgplayer.com/search/all/product?q={urllib.parse.quote(q)}")
+
+    def slot_command(self, pane, action, idx):
+        return f"{self._slot_action_cmd} {pane['type']} {action} {idx}"
 
     # ==========================================
     # RENDERING & IMAGE CACHING
     # ==========================================
+    @perf.timed("render_side")
     def render_side(self, pane, data, page, is_binder, t, rows, cols):
-        # logger.info(f"This is the data being rendered: {data}")
+        render_log.debug("render_side: %s page %d (%dx%d)", "binder" if is_binder else "search", page, rows, cols)
         
         # Capture card number for sorting/logic
-        for card in data:
-            if card.get('id') != 'empty' and 'card_number' not in card:
-                try:
-                    # Extract from ID (e.g. "me02-129" -> "129")
-                    if '-' in card['id']:
-                        card['card_number'] = card['id'].split('-')[-1]
-                    # Fallback: Extract from Image URL
-                    elif 'image' in card:
-                        match = re.search(r'/([^/]+)/low\.jpg', card['image'])
-                        if match: card['card_number'] = match.group(1)
-                    
-                    if 'card_number' not in card: card['card_number'] = "0"
-                except:
-                    card['card_number'] = "0"
+        for card in (data.values() if is_binder else data): ensure_card_number(card)
 
+        S = self.theme.style
+        slot_tags = (pane['slot_tag'], pane['scroll_tag'])
+        locked = is_binder and not self.authenticated
+        pane_width = pane['canvas'].winfo_width() or 700
+        card_w = self.slot_width(pane_width, cols); per_page = rows * cols; offset = (page - 1) * per_page
+        capacity = self.collection.capacity(self.current_binder_name)
+        job = {"pane": pane, "data": data, "is_binder": is_binder, "page": page, "offset": offset, "per_page": per_page, "cols": cols,
+               "card_w": card_w, "capacity": capacity, "tags": slot_tags, "highlight": pane.pop('highlight', None),
+               "t0": time.perf_counter()}
+
+        # Same page, same geometry: only touch the slots whose contents changed
+        page_key = (self.current_binder_name if is_binder else None, page, rows, cols, capacity)
+        same_page = pane.get('page_key') == page_key and pane.get('card_w') == card_w and job['highlight'] is None
+        if not locked and same_page and self.patch_side(pane, job): return
+        pane['page_key'] = None if locked else page_key
+
+        self.cancel_render(pane)
+        self.theme.forget_children(pane['grid'])
         for w in pane['grid'].winfo_children(): w.destroy()
-        if is_binder and not self.authenticated:
+        pane['slots'] = {}
+        if locked:
             lock_path = os.path.join("img", "locked.png")
             if os.path.exists(lock_path):
                 try:
+                    from PIL import Image, ImageTk
                     pil_img = Image.open(lock_path)
                     pil_img.thumbnail((400, 400)) # Resize to reasonable dimensions
                     lock_photo = ImageTk.PhotoImage(pil_img)
-                    lbl = tk.Label(pane['grid'], image=lock_photo, bg=t["bg"])
+                    lbl = S(tk.Label(pane['grid'], image=lock_photo), bg="bg")
                     lbl.image = lock_photo # Keep reference to prevent garbage collection
-                    lbl.place(relx=0.5, rely=0.5, anchor="center")
+                    lbl.place(relx=0.5, rely=0.5, anchor="center"); self.route(lbl, pane['scroll_tag'])
                 except Exception as e:
                     logger.error(f"Failed to load locked image: {e}")
-                    tk.Label(pane['grid'], text="[ BINDER LOCKED ]", fg=t["accent"], bg=t["bg"], font=("Arial", 14)).place(relx=0.5, rely=0.5, anchor="center")
+                    S(tk.Label(pane['grid'], text="[ BINDER LOCKED ]", font=("Arial", 14)), fg="accent", bg="bg").place(relx=0.5, rely=0.5, anchor="center")
             else:
-                tk.Label(pane['grid'], text="[ BINDER LOCKED ]", fg=t["accent"], bg=t["bg"], font=("Arial", 14)).place(relx=0.5, rely=0.5, anchor="center"); return
-        
-        pane_width = pane['canvas'].winfo_width() or 700
-        card_w = int((pane_width / cols) - 25); per_page = rows * cols; offset = (page - 1) * per_page
-        try: capacity = rows * cols * int(self.b_total_pages.get())
-        except: capacity = 9999
-
-        for i in range(per_page):
-            idx = offset + i
-            r, c = divmod(i, cols)
+                S(tk.Label(pane['grid'], text="[ BINDER LOCKED ]", font=("Arial", 14)), fg="accent", bg="bg").place(relx=0.5, rely=0.5, anchor="center"); return
+
+        # relayout() resizes these slots in place when the pane width changes
+        pane['cols'], pane['card_w'] = cols, card_w
+        pane['layout_gen'] = pane.get('layout_gen', 0) + 1
+
+        # Large binder pages: show the composited page while the slots are built behind it
+        if self.uses_sheets(job):
+            key, sig, _ = self.sheet_for(page, job)
+            sheet = self.sheets.get(key, sig)
+            if sheet is not None: self.show_sheet(pane, job, sheet)
+
+        # Slots are built a few at a time by render_step, rows in view first
+        slot_h = int(card_w * 1.4) + 95
+        first = min(rows - 1, max(0, int(pane['canvas'].canvasy(0) // slot_h)))
+        job['queue'] = deque(r * cols + c for r in list(range(first, rows)) + list(range(first)) for c in range(cols))
+        pane['render_job'] = job
+        pane['render_after'] = self.root.after_idle(lambda: self.render_step(pane, job))
+
+    @staticmethod
+    def card_at(data, idx, is_binder):
+        if is_binder: return data.get(idx)
+        return data[idx] if idx < len(data) else None
+
+    def slot_is_current(self, slot, card, is_binder):
+        """Whether a built slot already shows this card (same instance, same selection state)."""
+        if slot is None or slot.card is not card: return False
+        if card is None: return True
+        key = card.get('uid') if is_binder else card['id']
+        return slot.selected == (key in (self.selected_binder if is_binder else self.selected_search))
+
+    def patch_side(self, pane, job):
+        """
+        Rebuilds only the slots of the displayed page that changed (a move or
+        swap is two, a remove one). Returns False, leaving the pane alone, when
+        most of the page changed or a render is still in progress.
+        """
+        if pane.get('render_job'): return False
+        is_binder, offset = job['is_binder'], job['offset']
+        dirty = [i for i in range(job['per_page'])
+                 if not self.slot_is_current(pane['slots'].get(offset + i), self.card_at(job['data'], offset + i, is_binder), is_binder)]
+        if len(dirty) > job['per_page'] // 2: return False
+        with perf.span("render.patch"):
+            for i in dirty:
+                old = pane['slots'].pop(offset + i, None)
+                if old is not None: self.theme.forget(old); old.destroy()
+                self.build_slot(pane, job, i)
+        perf.count("render.patched_slots", len(dirty))
+        render_log.debug("patch_side: %d of %d slots changed", len(dirty), job['per_page'])
+        if dirty: self.prepare_sheets(job)
+        return True
+
+    def cancel_render(self, pane):
+        """Abandons a page that is still being built (a newer render replaces it)."""
+        if pane.get('render_after'): self.root.after_cancel(pane['render_after'])
+        if pane.get('render_job'): perf.set_gauge(f"render.queue.{pane['type']}", 0)
+        pane['render_job'] = pane['render_after'] = None
+        self.drop_sheet(pane)
+
+    # --- Page sheets (pokebinder.pagesheets) ---
+    def uses_sheets(self, job):
+        return job['is_binder'] and self.authenticated and 0 < PAGE_SHEET_MIN_SLOTS <= job['per_page']
+
+    def sheet_for(self, page, job):
+        """(key, signature, slots) of a binder page as build_slot would draw it now."""
+        offset = (page - 1) * job['per_page']
+        slots = []
+        for idx in range(offset, offset + job['per_page']):
+            card = self.display_owned_cards.get(idx)
+            slots.append((card, card is not None and card.get('uid') in self.selected_binder, idx >= job['capacity']))
+        key = (self.current_binder_name, self.binder_filter_var.get(), page)
+        return key, self.sheets.signature(slots, job['cols'], job['card_w'], self.theme.name), slots
+
+    def prepare_sheets(self, job):
+        """Composes the pages either side of the one shown, and that page itself for coming back, in the background."""
+        if not self.uses_sheets(job): return
+        for page in (job['page'] + 1, job['page'] - 1, job['page']):
+            if page < 1: continue
+            key, sig, slots = self.sheet_for(page, job)
+            self.sheets.request(key, sig, slots, job['cols'], job['card_w'], dict(self.theme.colors))
+
+    def show_sheet(self, pane, job, sheet):
+        """
+        Covers the grid with a page's composite until its slots are built. The
+        first pointer event over it uncovers the real slots, so it never holds
+        up a click or drag.
+        """
+        from PIL import ImageTk
+        with perf.span("sheet.show"):
+            photo = ImageTk.PhotoImage(sheet)
+        lbl = tk.Label(pane['canvas'], image=photo, bd=0, highlightthickness=0); lbl.image = photo
+        self.route(lbl, pane['scroll_tag'])
+        for seq in ("<Motion>", "<ButtonPress>"): lbl.bind(seq, lambda e: self.drop_sheet(pane))
+        pane['sheet'] = (lbl, pane['canvas'].create_window((0, 0), window=lbl, anchor="nw"), job)
+        job['sheet'] = True
+
+    def drop_sheet(self, pane):
+        if pane.get('sheet'):
+            lbl, item, _ = pane['sheet']; pane['sheet'] = None
+            pane['canvas'].delete(item); lbl.destroy()
+
+    def settle_sheet(self, job):
+        """Removes a page's sheet once every slot is built (images still loading fill in on the slots)."""
+        pane = job['pane']
+        if job.get('sheet') and not job.get('queue') and pane.get('sheet') and pane['sheet'][2] is job:
+            self.drop_sheet(pane)
+
+    def rendering(self):
+        """True while either pane still has slots to build."""
+        return any(p.get('render_job') for p in (self.left_pane, self.right_pane))
+
+    def render_step(self, pane, job):
+        """Builds slots until the frame budget is spent, then yields to the event loop."""
+        if pane.get('render_job') is not job: return
+        deadline = time.perf_counter() + RENDER_BUDGET_MS / 1000
+        with perf.span("render.batch"):
+            while job['queue'] and time.perf_counter() < deadline:
+                self.build_slot(pane, job, job['queue'].popleft())
+        perf.set_gauge(f"render.queue.{pane['type']}", len(job['queue'])) # slots still to build
+        if job['queue']:
+            pane['render_after'] = self.root.after(1, lambda: self.render_step(pane, job)); return
+        pane['render_job'] = pane['render_after'] = None
+        perf.record("render_page", time.perf_counter() - job['t0'])
+        render_log.debug("render_page: %d slots in %.1f ms", job['per_page'], (time.perf_counter() - job['t0']) * 1000)
+        self.request_scroll_update(pane['canvas'])
+        self.settle_sheet(job); self.prepare_sheets(job)
+
+    def build_slot(self, pane, job, i):
+        S = self.theme.style
+        data, is_binder, cols, card_w, capacity, slot_tags = job['data'], job['is_binder'], job['cols'], job['card_w'], job['capacity'], job['tags']
+        per_page = job['per_page']; idx = job['offset'] + i
+        r, c = divmod(i, cols)
+
+        is_overflow = is_binder and idx >= capacity
+        border_role = "overflow" if is_overflow else "accent"
+
+        slot = S(tk.Frame(
+            pane['grid'],
+            highlightthickness=2,
+            width=card_w,
+            height=int(card_w * 1.4) + 85,
+        ), bg="card_bg", highlightbackground=border_role)
+        slot.grid(row=r, column=c, padx=5, pady=5)
+        slot.grid_propagate(False)
+        slot.slot_index = idx
+        slot.border_role = border_role
+        slot.selected = False
+        slot.card = slot.img_lbl = slot.title_lbl = slot.overlay = None
+        slot.overflow = is_overflow
+        if idx == job['highlight']: S(slot, highlightbackground="hl"); slot.configure(highlightthickness=4)
+        self.route(slot, *slot_tags); pane['slots'][idx] = slot
+
+        card = self.card_at(data, idx, is_binder)
+        if card is not None:
+            slot_log.debug("Rendering card at index %d: %s", idx, card['name'])
+            
+            # Format: Set Name, Card # - Card Name
+            s_name = card.get('set_name', 'Unknown Set')
+            c_num = card.get('card_number', '?')
+            disp_text = f"{s_name}, #{c_num} - {card['name']}"
+
+            slot.title_lbl = S(tk.Label(
+                slot,
+                text=disp_text,
+                font=('Arial', 7, 'bold'),
+                wraplength=card_w - 10,
+            ), bg="card_bg", fg="text")
+            slot.title_lbl.pack(pady=2)
+            img_lbl = S(tk.Label(slot, text="..."), bg="card_bg", fg="text")
+            img_lbl.pack(expand=True, fill="both")
+            slot.card, slot.img_lbl = card, img_lbl
+            self.route(slot.title_lbl, *slot_tags); self.route(img_lbl, *slot_tags)
+
+            key = card.get('uid') if is_binder else card['id']
+            if key in (self.selected_binder if is_binder else self.selected_search):
+                slot.selected = True
+                S(slot, highlightbackground="hl"); slot.configure(highlightthickness=4)
+
+
+            perf.adjust("image.queue", 1)
+            threading.Thread(
+                target=lambda c=card, l=img_lbl, w=card_w - 10, overflow=is_overflow: self.update_label_image(
+                    l, self.get_cached_image(c, w, dim=overflow), pane['canvas']
+                ),
+                daemon=True,
+            ).start()
 
-            border_color = t["accent"]
-            is_overflow = is_binder and idx >= capacity
             if is_overflow:
-                border_color = t["overflow"]
-
-            slot = tk.Frame(
-                pane['grid'],
-                bg=t["card_bg"],
-                highlightthickness=2,
-                highlightbackground=border_color,
-                width=card_w,
-                height=int(card_w * 1.4) + 85,
-            )
-            slot.grid(row=r, column=c, padx=5, pady=5)
-            slot.grid_propagate(False)
-            slot.slot_index = idx
-            slot.bind("<B1-Motion>", self.on_drag_motion)
-            slot.bind("<ButtonRelease-1>", self.on_drag_release)
-
-            if idx < len(data) and data[idx].get('id') != 'empty':
-                card = data[idx]
-                logger.info(f"Rendering card at index {idx}: {card['name']} with data {card}")
-                
-                # Format: Set Name, Card # - Card Name
-                s_name = card.get('set_name', 'Unknown Set')
-                c_num = card.get('card_number', '?')
-                disp_text = f"{s_name}, #{c_num} - {card['name']}"
-
-                tk.Label(
-                    slot,
-                    text=disp_text,
-                    bg=t["card_bg"],
-                    fg=t["text"],
-                    font=('Arial', 7, 'bold'),
-                    wraplength=card_w - 10,
-                ).pack(pady=2)
-                img_lbl = tk.Label(slot, text="...", bg=t["card_bg"], fg=t["text"])
-                img_lbl.pack(expand=True, fill="both")
-
-                for w in [img_lbl, slot]:
-                    w.bind("<Button-1>", lambda e, c=card, i=idx, b=is_binder: self.on_drag_start(e, c, i, b))
-                    w.bind("<B1-Motion>", self.on_drag_motion)
-                    w.bind("<ButtonRelease-1>", self.on_drag_release)
-                    if is_binder:
-                        w.bind("<Button-3>", lambda e, c=card, i=idx: self.show_binder_context_menu(e, c, i))
-
-                threading.Thread(
-                    target=lambda c=card, l=img_lbl, w=card_w - 10, overflow=is_overflow: self.update_label_image(
-                        l, self.get_cached_image(c, w, dim=overflow), pane['canvas']
-                    ),
-                    daemon=True,
-                ).start()
-
-                if is_overflow:
-                    overlay = tk.Label(
-                        slot,
-                        text="OVERFLOW",
-                        bg="#FF0000",  # Red background for overflow
-                        fg="#FFFFFF",
-                        font=("Arial", 10, "bold"),
-                        wraplength=card_w,
-                    )
-                    overlay.place(relx=0.5, rely=0.5, anchor="center", relwidth=1.0)
-
-                btn_f = tk.Frame(slot, bg=t["card_bg"])
-                btn_f.pack(side="bottom", fill="x", pady=2)
-                tk.Button(
-                    btn_f,
-                    text="X" if is_binder else "Add",
-                    command=lambda c=card: self.remove_card_by_object(c) if is_binder else self.quick_add(c),
-                    bg="#8B0000" if is_binder else t["btn"],
-                    fg="white",
-                    font=('Arial', 7),
-                ).pack(side="left", fill="x", expand=True)
-                search_q = f"{card['name']} {card.get('set_name', '').title()}"
-                tk.Button(
-                    btn_f,
-                    text="Buy",
-                    command=lambda q=search_q: webbrowser.open(
-                        f"https://www.tcgplayer.com/search/all/product?q={urllib.parse.quote(q)}"
-                    ),
-                    bg="#2B6CB0",
-                    fg="white",
-                    font=('Arial', 7),
-                ).pack(side="left", fill="x", expand=True)
-            else:
-                lbl_text = f"Page { (idx // per_page) + 1}\nSlot {idx + 1}"
-                if is_overflow:
-                    lbl_text += "\n(OVERFLOW)"
-                empty = tk.Label(
+                overlay = tk.Label(
                     slot,
-                    text=lbl_text,
-                    font=("Arial", 8),
-                    bg=t["card_bg"],
-                    fg=t["accent"] if idx < capacity else t["overflow"],
+                    text="OVERFLOW",
+                    bg="#FF0000",  # Red background for overflow
+                    fg="#FFFFFF",
+                    font=("Arial", 10, "bold"),
+                    wraplength=card_w,
                 )
-                empty.place(relx=0.5, rely=0.5, anchor="center")
-                empty.bind("<B1-Motion>", self.on_drag_motion)
-                empty.bind("<ButtonRelease-1>", self.on_drag_release)
-
-        self.update_scroll_region(pane['canvas'])
-        self.bind_tree_to_scroll(pane['grid'], pane['canvas'])
+                overlay.place(relx=0.5, rely=0.5, anchor="center", relwidth=1.0)
+                slot.overlay = overlay; self.route(overlay, *slot_tags)
+
+            btn_f = S(tk.Frame(slot), bg="card_bg")
+            btn_f.pack(side="bottom", fill="x", pady=2)
+            action = tk.Button(
+                btn_f,
+                text="X" if is_binder else "Add",
+                command=self.slot_command(pane, "remove" if is_binder else "add", idx),
+                bg="#8B0000",
+                fg="white",
+                font=('Arial', 7),
+            )
+            if not is_binder: S(action, bg="btn")
+            action.pack(side="left", fill="x", expand=True)
+            buy = tk.Button(
+                btn_f,
+                text="Buy",
+                command=self.slot_command(pane, "buy", idx),
+                bg="#2B6CB0",
+                fg="white",
+                font=('Arial', 7),
+            )
+            buy.pack(side="left", fill="x", expand=True)
+            self.route(btn_f, *slot_tags)
+            for b in (action, buy): self.route(b, pane['scroll_tag'])
+        else:
+            lbl_text = f"Page { (idx // per_page) + 1}\nSlot {idx + 1}"
+            if is_overflow:
+                lbl_text += "\n(OVERFLOW)"
+            empty = S(tk.Label(
+                slot,
+                text=lbl_text,
+                font=("Arial", 8),
+            ), bg="card_bg", fg="accent" if idx < capacity else "overflow")
+            empty.place(relx=0.5, rely=0.5, anchor="center")
+            self.route(empty, *slot_tags)
 
     def update_label_image(self, lbl, photo, canvas):
-        if photo: 
-            self.root.after(0, lambda: lbl.config(image=photo, text=""))
-            lbl.image = photo
-            self.root.after(100, lambda: self.update_scroll_region(canvas))
-
-    def get_cached_image(self, card, width, dim=False):
-        p = os.path.join(CACHE_DIR, f"{card['id']}.jpg")
-        if not os.path.exists(p):
-            try: 
-                logger.debug(f"Downloading image for card: {card['id']}")
-                r = requests.get(card['image'], timeout=5); open(p, "wb").write(r.content)
-            except Exception as e: 
-                logger.error(f"Image download failed for {card['id']}: {e}")
-                return None
-        
-        # Update file timestamp to mark as "recently used"
-        try: os.utime(p, None)
-        except: pass
-
+        perf.adjust("image.queue", -1)
+        if not photo: return
+        def apply():
+            if lbl.winfo_exists(): # else the slot was re-rendered meanwhile
+                lbl.config(image=photo, text=""); lbl.image = photo
+                self.request_scroll_update(canvas)
+        self.root.after(0, apply)
+
+    def get_cached_image(self, card, width, dim=False, local_only=False):
+        # Memory, then card_cache/, then the network (pokebinder.images); local_only never downloads
+        img = self.images.local(card) if local_only else self.images.decoded(card)
+        if img is None: return None
+
+        from PIL import Image, ImageTk
         try: 
-            img = Image.open(p).resize((width, int(width*1.4)), Image.Resampling.LANCZOS)
-            if dim:
-                from PIL import ImageEnhance
-                enhancer = ImageEnhance.Brightness(img)
-                img = enhancer.enhance(0.5)
-            return ImageTk.PhotoImage(img)
+            with perf.span("image.resize"):
+                img = img.resize((width, int(width*1.4)), Image.Resampling.LANCZOS)
+                if dim:
+                    from PIL import ImageEnhance
+                    enhancer = ImageEnhance.Brightness(img)
+                    img = enhancer.enhance(0.5)
+            with perf.span("image.photo"):
+                return ImageTk.PhotoImage(img)
         except Exception as e:
-            logger.error(f"Image processing failed for {p}: {e}")
+            image_log.error("Image processing failed for %s: %s", card['id'], e)
             return None
     # ==========================================
     # NAVIGATION & PAGINATION
@@ -1051,8 +1646,8 @@ del "%~f0" & exit
 
     def go_to_last(self, type_name):
         if type_name == "binder":
-            per = int(self.b_rows.get()) * int(self.b_cols.get())
-            max_b = (max(len(self.display_owned_cards), per * int(self.b_total_pages.get())) + per - 1) // per
+            rows, cols, pages = self.binder_layout(); per = rows * cols
+            max_b = (max(self.display_owned_cards.extent, per * pages) + per - 1) // per
             self.binder_page = max(1, max_b); self.jump_binder_var.set(str(self.binder_page))
             self.refresh_view(target="binder")
         else:
@@ -1078,7 +1673,8 @@ del "%~f0" & exit
     def select_binder(self, name):
         logger.info(f"Switching binder to: {name}")
         self.current_binder_name = name; self.binder_page = 1; self.jump_binder_var.set("1")
-        self.refresh_current_binder_lists(); self.setup_side_menu(); self.refresh_view(target="binder")
+        self.selected_binder.clear(); self.update_selection_status()
+        self.refresh_current_binder_lists(); self.refresh_binder_list(); self.refresh_view(target="binder")
 
     def create_binder(self):
         # Custom Dialog for New Binder
@@ -1115,19 +1711,12 @@ del "%~f0" & exit
             n = name_var.get().strip()
             if not n: return
             
-            if n in self.data[self.current_user]["binders"]:
-                messagebox.showerror("Error", "Binder name already exists!", parent=dialog)
+            try: self.collection.create_binder(n)
+            except ValueError as e:
+                messagebox.showerror("Error", str(e), parent=dialog)
                 return
 
-            logger.info(f"Creating new binder: {n}")
-            self.data[self.current_user]["binders"][n] = []
-            self.data[self.current_user]["order"].append(n)
-            
-            # Initialize default layout
-            if "binder_layouts" not in self.data[self.current_user]: self.data[self.current_user]["binder_layouts"] = {}
-            self.data[self.current_user]["binder_layouts"][n] = {"rows": 3, "cols": 3, "pages": 10}
-            
-            self.save_all_data(); self.select_binder(n)
+            self.select_binder(n)
             dialog.destroy()
 
         ent.bind("<Return>", submit)
@@ -1145,20 +1734,147 @@ del "%~f0" & exit
     def delete_binder(self, name):
         if len(self.data[self.current_user]["binders"]) <= 1: return
         if messagebox.askyesno("Confirm", f"Delete {name}?"):
-            logger.warning(f"Deleting binder: {name}")
-            del self.data[self.current_user]["binders"][name]
-            self.data[self.current_user]["order"].remove(name)
-            
-            # Remove layout info
-            if "binder_layouts" in self.data[self.current_user] and name in self.data[self.current_user]["binder_layouts"]:
-                del self.data[self.current_user]["binder_layouts"][name]
-                
+            self.collection.delete_binder(name)
             if self.current_binder_name == name: self.current_binder_name = self.data[self.current_user]["order"][0]
-            self.save_all_data(); self.select_binder(self.current_binder_name)
+            self.select_binder(self.current_binder_name)
+
+    def open_locator(self):
+        """'Where is this card?' dialog backed by the CardLocator index."""
+        if not self.authenticated:
+            messagebox.showinfo("Locked", "Log in to search your binders.")
+            return
+        S = self.theme.style
+        win = self.themed_dialog("Locate Card", "420x360")
+
+        S(tk.Label(win, text="Card name, #number or ID:", font=("Segoe UI", 9, "bold")), bg="bg", fg="text").pack(anchor="w", padx=10, pady=(10, 2))
+        q_var = tk.StringVar()
+        ent = S(tk.Entry(win, textvariable=q_var, font=("Segoe UI", 10), relief="flat", highlightthickness=1),
+                bg="input_bg", fg="input_fg", insertbackground="input_fg", highlightbackground="frame_fg")
+        ent.pack(fill="x", padx=10, ipady=3)
+        ent.focus_set()
+
+        results = S(tk.Listbox(win, font=("Segoe UI", 9), relief="flat", activestyle="none"), bg="input_bg", fg="input_fg", selectbackground="accent")
+        results.pack(fill="both", expand=True, padx=10, pady=5)
+        count_lbl = S(tk.Label(win, text="", font=("Arial", 8, "italic")), bg="bg", fg="frame_fg")
+        count_lbl.pack(anchor="w", padx=10, pady=(0, 8))
+        hits = []
+
+        def update_results(*args):
+            hits[:] = self.collection.locator.lookup(q_var.get())
+            results.delete(0, "end")
+            for b_name, idx, card in hits:
+                per = self.collection.per_page(b_name)
+                where = f"Page {idx // per + 1}, Slot {idx % per + 1}"
+                if idx >= self.collection.capacity(b_name): where += " (OVERFLOW)"
+                results.insert("end", f"{b_name} - {where}:  {card['name']} #{card_number_of(card)} ({card.get('set_name', '?')})")
+            count_lbl.config(text=f"{len(hits)} location(s)" if q_var.get().strip() else "")
+
+        def jump(event=None):
+            sel = results.curselection() or ((0,) if hits else ())
+            if not sel: return
+            b_name, idx, _ = hits[sel[0]]
+            self.locate_jump(b_name, idx)
+
+        q_var.trace_add("write", update_results)
+        ent.bind("<Return>", jump)
+        results.bind("<Double-Button-1>", jump)
+        results.bind("<Return>", jump)
+
+    def locate_jump(self, binder_name, idx):
+        """Opens the binder holding slot idx on the right page and highlights the slot."""
+        logger.info(f"Locator jump: {binder_name} slot {idx}")
+        # Page math is positional, so drop any active binder filter first
+        if self._binder_filter_timer:
+            self.root.after_cancel(self._binder_filter_timer); self._binder_filter_timer = None
+        if self.binder_filter_var.get():
+            self.binder_filter_var.set("")
+            self.root.after_cancel(self._binder_filter_timer); self._binder_filter_timer = None
+
+        if binder_name != self.current_binder_name:
+            self.current_binder_name = binder_name
+            self.refresh_current_binder_lists(); self.refresh_binder_list()
+        else:
+            self.display_owned_cards = self.owned_cards
+
+        # The slot is built later by the render scheduler, which applies the highlight
+        self.left_pane['highlight'] = idx
+        self.jump_binder_var.set(str(idx // self.owned_cards.per_page + 1))
+        self.jump_to_page("binder")
+
+    def toggle_perf_overlay(self):
+        """Live p50/p95 timings, cache hit rates and queue depths (pokebinder.perf)."""
+        win = getattr(self, 'perf_win', None)
+        if win is not None and win.winfo_exists():
+            win.destroy(); self.perf_win = None
+            return
+        S = self.theme.style
+        win = self.perf_win = self.themed_dialog("Performance", "520x420")
+        win.bind("<F12>", lambda e: self.toggle_perf_overlay())
+
+        text = S(tk.Text(win, font=("Consolas", 9), relief="flat", wrap="none"), bg="input_bg", fg="input_fg")
+        text.pack(fill="both", expand=True, padx=10, pady=(10, 5))
+        btn_f = S(tk.Frame(win), bg="bg"); btn_f.pack(fill="x", padx=10, pady=(0, 10))
+
+        def export():
+            path = filedialog.asksaveasfilename(parent=win, title="Export Timings", defaultextension=".jsonl",
+                                                initialfile="pokebinder_perf.jsonl", filetypes=[("JSON Lines", "*.jsonl")])
+            if path:
+                perf.export_jsonl(path, version=CURRENT_VERSION)
+                logger.info(f"Exported performance data to {path}")
+
+        def btn(text, cmd, role): return S(tk.Button(btn_f, text=text, command=cmd, relief="flat", font=("Arial", 8, "bold")), bg=role, fg="btn_text")
+        btn("Export JSONL", export, "btn_info").pack(side="left")
+        btn("Reset", perf.reset, "btn_neutral").pack(side="left", padx=5)
+        btn("Log Levels...", lambda: self.edit_log_levels(win), "btn_neutral").pack(side="right")
+
+        def tick():
+            if not win.winfo_exists(): return
+            text.delete("1.0", "end")
+            text.insert("1.0", perf.format_table() if perf.enabled else "Instrumentation is off (TCG_PERF=0).")
+            win.after(1000, tick)
+        tick()
+
+    def edit_log_levels(self, parent=None):
+        """Runtime log level / sampling editor (same spec format as TCG_LOG)."""
+        S = self.theme.style
+        win = self.themed_dialog("Log Levels", "460x170", parent)
+        S(tk.Label(win, text="LEVEL, logger=LEVEL[/N]  (N = keep 1 in N records)\nLoggers: " + ", ".join(logconfig.SUBSYSTEMS),
+                   font=("Segoe UI", 9), justify="left", wraplength=430), bg="bg", fg="text").pack(anchor="w", padx=10, pady=(10, 5))
+        spec_var = tk.StringVar(value=logconfig.current_spec())
+        ent = S(tk.Entry(win, textvariable=spec_var, font=("Consolas", 10), relief="flat", highlightthickness=1),
+                bg="input_bg", fg="input_fg", insertbackground="input_fg", highlightbackground="frame_fg")
+        ent.pack(fill="x", padx=10, ipady=3)
+        ent.focus_set()
+
+        def apply(event=None):
+            spec = spec_var.get().strip()
+            if not spec: return
+            try:
+                logconfig.configure(spec)
+                logger.info("Log levels set to: %s", logconfig.current_spec())
+                win.destroy()
+            except ValueError as e:
+                messagebox.showerror("Log Levels", str(e), parent=win)
+        ent.bind("<Return>", apply)
+        ent.bind("<Escape>", lambda e: win.destroy())
+
+        btn_f = S(tk.Frame(win), bg="bg"); btn_f.pack(pady=10)
+        S(tk.Button(btn_f, text="Apply", command=apply, relief="flat", font=("Segoe UI", 9, "bold"), padx=15), bg="btn_success", fg="btn_text").pack(side="left", padx=5)
+        S(tk.Button(btn_f, text="Cancel", command=win.destroy, relief="flat", font=("Segoe UI", 9), padx=10), bg="btn_danger", fg="btn_text").pack(side="left", padx=5)
+
+    def themed_dialog(self, title, geometry, parent=None):
+        """Non-modal Toplevel whose widgets follow the theme toggle (dropped from the registry when closed)."""
+        parent = parent or self.root
+        win = self.theme.style(tk.Toplevel(parent), bg="bg")
+        win.title(title); win.geometry(geometry); win.transient(parent)
+        icon_path = resource_path("app.ico")
+        if os.path.exists(icon_path): win.iconbitmap(icon_path)
+        win.bind("<Destroy>", lambda e: self.theme.forget(win) if e.widget is win else None)
+        return win
 
     def switch_user(self):
         logger.info("Opening Login Dialog")
-        self.authenticated = False; self.refresh_view()
+        self.authenticated = False; self.collection.logout(); self._enrich_cancel.set(); self.refresh_view()
         
         # Get current theme colors
         t = self.themes["lunar" if self.dark_mode.get() else "solar"]
@@ -1195,10 +1911,15 @@ del "%~f0" & exit
         tk.Label(form, text="Select Profile", font=("Arial", 8, "bold"), bg=t["bg"], fg=t["text"]).pack(anchor="w")
         
         u_list = list(self.data.keys())
-        u_var = tk.StringVar(value=self.current_user if self.current_user in u_list else (u_list[0] if u_list else ""))
+        last = self.session.last_user if self.session else None
+        default_user = last if last in u_list else self.current_user
+        u_var = tk.StringVar(value=default_user if default_user in u_list else (u_list[0] if u_list else ""))
         
         cb = ttk.Combobox(form, textvariable=u_var, values=u_list, state="readonly", font=("Segoe UI", 10))
         cb.pack(fill="x", pady=(2, 15), ipady=3)
+        # Warm the selected profile's last view while the password is typed
+        cb.bind("<<ComboboxSelected>>", lambda e: self.warm_session(u_var.get()))
+        self.warm_session(u_var.get())
 
         # Password Entry
         tk.Label(form, text="Password", font=("Arial", 8, "bold"), bg=t["bg"], fg=t["text"]).pack(anchor="w")
@@ -1214,15 +1935,18 @@ del "%~f0" & exit
 
         def login(event=None):
             u = u_var.get()
-            if u in self.data and self.data[u].get("pw") == pw_ent.get():
+            if self.collection.check_password(u, pw_ent.get()):
                 logger.info(f"User {u} authenticated successfully.")
-                self.authenticated = True; self.current_user = u; self.binder_page = 1; self.ensure_user_exists()
+                self.authenticated = True; self.current_user = u; self.binder_page = 1
+                self.current_binder_name = self.collection.ensure_user(self.current_binder_name)
+                self.collection.login(u)
                 
-                # Load saved theme preference
-                saved_theme = self.data[u].get("dark_mode", True)
-                self.dark_mode.set(saved_theme)
+                # The theme is app-wide once toggled; until then use the profile's old preference (session, then data file)
+                if self.session.dark_mode is None:
+                    self.dark_mode.set(self.session.get(u).get("dark_mode", self.data[u].get("dark_mode", True)))
 
-                self.refresh_current_binder_lists(); self.setup_side_menu(); self.apply_theme(); self.refresh_view(); win.destroy()
+                # Back to the last binder page / search
+                self.restore_session(u); self.refresh_binder_list(); self.apply_theme(); self.refresh_view(); win.destroy()
             else:
                 logger.warning(f"Failed login attempt for user: {u}")
                 err_lbl.config(text="Incorrect password")
@@ -1245,183 +1969,199 @@ del "%~f0" & exit
         nu = simpledialog.askstring("New User", "Username:")
         if nu and nu not in self.data:
             np = simpledialog.askstring("Pass", "Password:", show="*")
-            logger.info(f"Creating new user profile: {nu}")
-            self.data[nu] = {
-                "pw": np or "1234", 
-                "binders": {"Main Binder": []}, 
-                "order": ["Main Binder"],
-                "binder_layouts": {"Main Binder": {"rows": 3, "cols": 3, "pages": 10}}
-            }
-            self.save_all_data(); win.destroy(); self.switch_user()
+            self.collection.create_user(nu, np)
+            win.destroy(); self.switch_user()
 
     # ==========================================
     # API & EXTERNAL DATA LOADERS
     # ==========================================
+    def begin_search(self, status):
+        """Starts a set load / card search; returns its generation. Anything older is superseded."""
+        self.search_gen += 1
+        self.status_var.set(status)
+        return self.search_gen
+
+    def finish_search(self, gen, name=None, cards=None, source=None, status=None):
+        """Called from fetch threads: applies a result (or status) on the main thread unless a newer search started."""
+        def apply():
+            if gen != self.search_gen:
+                logger.debug(f"Dropping superseded result: {name or status}"); return
+            if cards is not None: self.show_search_results(name, cards, source)
+            if status: self.status_var.set(status)
+        self.root.after(0, apply)
+
+    def append_search_results(self, gen, batch, done=False):
+        """Called from fetch threads: adds streamed results behind the page already shown."""
+        def apply():
+            if gen != self.search_gen: return
+            try: per = int(self.s_rows.get()) * int(self.s_cols.get())
+            except ValueError: per = 9
+            page_was_full = len(self.display_search_data) >= self.search_page * per
+            self.full_set_data.extend(batch)
+            q = self.filter_var.get()
+            if is_attribute_query(q): self.display_search_data = self.search_filtered(q)
+            else: self.display_search_data.extend(filter_cards(batch, q) if q.strip() else batch)
+            if page_was_full:
+                self.max_search_pages_var.set(f"Max: {max(1, (len(self.display_search_data) + per - 1) // per)}")
+                self.update_progress()
+            else: self.refresh_view(target="search")
+            self.status_var.set("Ready" if done else f"Loading results... {len(self.full_set_data)} cards")
+        self.root.after(0, apply)
+
     def handle_load(self, event=None):
         q = self.set_entry.get().strip()
-        self.status_var.set(f"Searching Set: {q}...")
+        if "," in q or q.lower().startswith(catalog.SERIES_PREFIX): return self.load_many_sets(q)
+        gen = self.begin_search(f"Searching Set: {q}...")
         logger.info(f"API Request: Searching for set '{q}'")
+        fetch_json = self.responses.fetch_json
         def fetch():
             try:
-                res = requests.get("https://api.tcgdex.net/v2/en/sets").json()
-                match = next((s for s in res if q.lower() in s['name'].lower()), None)
+                match = catalog.find_set(q, catalog.list_sets(fetch_json))
                 
                 if not match:
-                    self.status_var.set("Set not found")
+                    self.finish_search(gen, status="Set not found")
                     return
 
-                full = requests.get(f"https://api.tcgdex.net/v2/en/sets/{match['id']}").json()
-                self.current_set_name = match['name']
-                self.full_set_data = [{'id': c['id'], 'name': c['name'], 'image': f"{c['image']}/low.jpg", 'set_name': self.current_set_name, 'set_id': match['id']} for c in full['cards']]
-                self.display_search_data = self.full_set_data.copy()
-                self.search_page = 1
-                self.jump_search_var.set("1")
-                
-                logger.info(f"Successfully loaded {len(self.full_set_data)} cards from {self.current_set_name}")
-                self.root.after(0, self.refresh_view(target="search"))
-                self.root.after(0, lambda: self.status_var.set("Ready"))
+                name, cards = catalog.load_set(match['id'], match['name'], fetch_json=fetch_json)
+                logger.info(f"Successfully loaded {len(cards)} cards from {name}")
+                self.finish_search(gen, name, cards, {"kind": "set", "id": match['id'], "name": name})
             except Exception as e: 
                 logger.error(f"Failed to fetch set data: {e}")
-                self.status_var.set("Load failed")
+                self.finish_search(gen, status="Load failed")
+        threading.Thread(target=fetch, daemon=True).start()
+
+    def load_many_sets(self, q):
+        """
+        "151, Obsidian Flames" or "series: Scarlet & Violet": fetches the sets
+        concurrently (catalog.LOAD_WORKERS at a time) and shows them as one
+        search pane, grouped set by set in the order asked for.
+        """
+        gen = self.begin_search(f"Finding sets: {q}...")
+        logger.info(f"API Request: Loading sets '{q}'")
+        fetch_json = self.responses.fetch_json
+        def fetch():
+            try:
+                sets, missing = catalog.resolve_sets(q, fetch_json)
+                if missing: logger.warning(f"No set matching: {', '.join(missing)}")
+                if not sets:
+                    self.finish_search(gen, status="Set not found")
+                    return
+
+                def progress(set_name, ok, done, total):
+                    self.finish_search(gen, status=f"Loading sets: {done}/{total} ({set_name}{'' if ok else ' failed'})")
+                groups = [(n, cards) for n, cards in catalog.load_sets(sets, fetch_json, progress=progress) if cards is not None]
+                if not groups:
+                    self.finish_search(gen, status="Load failed")
+                    return
+
+                names = [n for n, _ in groups]
+                name = " + ".join(names) if len(names) <= 3 else f"{names[0]} + {len(names) - 1} more sets"
+                cards = [c for _, group in groups for c in group]
+                logger.info(f"Loaded {len(cards)} cards from {len(groups)}/{len(sets)} sets")
+                skipped = len(sets) - len(groups) + len(missing)
+                source = {"kind": "sets", "sets": [[s['id'], s['name']] for s in sets], "name": name}
+                self.finish_search(gen, name, cards, source, status=f"Loaded {len(groups)} sets ({skipped} not loaded)" if skipped else None)
+            except Exception as e:
+                logger.error(f"Failed to load sets: {e}")
+                self.finish_search(gen, status="Load failed")
         threading.Thread(target=fetch, daemon=True).start()
 
     def handle_card_search(self, event=None):
         q = self.card_search_entry.get().strip()
         if not q: return
-        self.status_var.set(f"Searching Card: {q}...")
+        gen = self.begin_search(f"Searching Card: {q}...")
         logger.info(f"API Request: Searching for card '{q}'")
+        try: per_page = int(self.s_rows.get()) * int(self.s_cols.get())
+        except ValueError: per_page = 9
+        name, source = f"Search: {q}", {"kind": "search", "query": q}
         def fetch():
+            # Results are parsed as they download: the first page is shown as soon as it is
+            # filled and the rest is appended in batches (identical searches share one request)
             try:
-                # Search for cards by name
-                url = f"https://api.tcgdex.net/v2/en/cards?name={urllib.parse.quote(q)}"
-                res = requests.get(url).json()
+                t0 = last = time.perf_counter()
+                cards, sent = [], 0
+                for card in catalog.stream_search_cards(q, self.set_names, self.responses.stream_json):
+                    cards.append(card)
+                    if gen != self.search_gen: continue # superseded: keep reading so the response still gets cached
+                    now = time.perf_counter()
+                    if not sent and len(cards) >= per_page:
+                        perf.record("search.first_page", now - t0)
+                        self.finish_search(gen, name, cards[:], source, status=f"Loading results... {len(cards)} cards")
+                    elif sent and now - last >= SEARCH_STREAM_MS / 1000:
+                        self.append_search_results(gen, cards[sent:])
+                    else: continue
+                    sent, last = len(cards), now
                 
-                if not res:
-                    self.status_var.set("No cards found")
+                if not cards:
+                    self.finish_search(gen, status="No cards found")
                     return
 
-                # OPTIMIZATION: Load ALL set names once if not cached, 
-                # instead of making individual API requests for every card result.
-                if not hasattr(self, 'global_set_cache'):
-                    try:
-                        logger.debug("Fetching global set list for caching...")
-                        all_sets = requests.get("https://api.tcgdex.net/v2/en/sets").json()
-                        self.global_set_cache = {s['id']: s['name'] for s in all_sets}
-                    except: self.global_set_cache = {}
-
-                # Process results
-                cards = []
-                for c in res:
-                    # TCGDex search results usually have id, name, image (base url)
-                    if 'image' in c and c['image']:
-                        # Filter out TCG Pocket cards (identified by 'tcgp' in image path)
-                        if "/tcgp/" in c['image']:
-                            continue
-
-                        s_id = c.get('set', {}).get('id')
-                        if not s_id and '-' in c['id']:
-                            s_id = c['id'].split('-')[0]
-
-                        # Try to get existing set name, or lookup from global cache
-                        s_name = c.get('set', {}).get('name')
-                        
-                        # Use cached name if available and the API gave us a code/missing name
-                        if s_id and (not s_name or s_name == s_id):
-                            s_name = self.global_set_cache.get(s_id, s_id)
-
-                        cards.append({
-                            'id': c['id'],
-                            'name': c['name'],
-                            'image': f"{c['image']}/low.jpg",
-                            'set_name': s_name,
-                            'set_id': s_id
-                        })
-                
-                self.current_set_name = f"Search: {q}"
-                self.full_set_data = cards
-                self.display_search_data = self.full_set_data.copy()
-                self.search_page = 1
-                self.jump_search_var.set("1")
-                
                 logger.info(f"Found {len(cards)} cards matching '{q}'")
-                self.root.after(0, self.refresh_view(target="search"))
-                self.root.after(0, lambda: self.status_var.set("Ready"))
+                if sent: self.append_search_results(gen, cards[sent:], done=True)
+                else:
+                    perf.record("search.first_page", time.perf_counter() - t0)
+                    self.finish_search(gen, name, cards, source)
             except Exception as e:
                 logger.error(f"Card search failed: {e}")
-                self.status_var.set("Search failed")
+                self.finish_search(gen, status="Search failed")
         threading.Thread(target=fetch, daemon=True).start()
 
+    def show_search_results(self, name, cards, source=None):
+        """Main-thread half of a set load / card search."""
+        self.search_source = source
+        self.current_set_name = name
+        self.full_set_data = cards
+        # Keep the active filter (later streamed batches are filtered the same way)
+        q = self.filter_var.get()
+        self.display_search_data = self.search_filtered(q) if q.strip() else cards.copy()
+        self.selected_search.clear()
+        self.search_page = 1
+        self.jump_search_var.set("1")
+        self.refresh_view(target="search")
+        self.status_var.set("Ready")
+
     # ==========================================
     # VIEW UPDATES & FILTERING
     # ==========================================
-    def apply_theme(self):
-        # Save theme preference if user is logged in
-        if self.authenticated and self.current_user in self.data:
-            self.data[self.current_user]["dark_mode"] = self.dark_mode.get()
-            self.save_all_data()
+    def theme_name(self):
+        return "lunar" if self.dark_mode.get() else "solar"
 
-        t = self.themes["lunar" if self.dark_mode.get() else "solar"]
-        self.root.configure(bg=t["bg"]); self.menu_frame.configure(bg=t["menu"]); self.top.configure(bg=t["bg"])
-        
-        # Update Top Bar elements
-        self.menu_btn.configure(bg=t["btn"], fg=t["btn_text"], activebackground=t["hl"], activeforeground=t["bg"])
-        self.theme_btn.configure(bg=t["btn"], fg=t["text"], selectcolor=t["hl"], activebackground=t["hl"])
-        self.status_lbl.configure(bg=t["bg"], fg=t["text"])
+    def apply_theme(self):
+        """
+        Recolors the main window in place from the theme registry. Nothing is
+        rebuilt, so card images stay as they are.
+        """
+        with perf.span("apply_theme"): self.theme.restyle(self.theme_name())
 
-        for p in [self.left_pane, self.right_pane]:
-            # Update main containers
-            for comp in ["frame", "header", "header_tools", "container", "canvas", "grid"]: 
-                p[comp].configure(bg=t["bg"])
-            
-            # Update persistent header children (Title, Filter, Nav controls)
-            for child in p['header'].winfo_children():
-                if isinstance(child, tk.Label):
-                    child.configure(bg=t["bg"], fg=t["text"])
-                elif isinstance(child, tk.Entry):
-                    child.configure(bg=t["input_bg"], fg=t["input_fg"], insertbackground=t["input_fg"], highlightbackground=t["frame_fg"])
-                elif isinstance(child, tk.Frame): # This is the nav frame
-                    child.configure(bg=t["bg"])
-                    for nc in child.winfo_children():
-                        if isinstance(nc, tk.Label): 
-                            nc.configure(bg=t["bg"], fg=t["text"])
-                        elif isinstance(nc, tk.Button): 
-                            nc.configure(bg=t["btn"], fg=t["btn_text"], activebackground=t["hl"], activeforeground=t["bg"])
-                        elif isinstance(nc, tk.Entry): 
-                            nc.configure(bg=t["input_bg"], fg=t["input_fg"], insertbackground=t["input_fg"], highlightbackground=t["frame_fg"])
-        
-        # Rebuild headers and menu to apply new theme colors to buttons and entries
-        self.setup_binder_header()
-        self.setup_search_header()
-        self.setup_side_menu()
-        
-        self.refresh_view()
+    def toggle_theme(self):
+        """Theme button: the choice goes to the session file whether or not anyone is logged in."""
+        self.apply_theme()
+        if self.session.set_dark_mode(self.dark_mode.get()): self.schedule_session_save()
 
     def refresh_view(self, target="both"):
         """
         Refreshes the UI.
         target: "binder", "search", or "both"
         """
-        t = self.themes["lunar" if self.dark_mode.get() else "solar"]
+        t = self.theme.colors
         
         # --- Refresh Binder Side ---
         if target in ["binder", "both"]:
-            try:
-                pb = int(self.b_rows.get()) * int(self.b_cols.get())
-                # Calculate max pages based on content or fixed total pages setting
-                max_b = (max(len(self.display_owned_cards), pb * int(self.b_total_pages.get())) + pb - 1) // pb
-                self.max_binder_pages_var.set(f"Max: {max(1, max_b)}")
-                
-                self.render_side(
-                    self.left_pane, 
-                    self.display_owned_cards, 
-                    self.binder_page, 
-                    True, 
-                    t, 
-                    int(self.b_rows.get()), 
-                    int(self.b_cols.get())
-                )
-            except ValueError:
-                pass # Handle cases where entry widgets might be empty temporarily
+            rows, cols, pages = self.binder_layout(); pb = rows * cols
+            # Calculate max pages based on content or fixed total pages setting
+            max_b = (max(self.display_owned_cards.extent, pb * pages) + pb - 1) // pb
+            self.max_binder_pages_var.set(f"Max: {max(1, max_b)}")
+            self.mark_active_binder() # card counts in the side menu
+            
+            self.render_side(
+                self.left_pane, 
+                self.display_owned_cards, 
+                self.binder_page, 
+                True, 
+                t, 
+                rows, 
+                cols
+            )
 
         # --- Refresh Search Side ---
         if target in ["search", "both"]:
@@ -1443,90 +2183,89 @@ del "%~f0" & exit
                 pass
 
         self.update_progress()
+        self.remember_session()
 
     def quick_add(self, card): 
-        try:
-            capacity = int(self.b_rows.get()) * int(self.b_cols.get()) * int(self.b_total_pages.get())
-            if len(self.owned_cards) >= capacity:
-                if not messagebox.askyesno("Capacity Warning", f"Binder full. Add to digital overflow?"):
-                    return
-        except: pass
+        if self.owned_cards.first_free() >= self.collection.capacity(self.current_binder_name):
+            if not messagebox.askyesno("Capacity Warning", f"Binder full. Add to digital overflow?"):
+                return
         
         logger.info(f"Quick Add: {card['name']}")
-        self.owned_cards.append(card); self.save_all_data(); self.apply_binder_filter(reset_page=False)
+        self.collection.add_cards(self.current_binder_name, [card]); self.apply_binder_filter(reset_page=False)
         
     def remove_card_by_object(self, card_obj):
-        if card_obj in self.owned_cards: 
+        if self.collection.remove_cards(self.current_binder_name, [card_obj.get('uid')]):
             logger.info(f"Removing card: {card_obj['name']}")
-            self.owned_cards.remove(card_obj); self.save_all_data(); self.apply_binder_filter(reset_page=False)
+            self.apply_binder_filter(reset_page=False)
 
     def apply_filter(self):
-        q = self.filter_var.get().lower().strip()
-        
-        if not q:
-            self.display_search_data = self.full_set_data.copy()
-        else:
-            # Check if filtering by number (starts with # or is digit)
-            is_num_search = q.startswith('#') or q.isdigit()
-            
-            # Normalize search term: remove '#' and leading zeros
-            search_num = q.lstrip('#').lstrip('0') if is_num_search else ""
-            if is_num_search and search_num == "": search_num = "0"
-
-            filtered = []
-            for c in self.full_set_data:
-                if is_num_search:
-                    # Ensure card number exists (extract if missing)
-                    if 'card_number' not in c:
-                        try:
-                            if '-' in c['id']: c['card_number'] = c['id'].split('-')[-1]
-                            elif 'image' in c:
-                                match = re.search(r'/([^/]+)/low\.jpg', c['image'])
-                                if match: c['card_number'] = match.group(1)
-                            else: c['card_number'] = "0"
-                        except: c['card_number'] = "0"
-
-                    # Normalize card number
-                    c_num = str(c.get('card_number', '')).lstrip('0')
-                    if not c_num: c_num = "0"
-                    
-                    if c_num == search_num:
-                        filtered.append(c)
-                else:
-                    if q in c['name'].lower():
-                        filtered.append(c)
-            self.display_search_data = filtered
-
+        self.display_search_data = self.search_filtered(self.filter_var.get())
         self.search_page = 1; self.refresh_view(target="search")
 
+    def search_filtered(self, q):
+        return self.filtered("search", self.full_set_data, q, (id(self.full_set_data), len(self.full_set_data)))
+
+    def binder_filtered(self, q):
+        return self.filtered("binder", self.owned_cards, q, (self.current_binder_name, id(self.owned_cards), self.collection.revision))
+
+    def filtered(self, pane, cards, q, source_key):
+        """
+        filter_cards, or the pane's attribute index when the query has
+        key:value terms (rarity:secret type:fire hp>=100 missing ...). The index
+        is rebuilt only when the cards or the known attributes change; cards
+        without attributes yet are fetched in the background.
+        """
+        if not is_attribute_query(q): return filter_cards(cards, q)
+        key = (source_key, self.card_attrs.version)
+        cached = self._attr_indexes.get(pane)
+        if cached is None or cached[0] != key:
+            cached = self._attr_indexes[pane] = (key, AttributeIndex(cards, self.card_attrs))
+        if (pane, source_key) not in self._enrich_stopped: self.enrich_attributes(cached[1].cards, (pane, source_key))
+        return cached[1].filter(q, owned_ids={c['id'] for c in self.owned_cards.values()})
+
+    def enrich_attributes(self, cards, key=None):
+        """
+        Fetches missing card attributes off the UI thread (rate limited, see
+        CardAttributes.enrich), then re-runs both filters. The status bar
+        shows progress and a stop button; what arrived so far is kept.
+        """
+        if self._enriching or not self.card_attrs.missing(c['id'] for c in cards): return
+        self._enriching = True; self._enrich_key = key
+        self._enrich_cancel.clear()
+        self.enrich_stop_btn.pack(side="right", before=self.status_lbl)
+        def progress(done, total):
+            if done % 25 == 0 or done == total:
+                self.root.after(0, lambda: self.status_var.set(f"Fetching card details... {done}/{total}"))
+        def work():
+            try: self.card_attrs.enrich([c['id'] for c in cards], progress, self._enrich_cancel)
+            except Exception as e: logger.error(f"Card attribute fetch failed: {e}")
+            self.root.after(0, finish)
+        def finish():
+            self._enriching = False
+            self.enrich_stop_btn.pack_forget()
+            self.status_var.set("Card details stopped" if self._enrich_cancel.is_set() else "Ready")
+            if is_attribute_query(self.filter_var.get()):
+                self.display_search_data = self.search_filtered(self.filter_var.get())
+                try: per = int(self.s_rows.get()) * int(self.s_cols.get())
+                except ValueError: per = 9
+                self.search_page = max(1, min(self.search_page, (len(self.display_search_data) + per - 1) // per))
+                self.refresh_view(target="search")
+            if is_attribute_query(self.binder_filter_var.get()): self.apply_binder_filter(reset_page=False)
+        threading.Thread(target=work, daemon=True).start()
+
+    def stop_enrich(self):
+        """Stops the card detail fetch; it does not restart for the same cards until they change."""
+        if self._enrich_key is not None: self._enrich_stopped.add(self._enrich_key)
+        self._enrich_cancel.set()
+
     def apply_binder_filter(self, reset_page=False):
-        q = self.binder_filter_var.get().lower().strip()
+        q = self.binder_filter_var.get()
         
-        if not q:
-            self.display_owned_cards = self.owned_cards.copy()
+        if not q.strip():
+            self.display_owned_cards = self.owned_cards
         else:
-            # Check if filtering by number (starts with # or is digit)
-            is_num_search = q.startswith('#') or q.isdigit()
-            
-            # Normalize search term: remove '#' and leading zeros (e.g. "#023" -> "23")
-            search_num = q.lstrip('#').lstrip('0') if is_num_search else ""
-            if is_num_search and search_num == "": search_num = "0" # Handle searching for "0"
-
-            filtered = []
-            for c in self.owned_cards:
-                if is_num_search:
-                    # Normalize card number: remove leading zeros
-                    c_num = str(c.get('card_number', '')).lstrip('0')
-                    if not c_num: c_num = "0"
-                    
-                    # Exact match on normalized number
-                    if c_num == search_num:
-                        filtered.append(c)
-                else:
-                    # Standard name search
-                    if q in c['name'].lower():
-                        filtered.append(c)
-            self.display_owned_cards = filtered
+            # Matches are shown packed from slot 0
+            self.display_owned_cards = Binder(enumerate(self.binder_filtered(q)))
 
         if reset_page: self.binder_page = 1; self.jump_binder_var.set("1")
         self.refresh_view(target="binder")
@@ -1553,19 +2292,26 @@ del "%~f0" & exit
 
     def update_progress(self):
         if self.current_set_name:
-            o = len([c for c in self.owned_cards if c.get('set_name') == self.current_set_name]); t = len(self.full_set_data)
-            pct = (o/t)*100 if t else 0
-            text = f"{self.current_set_name}: {o}/{t} ({pct:.1f}%)" if t else "No data"
+            if self.search_source and self.search_source.get("kind") == "sets":
+                # Several sets loaded: overall count, then one counter per set
+                owned = self.collection.owned_by_set(self.current_binder_name)
+                totals = Counter(c.get('set_name') for c in self.full_set_data)
+                o = sum(owned[n] for n in totals); t = len(self.full_set_data)
+                pct = (o/t)*100 if t else 0
+                text = f"{self.current_set_name}: {o}/{t} ({pct:.1f}%) | " + " | ".join(f"{n}: {owned[n]}/{c}" for n, c in totals.items()) if t else "No data"
+            else:
+                o = self.collection.owned_in_set(self.current_binder_name, self.current_set_name); t = len(self.full_set_data)
+                pct = (o/t)*100 if t else 0
+                text = f"{self.current_set_name}: {o}/{t} ({pct:.1f}%)" if t else "No data"
             
             # Dynamic color coding
             if hasattr(self, 'progress_label'):
-                t_theme = self.themes["lunar" if self.dark_mode.get() else "solar"]
-                if pct == 100: col = t_theme["prog_100"]
-                elif pct >= 75: col = t_theme["prog_75"]
-                elif pct >= 50: col = t_theme["prog_50"]
-                elif pct >= 25: col = t_theme["prog_25"]
-                else: col = t_theme["prog_0"]
-                self.progress_label.config(fg=col)
+                if pct == 100: col = "prog_100"
+                elif pct >= 75: col = "prog_75"
+                elif pct >= 50: col = "prog_50"
+                elif pct >= 25: col = "prog_25"
+                else: col = "prog_0"
+                self.theme.style(self.progress_label, fg=col)
 
             # Only restart ticker if text changes
             if self.progress_text.get() != text:
@@ -1578,4 +2324,5 @@ if __name__ == "__main__":
         app = TCGApp(root)
         root.mainloop()
     except Exception as e:
+        logconfig.setup(LOG_FILE)
         logger.critical(f"Application crashed: {e}", exc_info=True)
\ No newline at end of file
@@ -0,0 +1,59 @@
+import os, time, shutil, tempfile, threading, unittest
+
+from pokebinder.attributes import AttributeIndex, CardAttributes
+
+def record(url):
+    cid = url.rsplit("/", 1)[1]
+    n = int(cid.split("-")[1])
+    return {"rarity": "Rare" if n % 2 else "Common", "types": ["Fire"], "hp": 10 * n, "stage": "Basic"}
+
+class CardAttributesTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "attrs.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_enrich_is_rate_limited_and_saved(self):
+        attrs = CardAttributes(self.path, fetch_json=record, workers=4, rate=50)
+        seen = []
+        start = time.monotonic()
+        self.assertEqual(attrs.enrich([f"sv1-{i}" for i in range(20)] + ["sv1-3"], lambda d, t: seen.append((d, t))), 20)
+        self.assertGreaterEqual(time.monotonic() - start, 19 / 50 - 0.05)
+        self.assertEqual(seen[-1], (20, 20))
+        again = CardAttributes(self.path, fetch_json=record)
+        self.assertEqual(again.get("sv1-4")["hp"], 40)
+        self.assertEqual(again.missing(["sv1-4", "sv1-99"]), ["sv1-99"])
+
+    def test_cancel_stops_after_requests_in_flight(self):
+        cancel = threading.Event()
+        attrs = CardAttributes(self.path, fetch_json=record, workers=2, rate=100)
+        def progress(done, total):
+            if done == 5: cancel.set()
+        added = attrs.enrich([f"sv1-{i}" for i in range(100)], progress, cancel)
+        self.assertLess(added, 10)
+        self.assertEqual(len(attrs.missing(f"sv1-{i}" for i in range(100))), 100 - added)
+
+    def test_failures_are_not_retried(self):
+        def flaky(url):
+            if url.endswith("-2"): raise ConnectionError(url)
+            return record(url)
+        attrs = CardAttributes(self.path, fetch_json=flaky, rate=0)
+        with self.assertLogs("pokebinder.attributes", "WARNING"):
+            self.assertEqual(attrs.enrich(["sv1-1", "sv1-2", "sv1-3"]), 2)
+        self.assertEqual(attrs.missing(["sv1-1", "sv1-2"]), [])
+
+class AttributeIndexTest(unittest.TestCase):
+    def test_compound_filter(self):
+        tmp = tempfile.mkdtemp(); self.addCleanup(shutil.rmtree, tmp)
+        attrs = CardAttributes(os.path.join(tmp, "attrs.json"), fetch_json=record, rate=0)
+        cards = [{"id": f"sv1-{i}", "name": f"Charmander {i}", "set_name": "SV"} for i in range(1, 11)]
+        with self.assertLogs("pokebinder.attributes", "INFO"): attrs.enrich([c['id'] for c in cards[:8]])
+        index = AttributeIndex(cards, attrs)
+        self.assertEqual([c['id'] for c in index.filter("rarity:rare hp>=50")], ["sv1-5", "sv1-7"])
+        self.assertEqual(len(index.filter("-rarity=rare")), 4) # cards without attributes match no attribute term
+        self.assertEqual([c['id'] for c in index.filter("missing set:sv", owned_ids={"sv1-1"})][:2], ["sv1-2", "sv1-3"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+
+from pokebinder.model import Binder
+
+def card(cid, name="Pikachu"):
+    return Binder.new_instance({"id": cid, "name": name, "image": f"https://img/{cid}/low.jpg"})
+
+class BinderTest(unittest.TestCase):
+    def test_first_free_skips_full_pages(self):
+        b = Binder(per_page=4)
+        for i in range(6): b.place_free(card(f"sv1-{i}"))
+        self.assertEqual(b.first_free(), 6)
+        self.assertIsNone(b.first_free_on_page(0))
+        self.assertEqual(b.first_free_on_page(1), 6)
+        self.assertEqual(b.first_free_on_page(3), 12)
+
+    def test_freed_slot_is_reused(self):
+        b = Binder(per_page=4)
+        placed = [b.place_free(card(f"sv1-{i}")) for i in range(8)]
+        b.pop(placed[1])
+        self.assertEqual(b.first_free(), 1)
+        self.assertEqual(b.first_free_on_page(1), None)
+
+    def test_page_size_change_rebuilds_bitmaps(self):
+        b = Binder({0: card("a-1"), 1: card("a-2"), 2: card("a-3")}, per_page=3)
+        self.assertIsNone(b.first_free_on_page(0))
+        b.set_page_size(9)
+        self.assertEqual(b.first_free_on_page(0), 3)
+
+    def test_copies_keep_distinct_uids(self):
+        b = Binder()
+        first, second = card("sv1-1"), card("sv1-1")
+        b.place(0, first); b.place(5, second)
+        self.assertNotEqual(first['uid'], second['uid'])
+        self.assertEqual(b.index_of(second['uid']), 5)
+        self.assertIs(b.pop_instance(first['uid']), first)
+        self.assertEqual(len(b), 1)
+        self.assertIsNone(b.index_of(first['uid']))
+
+    def test_placing_an_instance_moves_it(self):
+        b = Binder()
+        c = card("sv1-1")
+        b.place(0, c); b.place(7, c)
+        self.assertEqual(b.items(), [(7, c)])
+        self.assertEqual(b.extent, 8)
+
+    def test_swap_updates_positions(self):
+        b = Binder()
+        x, y = card("sv1-1"), card("sv1-2")
+        b.place(0, x); b.place(3, y)
+        b.swap(0, 3)
+        self.assertEqual((b.index_of(x['uid']), b.index_of(y['uid'])), (3, 0))
+        b.swap(3, 8) # onto an empty slot
+        self.assertEqual(b.index_of(x['uid']), 8)
+        self.assertIsNone(b.get(3))
+
+    def test_duplicate_uids_are_reassigned_on_load(self):
+        shared = {"id": "sv1-1", "name": "Pikachu", "uid": "same"}
+        b = Binder.from_json({"slots": {"0": dict(shared), "4": dict(shared)}})
+        uids = {c['uid'] for c in b}
+        self.assertEqual(len(uids), 2)
+        for idx, c in b.items(): self.assertEqual(b.index_of(c['uid']), idx)
+
+    def test_legacy_list_format(self):
+        b = Binder.from_json([{"id": "sv1-1", "name": "A"}, {"id": "empty"}, {"id": "sv1-3", "name": "C"}])
+        self.assertEqual([idx for idx, _ in b.items()], [0, 2])
+        self.assertEqual(b.first_free(), 1)
+
+    def test_compact_keeps_order_and_closes_gaps(self):
+        b = Binder(per_page=4)
+        cards = [card(f"sv1-{i}") for i in range(3)]
+        for idx, c in zip((2, 5, 11), cards): b.place(idx, c)
+        b.compact()
+        self.assertEqual(b.items(), list(enumerate(cards)))
+        self.assertEqual(b.extent, 3)
+        self.assertEqual(b.first_free(), 3)
+        for idx, c in enumerate(cards): self.assertEqual(b.index_of(c['uid']), idx)
+
+    def test_extent_shrinks_when_last_slot_empties(self):
+        b = Binder()
+        b.place(2, card("sv1-1")); last = card("sv1-2"); b.place(9, last)
+        b.pop_instance(last['uid'])
+        self.assertEqual(b.extent, 3)
+
+    def test_iteration_order_follows_mutations(self):
+        b = Binder()
+        cards = {idx: card(f"sv1-{idx}") for idx in (7, 2, 11)}
+        for idx, c in cards.items(): b.place(idx, c)
+        self.assertEqual([i for i, _ in b.items()], [2, 7, 11])
+        b.place(0, card("sv1-0")); b.pop(7)
+        self.assertEqual([c['id'] for c in b], ["sv1-0", "sv1-2", "sv1-11"])
+        b.swap(0, 20)
+        self.assertEqual([i for i, _ in b.items()], [2, 11, 20])
+        self.assertEqual(sorted(c['id'] for c in b.values()), sorted(c['id'] for c in b))
+        b.compact()
+        self.assertEqual([i for i, _ in b.items()], [0, 1, 2])
+        b.clear(); b.place(3, card("sv1-3"))
+        self.assertEqual([i for i, _ in b.items()], [3])
+
+    def test_round_trip(self):
+        b = Binder(per_page=4)
+        b.place(6, card("sv1-1"))
+        again = Binder.from_json(b.to_json(), per_page=4)
+        self.assertEqual(again.items(), b.items())
+        self.assertEqual(again.first_free_on_page(1), 4)
+
+if __name__ == "__main__":
+    unittest.main()
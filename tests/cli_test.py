@@ -0,0 +1,62 @@
+import io, os, json, shutil, tempfile, unittest
+from contextlib import redirect_stdout
+
+from pokebinder import cli, storage
+from pokebinder.model import Binder
+
+class CliTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.data = os.path.join(self.dir, "data.json")
+        user = storage.new_user_data("pw")
+        b = user["binders"]["Main Binder"]
+        for idx, (cid, name) in zip((4, 1, 7), [("sv1-3", "Charmander"), ("sv1-10", "Bulbasaur"), ("sv1-2", "Squirtle")]):
+            b.place(idx, Binder.new_instance({"id": cid, "name": name, "image": f"https://img/{cid}/low.jpg", "set_name": "SV"}))
+        storage.save_data({"Ash": user}, self.data)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def run_cli(self, *argv):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = cli.main(["--data", self.data, "--user", "Ash", "--password", "pw", *argv])
+        self.assertEqual(code, 0)
+        return out.getvalue()
+
+    def binder(self):
+        return storage.load_data(self.data)["Ash"]["binders"]["Main Binder"]
+
+    def test_wrong_password_exits(self):
+        with self.assertRaises(SystemExit):
+            cli.main(["--data", self.data, "--user", "Ash", "--password", "nope", "report"])
+
+    def test_report_json(self):
+        rows = json.loads(self.run_cli("report", "--json"))
+        self.assertEqual(rows[0]["binder"], "Main Binder")
+        self.assertEqual(rows[0]["cards"], 3)
+
+    def test_sort_by_number_repacks(self):
+        self.run_cli("sort", "--by", "number")
+        self.assertEqual([(idx, c['id']) for idx, c in self.binder().items()], [(0, "sv1-2"), (1, "sv1-3"), (2, "sv1-10")])
+
+    def test_compact_saves(self):
+        self.assertIn("Compacted Main Binder", self.run_cli("compact"))
+        self.assertEqual([idx for idx, _ in self.binder().items()], [0, 1, 2])
+
+    def test_locate(self):
+        out = self.run_cli("locate", "squir")
+        self.assertEqual(out.split("\t")[:3], ["Main Binder", "page 1", "slot 8"])
+
+    def test_export_then_import(self):
+        path = os.path.join(self.dir, "out.csv")
+        self.assertIn("Exported 3 cards", self.run_cli("export", path))
+        self.assertIn("Imported 3 cards", self.run_cli("import", path))
+        self.assertEqual(len(self.binder()), 6)
+
+    def test_unknown_binder_exits(self):
+        with self.assertRaises(SystemExit):
+            self.run_cli("compact", "--binder", "Nope")
+
+if __name__ == "__main__":
+    unittest.main()
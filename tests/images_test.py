@@ -0,0 +1,46 @@
+import io, os, shutil, tempfile, unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from PIL import Image
+
+from pokebinder.images import ImageCache
+
+def jpeg():
+    buf = io.BytesIO(); Image.new("RGB", (24, 34), "red").save(buf, "JPEG")
+    return buf.getvalue()
+
+CARD = {"id": "sv1-1", "image": "https://img/sv1/1/low.jpg"}
+
+class ImageCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.cache = ImageCache(self.dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_concurrent_downloads_leave_one_complete_file(self):
+        data = jpeg()
+        with mock.patch("pokebinder.catalog.fetch_image", return_value=data):
+            with ThreadPoolExecutor(8) as pool: paths = list(pool.map(lambda _: self.cache.ensure_file(CARD), range(16)))
+        self.assertEqual(set(paths), {self.cache.path(CARD)})
+        self.assertEqual(os.listdir(self.dir), ["sv1-1.jpg"])
+        with open(paths[0], "rb") as f: self.assertEqual(f.read(), data)
+
+    def test_failed_download_leaves_nothing(self):
+        with mock.patch("pokebinder.catalog.fetch_image", side_effect=ConnectionError("reset")), \
+             self.assertLogs("pokebinder.images", "ERROR"):
+            self.assertIsNone(self.cache.ensure_file(CARD))
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_truncated_file_is_fetched_again(self):
+        with open(self.cache.path(CARD), "wb") as f: f.write(jpeg()[:40])
+        with self.assertLogs("pokebinder.images", "ERROR"):
+            self.assertIsNone(self.cache.decoded(CARD))
+        self.assertFalse(os.path.exists(self.cache.path(CARD)))
+        with mock.patch("pokebinder.catalog.fetch_image", return_value=jpeg()):
+            self.assertEqual(self.cache.decoded(CARD).size, (24, 34))
+
+if __name__ == "__main__":
+    unittest.main()
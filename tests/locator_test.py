@@ -0,0 +1,56 @@
+import os, random, shutil, tempfile, unittest
+
+from pokebinder.collection import Collection
+from pokebinder.model import CardLocator
+
+def card(cid, name):
+    return {"id": cid, "name": name, "image": f"https://img/{cid}/low.jpg"}
+
+class LocatorTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.coll = Collection(os.path.join(self.dir, "data.json"), data={})
+        self.coll.ensure_user(); self.coll.login(self.coll.user)
+        self.coll.create_binder("Trade")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def index_state(self, locator):
+        return locator.by_id, locator.by_id_key, locator.by_token, locator.by_number, locator.slots
+
+    def test_id_lookup_keeps_case(self):
+        self.coll.add_cards("Main Binder", [card("swsh12.5-GG01", "Lucario VSTAR")])
+        for q in ("swsh12.5-GG01", "swsh12.5-gg01", " SWSH12.5-GG01 "):
+            hits = self.coll.locator.lookup(q)
+            self.assertEqual([(b, idx) for b, idx, _ in hits], [("Main Binder", 0)], q)
+
+    def test_incremental_updates_match_a_rebuild(self):
+        rng = random.Random(7)
+        pool = [card(f"sv{i % 3}-{i}", f"Mon {i % 5} Ex") for i in range(30)]
+        for step in range(300):
+            name = rng.choice(self.coll.binder_names())
+            binder = self.coll.binder(name)
+            uids = [c['uid'] for c in binder]
+            op = rng.randrange(6)
+            if op == 0 or not uids: self.coll.add_cards(name, rng.sample(pool, 3))
+            elif op == 1: self.coll.place_card(name, rng.randrange(40), rng.choice(pool))
+            elif op == 2: self.coll.move_card(name, rng.choice(uids), rng.randrange(40))
+            elif op == 3: self.coll.remove_cards(name, rng.sample(uids, min(2, len(uids))))
+            elif op == 4: self.coll.move_to_binder(name, uids[:2], "Trade" if name != "Trade" else "Main Binder")
+            else: self.coll.move_to_page(name, uids[-3:], rng.randrange(1, 4))
+            if step % 50 == 49: self.coll.compact(name)
+        fresh = CardLocator(); fresh.rebuild(self.coll.user_data["binders"])
+        self.assertEqual(self.index_state(self.coll.locator), self.index_state(fresh))
+
+    def test_single_move_touches_two_slots(self):
+        self.coll.add_cards("Main Binder", [card(f"sv1-{i}", "Pikachu") for i in range(20)])
+        binder = self.coll.binder("Main Binder")
+        binder.swap(3, 25)
+        self.assertEqual(binder.take_changes(), {3, 25})
+        self.assertEqual(binder.take_changes(), set())
+        binder.compact()
+        self.assertIsNone(binder.take_changes())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import queue, logging, unittest
+from decimal import Decimal
+
+from pokebinder.logconfig import LazyQueueHandler
+
+class LazyQueueHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self.q = queue.SimpleQueue()
+        self.logger = logging.getLogger("pokebinder.test.lazy")
+        self.logger.propagate = False; self.logger.setLevel(logging.DEBUG)
+        self.handler = LazyQueueHandler(self.q)
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def logged(self):
+        return self.q.get_nowait().getMessage()
+
+    def test_mutable_args_are_captured_when_logged(self):
+        cards = [{"id": "sv1-1"}]
+        self.logger.info("placing %s (%d cards)", cards, len(cards))
+        cards.append({"id": "sv1-2"}); cards[0]["id"] = "changed"
+        self.assertEqual(self.logged(), "placing [{'id': 'sv1-1'}] (1 cards)")
+
+    def test_formatting_matches_the_stock_handler(self):
+        err = ConnectionError("reset")
+        self.logger.warning("%s / %r / %.1f / %d%%", err, err, Decimal("2.25"), 5)
+        self.assertEqual(self.logged(), "reset / ConnectionError('reset') / 2.2 / 5%")
+        self.logger.info("%(n)d in %(binder)s", {"n": 3, "binder": ["Main"]})
+        self.assertEqual(self.logged(), "3 in ['Main']")
+
+    def test_scalars_are_passed_through(self):
+        self.logger.debug("slot %d of %s", 4, "Main Binder")
+        record = self.q.get_nowait()
+        self.assertEqual(record.args, (4, "Main Binder"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import os, shutil, tempfile, unittest
+
+from pokebinder.session import Session
+
+class SessionTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "session.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_theme_is_saved_without_a_profile(self):
+        s = Session(self.path)
+        self.assertIsNone(s.dark_mode)
+        self.assertTrue(s.set_dark_mode(False))
+        self.assertFalse(s.set_dark_mode(False))
+        s.save()
+        again = Session(self.path)
+        self.assertIs(again.dark_mode, False)
+        self.assertIsNone(again.last_user)
+
+    def test_profile_state_round_trip(self):
+        s = Session(self.path)
+        self.assertTrue(s.update("Ash", {"binder": "Main Binder", "binder_page": 3}))
+        self.assertFalse(s.update("Ash", {"binder": "Main Binder", "binder_page": 3}))
+        s.set_dark_mode(True); s.save()
+        again = Session(self.path)
+        self.assertEqual((again.last_user, again.get("Ash")["binder_page"], again.dark_mode), ("Ash", 3, True))
+
+if __name__ == "__main__":
+    unittest.main()
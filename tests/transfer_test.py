@@ -0,0 +1,67 @@
+import os, json, shutil, tempfile, unittest
+
+from pokebinder import transfer
+from pokebinder.catalog import CatalogResolver
+from pokebinder.model import Binder
+
+SET = {"name": "Scarlet & Violet", "cards": [{"id": f"sv1-{i}", "name": f"Card {i}", "image": f"https://img/sv1/{i}"} for i in range(1, 6)]}
+
+class TransferTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.requests = []
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def fetch_json(self, url):
+        self.requests.append(url)
+        if url.endswith("/sets/sv1"): return SET
+        raise ConnectionError(url)
+
+    def write(self, name, text):
+        path = os.path.join(self.dir, name)
+        with open(path, "w", encoding="utf-8") as f: f.write(text)
+        return path
+
+    def test_csv_resolves_ids_by_set(self):
+        path = self.write("in.csv", "id,quantity\nsv1-1,2\nsv1-3,\nxx1-1,1\n")
+        b = Binder()
+        with self.assertLogs("pokebinder.catalog", "ERROR"): # xx1 is not a set
+            imported, skipped = transfer.import_collection(path, b, CatalogResolver(self.fetch_json))
+        self.assertEqual((imported, skipped), (3, 1))
+        self.assertEqual([c['id'] for c in b], ["sv1-1", "sv1-1", "sv1-3"])
+        self.assertEqual(b.get(2)['set_name'], "Scarlet & Violet")
+        self.assertEqual(len([u for u in self.requests if u.endswith("/sets/sv1")]), 1)
+
+    def test_positions_are_range_checked(self):
+        rows = [{"id": "sv1-1", "page": 0, "slot": 1}, {"id": "sv1-2", "page": 1, "slot": 0},
+                {"id": "sv1-3", "page": 1, "slot": 10}, {"id": "sv1-4", "page": 2, "slot": 9},
+                {"id": "sv1-5", "page": "x", "slot": 1}]
+        path = self.write("in.jsonl", "\n".join(json.dumps(r) for r in rows) + "\n")
+        stats = {}
+        staged = list(transfer.read_collection(path, CatalogResolver(self.fetch_json), 9, stats))
+        self.assertEqual([idx for _, idx in staged], [None, None, None, 17, None])
+        self.assertEqual(stats, {"skipped": 0, "adjusted": 4})
+
+    def test_requested_slot_taken_falls_back_to_free_slot(self):
+        b = Binder()
+        b.place(0, Binder.new_instance(SET["cards"][0]))
+        card = {"id": "sv1-2", "name": "Card 2", "image": "x"}
+        self.assertEqual(transfer.place_imported(b, [(card, 0), (card, 4)]), 2)
+        self.assertEqual([idx for idx, _ in b.items()], [0, 1, 4])
+
+    def test_export_round_trip(self):
+        b = Binder(per_page=4)
+        for idx, c in zip((0, 5), SET["cards"]): b.place(idx, Binder.new_instance(dict(c, set_name="SV")))
+        for ext in ("csv", "jsonl"):
+            path = os.path.join(self.dir, f"out.{ext}")
+            self.assertEqual(transfer.export_collection(b, path), 2)
+            again = Binder(per_page=4)
+            imported, _ = transfer.import_collection(path, again, CatalogResolver(self.fetch_json))
+            self.assertEqual(imported, 2)
+            self.assertEqual([(idx, c['id']) for idx, c in again.items()], [(0, "sv1-1"), (5, "sv1-2")])
+        self.assertEqual(self.requests, []) # exported rows carry name and image
+
+if __name__ == "__main__":
+    unittest.main()